@@ -1,81 +1,269 @@
-# ------ fsd_checker/__main__.py ------
-#!/usr/bin/env python
-"""
-Command-line interface for the FSD Architecture Checker.
-
-This module provides a unified CLI for all FSD architecture checking functionality.
-"""
-
-import argparse
-import sys
-from typing import List
-
-def main(args: List[str] = None) -> int:
-    """Main CLI entry point for the FSD Checker."""
-    parser = argparse.ArgumentParser(
-        description="FSD Architecture Checker - Validate Feature-Sliced Design compliance"
-    )
-
-    subparsers = parser.add_subparsers(dest='command', help='Command to run')
-
-    # Check command
-    check_parser = subparsers.add_parser('check', help='Check FSD architecture compliance')
-    check_parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
-    check_parser.add_argument("--json-output", default="fsd_report.json", help="JSON report output path")
-    check_parser.add_argument("--md-output", default="fsd_report.md", help="Markdown report output path")
-    check_parser.add_argument("--quiet", action="store_true", help="Suppress console output")
-
-    # Generate command
-    gen_parser = subparsers.add_parser('generate', help='Generate FSD boundary rules')
-    gen_parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
-    gen_parser.add_argument("--output", default="fsd_boundaries.json", help="Output JSON file path")
-
-    # Process command
-    process_parser = subparsers.add_parser('process', help='Process and analyze FSD reports')
-    process_parser.add_argument("input_file", help="Input JSON report file")
-    process_parser.add_argument("--output-json", help="Filtered JSON report output path")
-    process_parser.add_argument("--output-md", help="Markdown report output path")
-    process_parser.add_argument("--from-layers", nargs="+", help="Filter violations from these layers")
-    process_parser.add_argument("--to-layers", nargs="+", help="Filter violations to these layers")
-    process_parser.add_argument("--summary", action="store_true", help="Print report summary")
-
-    args = parser.parse_args(args)
-
-    if args.command == 'check':
-        from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
-        return check_main([
-            "--base-dir", args.base_dir,
-            "--json-output", args.json_output,
-            "--md-output", args.md_output,
-            *(["--quiet"] if args.quiet else [])
-        ])
-
-    elif args.command == 'generate':
-        from fsd_checker.scripts.generate_boundaries import main as gen_main
-        return gen_main([
-            "--base-dir", args.base_dir,
-            "--output", args.output
-        ])
-
-    elif args.command == 'process':
-        from fsd_checker.scripts.moderators.moderate_fsd_report import main as process_main
-        cmd_args = [args.input_file]
-        if args.output_json:
-            cmd_args.extend(["--output-json", args.output_json])
-        if args.output_md:
-            cmd_args.extend(["--output-md", args.output_md])
-        if args.from_layers:
-            cmd_args.extend(["--from-layers"] + args.from_layers)
-        if args.to_layers:
-            cmd_args.extend(["--to-layers"] + args.to_layers)
-        if args.summary:
-            cmd_args.append("--summary")
-        return process_main(cmd_args)
-
-    else:
-        parser.print_help()
-        return 1
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+# ------ fsd_checker/__main__.py ------
+#!/usr/bin/env python
+"""
+Command-line interface for the FSD Architecture Checker.
+
+This module provides a unified CLI for all FSD architecture checking functionality.
+"""
+
+import argparse
+import sys
+from typing import List
+
+from fsd_checker.scripts.options import (add_read_arguments, add_rule_arguments, forward_read_arguments,
+                                         forward_rule_arguments)
+
+
+def main(args: List[str] = None) -> int:
+    """Main CLI entry point for the FSD Checker."""
+    parser = argparse.ArgumentParser(
+        description="FSD Architecture Checker - Validate Feature-Sliced Design compliance"
+    )
+
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+
+    # Check command
+    check_parser = subparsers.add_parser('check', help='Check FSD architecture compliance')
+    check_parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    check_parser.add_argument("--json-output", default="fsd_report.json", help="JSON report output path")
+    check_parser.add_argument("--md-output", default="fsd_report.md", help="Markdown report output path")
+    check_parser.add_argument("--quiet", action="store_true", help="Suppress console output")
+    add_read_arguments(check_parser)
+    check_parser.add_argument("--files-from-git", action="store_true", help="Enumerate files with git ls-files instead of walking the tree")
+    check_parser.add_argument("--changed-since", metavar="REF", help="Only report files changed since REF and the files importing them")
+    check_parser.add_argument("--staged", action="store_true", help="Only report staged files, checking their content in the git index")
+    check_parser.add_argument("--graph-output", help="Also save the module dependency graph to this binary file")
+    check_parser.add_argument("--jsonl-output", help="Stream violations to this JSON Lines file (gzip if it ends in .gz) instead of writing the JSON and markdown reports")
+    check_parser.add_argument("--compact-json", action="store_true", help="Write the JSON report without indentation")
+    check_parser.add_argument("--skip-graph-checks", action="store_true", help="Skip the cycle, lazy-boundary, asset and stylesheet checks")
+    add_rule_arguments(check_parser)
+    check_parser.add_argument("--update-baseline", action="store_true", help="Rewrite the baseline to accept every current violation")
+    check_parser.add_argument("--db-output", help="Also save the report to this SQLite store for the query command")
+    check_parser.add_argument("--shard", metavar="I/N", help="Only check the I-th of N shards of the files and write a partial report for merge")
+    check_parser.add_argument("--shard-balance", choices=["hash", "size"], default="hash", help="Assign files to shards by path hash or balance their total size")
+    check_parser.add_argument("--profile", action="store_true", help="Time every phase, print the slowest files and write a Chrome trace")
+    check_parser.add_argument("--profile-top", type=int, default=10, help="Number of slowest files to print with --profile")
+    check_parser.add_argument("--profile-trace", default="fsd_profile.json", help="Chrome trace-event output path of --profile")
+
+    # Merge command
+    merge_parser = subparsers.add_parser('merge', help='Merge the partial reports of a sharded check')
+    merge_parser.add_argument("reports", nargs="+", help="JSON reports written by check --shard I/N")
+    merge_parser.add_argument("--json-output", default="fsd_report.json", help="JSON report output path")
+    merge_parser.add_argument("--md-output", default="fsd_report.md", help="Markdown report output path")
+    merge_parser.add_argument("--compact-json", action="store_true", help="Write the JSON report without indentation")
+    merge_parser.add_argument("--quiet", action="store_true", help="Suppress console output")
+
+    # Generate command
+    gen_parser = subparsers.add_parser('generate', help='Generate FSD boundary rules')
+    gen_parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    gen_parser.add_argument("--output", default="fsd_boundaries.json", help="Output JSON file path")
+
+    # Process command
+    process_parser = subparsers.add_parser('process', help='Process and analyze FSD reports')
+    process_parser.add_argument("input_file", help="Input JSON report file, or a streamed JSON Lines report")
+    process_parser.add_argument("--output-json", help="Filtered JSON report output path")
+    process_parser.add_argument("--output-md", help="Markdown report output path")
+    process_parser.add_argument("--output-db", help="Save the (filtered) report to this SQLite store for the query command")
+    process_parser.add_argument("--from-layers", nargs="+", help="Filter violations from these layers")
+    process_parser.add_argument("--to-layers", nargs="+", help="Filter violations to these layers")
+    process_parser.add_argument("--summary", action="store_true", help="Print report summary")
+
+    # Serve command
+    serve_parser = subparsers.add_parser('serve', help='Run a daemon that answers checks over a Unix socket')
+    serve_parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    serve_parser.add_argument("--socket", help="Unix socket path to listen on")
+    serve_parser.add_argument("--poll-interval", type=float, help="Seconds between mtime polls")
+    add_read_arguments(serve_parser)
+    add_rule_arguments(serve_parser)
+
+    # Barrels command
+    barrels_parser = subparsers.add_parser('barrels', help='Rank barrel (index) files by their cost to importers')
+    barrels_parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    barrels_parser.add_argument("--limit", type=int, default=20, help="Number of barrels listed")
+    barrels_parser.add_argument("--importers", type=int, default=3, help="Worst importers listed per barrel")
+    barrels_parser.add_argument("--json", action="store_true", help="Print the full result as JSON")
+    add_read_arguments(barrels_parser)
+
+    unused_parser = subparsers.add_parser('unused', help='List modules unreachable from the entry points')
+    unused_parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    unused_parser.add_argument("--entry", action="append", help="Entry point file, repeatable (default: app/main.tsx in --base-dir)")
+    unused_parser.add_argument("--entry-glob", action="append", help="Glob of files that are entry points too (default: lazy wrappers, stories and tests)")
+    unused_parser.add_argument("--limit", type=int, default=50, help="Number of unused files listed")
+    unused_parser.add_argument("--json", action="store_true", help="Print the full result as JSON")
+    add_read_arguments(unused_parser)
+
+    # Query command
+    query_parser = subparsers.add_parser('query', help='Query a saved SQLite report store')
+    query_parser.add_argument("db_file", help="SQLite report store")
+    query_parser.add_argument("--from-layers", nargs="+", help="Only violations from these layers")
+    query_parser.add_argument("--to-layers", nargs="+", help="Only violations to these layers")
+    query_parser.add_argument("--slices", nargs="+", help="Only violations in these slices (e.g. features/auth)")
+    query_parser.add_argument("--files", nargs="+", metavar="GLOB", help="Only violations in files matching these globs (case-sensitive, * also matches /)")
+    query_parser.add_argument("--group-by", nargs="+", choices=["from_layer", "to_layer", "file", "slice"], help="Count violations per group")
+    query_parser.add_argument("--limit", type=int, default=20, help="Number of violations or groups listed")
+    query_parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    query_parser.add_argument("--console", action="store_true", help="Print the matching violations as a console report")
+    query_parser.add_argument("--output-md", help="Write the matching violations as a markdown report")
+
+    # Graph command
+    graph_parser = subparsers.add_parser('graph', help='Query the module dependency graph')
+    graph_parser.add_argument("query", choices=["dependents", "dependencies", "impact", "fan", "stats"], help="Query to run")
+    graph_parser.add_argument("target", nargs="?", help="File or slice (e.g. features/auth) to query")
+    graph_parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    graph_parser.add_argument("--graph-file", help="Binary graph file to load or create (default: .fsd-cache/graph.bin, or .fsd-cache/graph-runtime.bin with --runtime-only)")
+    graph_parser.add_argument("--runtime-only", action="store_true", help="Query the graph without type-only imports")
+    graph_parser.add_argument("--rebuild", action="store_true", help="Rebuild the graph from the sources")
+    graph_parser.add_argument("--limit", type=int, default=20, help="Number of files listed by a fan query without target")
+    graph_parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    add_read_arguments(graph_parser)
+
+    # Client command
+    client_parser = subparsers.add_parser('client', help='Query a running FSD Checker daemon')
+    client_parser.add_argument("files", nargs="*", help="Only check these files (full report if omitted)")
+    client_parser.add_argument("--socket", help="Unix socket path of the daemon")
+    client_parser.add_argument("--json-output", help="JSON report output path")
+    client_parser.add_argument("--md-output", help="Markdown report output path")
+    client_parser.add_argument("--quiet", action="store_true", help="Suppress console output")
+    client_parser.add_argument("--shutdown", action="store_true", help="Stop the daemon")
+
+    args = parser.parse_args(args)
+
+    if args.command == 'check':
+        from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
+        return check_main([
+            "--base-dir", args.base_dir,
+            "--json-output", args.json_output,
+            "--md-output", args.md_output,
+            *(["--quiet"] if args.quiet else []),
+            *forward_read_arguments(args),
+            *(["--files-from-git"] if args.files_from_git else []),
+            *(["--changed-since", args.changed_since] if args.changed_since else []),
+            *(["--staged"] if args.staged else []),
+            *(["--graph-output", args.graph_output] if args.graph_output else []),
+            *(["--jsonl-output", args.jsonl_output] if args.jsonl_output else []),
+            *(["--compact-json"] if args.compact_json else []),
+            *(["--skip-graph-checks"] if args.skip_graph_checks else []),
+            *forward_rule_arguments(args),
+            *(["--update-baseline"] if args.update_baseline else []),
+            *(["--db-output", args.db_output] if args.db_output else []),
+            *(["--shard", args.shard] if args.shard else []),
+            "--shard-balance", args.shard_balance,
+            *(["--profile"] if args.profile else []),
+            "--profile-top", str(args.profile_top),
+            "--profile-trace", args.profile_trace
+        ])
+
+    elif args.command == 'merge':
+        from fsd_checker.scripts.merge import main as merge_main
+        cmd_args = [*args.reports, "--json-output", args.json_output, "--md-output", args.md_output]
+        if args.compact_json:
+            cmd_args.append("--compact-json")
+        if args.quiet:
+            cmd_args.append("--quiet")
+        return merge_main(cmd_args)
+
+    elif args.command == 'generate':
+        from fsd_checker.scripts.generate_boundaries import main as gen_main
+        return gen_main([
+            "--base-dir", args.base_dir,
+            "--output", args.output
+        ])
+
+    elif args.command == 'process':
+        from fsd_checker.scripts.moderators.moderate_fsd_report import main as process_main
+        cmd_args = [args.input_file]
+        if args.output_json:
+            cmd_args.extend(["--output-json", args.output_json])
+        if args.output_md:
+            cmd_args.extend(["--output-md", args.output_md])
+        if args.output_db:
+            cmd_args.extend(["--output-db", args.output_db])
+        if args.from_layers:
+            cmd_args.extend(["--from-layers"] + args.from_layers)
+        if args.to_layers:
+            cmd_args.extend(["--to-layers"] + args.to_layers)
+        if args.summary:
+            cmd_args.append("--summary")
+        return process_main(cmd_args)
+
+    elif args.command == 'serve':
+        from fsd_checker.scripts.serve import main as serve_main
+        cmd_args = ["--base-dir", args.base_dir, *forward_read_arguments(args), *forward_rule_arguments(args)]
+        if args.socket:
+            cmd_args.extend(["--socket", args.socket])
+        if args.poll_interval:
+            cmd_args.extend(["--poll-interval", str(args.poll_interval)])
+        return serve_main(cmd_args)
+
+    elif args.command == 'graph':
+        from fsd_checker.scripts.graph import main as graph_main
+        cmd_args = [args.query]
+        if args.target:
+            cmd_args.append(args.target)
+        cmd_args.extend(["--base-dir", args.base_dir, "--limit", str(args.limit), *forward_read_arguments(args)])
+        if args.graph_file:
+            cmd_args.extend(["--graph-file", args.graph_file])
+        if args.runtime_only:
+            cmd_args.append("--runtime-only")
+        if args.rebuild:
+            cmd_args.append("--rebuild")
+        if args.json:
+            cmd_args.append("--json")
+        return graph_main(cmd_args)
+
+    elif args.command == 'barrels':
+        from fsd_checker.scripts.barrels import main as barrels_main
+        cmd_args = ["--base-dir", args.base_dir, "--limit", str(args.limit),
+                    "--importers", str(args.importers), *forward_read_arguments(args)]
+        if args.json:
+            cmd_args.append("--json")
+        return barrels_main(cmd_args)
+
+    elif args.command == 'unused':
+        from fsd_checker.scripts.unused import main as unused_main
+        cmd_args = ["--base-dir", args.base_dir, "--limit", str(args.limit), *forward_read_arguments(args)]
+        for entry in args.entry or []:
+            cmd_args.extend(["--entry", entry])
+        for pattern in args.entry_glob or []:
+            cmd_args.extend(["--entry-glob", pattern])
+        if args.json:
+            cmd_args.append("--json")
+        return unused_main(cmd_args)
+
+    elif args.command == 'query':
+        from fsd_checker.scripts.query import main as query_main
+        cmd_args = [args.db_file, "--limit", str(args.limit)]
+        for option, values in (("--from-layers", args.from_layers), ("--to-layers", args.to_layers),
+                               ("--slices", args.slices), ("--files", args.files), ("--group-by", args.group_by)):
+            if values:
+                cmd_args.extend([option] + values)
+        if args.json:
+            cmd_args.append("--json")
+        if args.console:
+            cmd_args.append("--console")
+        if args.output_md:
+            cmd_args.extend(["--output-md", args.output_md])
+        return query_main(cmd_args)
+
+    elif args.command == 'client':
+        from fsd_checker.scripts.client import main as client_main
+        cmd_args = list(args.files)
+        if args.socket:
+            cmd_args.extend(["--socket", args.socket])
+        if args.json_output:
+            cmd_args.extend(["--json-output", args.json_output])
+        if args.md_output:
+            cmd_args.extend(["--md-output", args.md_output])
+        if args.quiet:
+            cmd_args.append("--quiet")
+        if args.shutdown:
+            cmd_args.append("--shutdown")
+        return client_main(cmd_args)
+
+    else:
+        parser.print_help()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
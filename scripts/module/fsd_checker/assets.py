@@ -0,0 +1,145 @@
+"""
+Static asset weight attribution for the FSD Architecture Checker.
+
+Stylesheets, images, fonts and media imported by scripts resolve like
+any other specifier and stay in the resolved import table, and so do the
+stylesheets and files loaded by the stylesheets themselves (`@use`,
+`@import`, `url()`). This module follows each script's asset imports
+through its stylesheets and attributes the sizes of everything reached to
+the importing layers and slices. Sizes come from the stat data of the
+tree snapshot; assets outside the scanned layers are stat'ed once and
+added to it.
+
+Assets reached from more than one slice are listed as shared, and
+distinct files with identical content as duplicates. Only files of equal
+size are hashed to find the duplicates.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .cache import hash_content
+from .snapshot import ASSET_EXTENSIONS, STYLESHEET_EXTENSIONS
+
+# Entries listed in the largest and shared asset tables
+TOP_ASSETS = 20
+
+
+def _file_hash(file_path: str) -> Optional[str]:
+    try:
+        with open(file_path, 'rb') as f:
+            return hash_content(f.read())
+    except OSError:
+        return None
+
+
+class AssetAnalyzer:
+    """Attributes the assets imported by scripts to their layers and slices"""
+
+    def __init__(self,
+                 file_imports: List[Tuple[str, Optional[Tuple[List[List[Any]], Any]]]],
+                 stat: Callable[[str], Optional[os.stat_result]],
+                 slice_of: Callable[[str], Optional[str]]):
+        """
+        Args:
+            file_imports: Resolved imports of every file, as kept by FSDChecker.analyze_imports
+            stat: Stat data of a file, from the snapshot when it has it
+            slice_of: "layer/slice" (or "layer" at a layer root) a source file belongs to
+        """
+        self.file_imports = file_imports
+        self.stat = stat
+        self.slice_of = slice_of
+        self._imports: Dict[str, List[str]] = {}
+        for file_path, loaded in file_imports:
+            if loaded and not loaded[1]:
+                self._imports[file_path] = [entry[2] for entry in loaded[0]
+                                            if entry[2] and entry[2].endswith(ASSET_EXTENSIONS)]
+        self._reached: Dict[str, Set[str]] = {}
+
+    def _stylesheet_assets(self, stylesheet: str) -> Set[str]:
+        """A stylesheet and every asset it loads, directly or through other stylesheets (memoized)"""
+        assets = self._reached.get(stylesheet)
+        if assets is None:
+            assets = {stylesheet}
+            stack = [stylesheet]
+            while stack:
+                for asset in self._imports.get(stack.pop(), ()):
+                    if asset not in assets:
+                        assets.add(asset)
+                        if asset.endswith(STYLESHEET_EXTENSIONS):
+                            stack.append(asset)
+            self._reached[stylesheet] = assets
+        return assets
+
+    def _size(self, file_path: str) -> int:
+        stat = self.stat(file_path)
+        return stat.st_size if stat else 0
+
+    def analyze(self) -> Dict[str, Any]:
+        """
+        Attribute every imported asset to the slices importing it.
+
+        Returns:
+            {"total", "layers", "slices", "largest", "shared", "duplicates"}
+        """
+        # asset -> slices reaching it
+        reached: Dict[str, Set[str]] = {}
+        for file_path, assets in self._imports.items():
+            # Stylesheets count through the scripts importing them
+            if not assets or file_path.endswith(STYLESHEET_EXTENSIONS):
+                continue
+            owner = self.slice_of(file_path)
+            if owner is None:
+                continue
+            for asset in assets:
+                if asset.endswith(STYLESHEET_EXTENSIONS):
+                    for referenced in self._stylesheet_assets(asset):
+                        reached.setdefault(referenced, set()).add(owner)
+                else:
+                    reached.setdefault(asset, set()).add(owner)
+
+        sizes = {asset: self._size(asset) for asset in reached}
+        slices: Dict[str, Dict[str, int]] = {}
+        layer_assets: Dict[str, Set[str]] = {}
+        for asset, owners in reached.items():
+            for owner in owners:
+                totals = slices.setdefault(owner, {"files": 0, "bytes": 0})
+                totals["files"] += 1
+                totals["bytes"] += sizes[asset]
+                layer_assets.setdefault(owner.split("/")[0], set()).add(asset)
+
+        def entry(asset: str) -> Dict[str, Any]:
+            return {"file": asset, "size": sizes[asset], "slices": sorted(reached[asset])}
+
+        by_size = sorted(reached, key=lambda asset: (-sizes[asset], asset))
+        return {
+            "total": {"files": len(reached), "bytes": sum(sizes.values())},
+            "layers": {layer: {"files": len(assets), "bytes": sum(sizes[asset] for asset in assets)}
+                       for layer, assets in sorted(layer_assets.items())},
+            "slices": [{"slice": owner, **totals}
+                       for owner, totals in sorted(slices.items(), key=lambda item: (-item[1]["bytes"], item[0]))],
+            "largest": [entry(asset) for asset in by_size[:TOP_ASSETS]],
+            "shared": [entry(asset) for asset in by_size if len(reached[asset]) > 1][:TOP_ASSETS],
+            "duplicates": self._duplicates(sizes),
+        }
+
+    @staticmethod
+    def _duplicates(sizes: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Groups of distinct assets with identical content, largest first"""
+        by_size: Dict[int, List[str]] = {}
+        for asset, size in sizes.items():
+            if size:
+                by_size.setdefault(size, []).append(asset)
+
+        duplicates = []
+        for size, candidates in by_size.items():
+            if len(candidates) < 2:
+                continue
+            by_hash: Dict[str, List[str]] = {}
+            for asset in candidates:
+                digest = _file_hash(asset)
+                if digest:
+                    by_hash.setdefault(digest, []).append(asset)
+            duplicates.extend({"size": size, "files": sorted(files)}
+                              for files in by_hash.values() if len(files) > 1)
+        return sorted(duplicates, key=lambda group: (-group["size"] * (len(group["files"]) - 1), group["files"]))
@@ -0,0 +1,250 @@
+"""
+Barrel file cost analysis for the FSD Architecture Checker.
+
+A barrel is the index file of a slice that re-exports its modules.
+Importing it makes the dev server (and an unoptimized bundle) load
+everything it imports, transitively, even when the importer needs a
+single name. For every barrel this module measures that closure in
+modules and bytes, and for every file importing it, how much of the
+closure the imported names actually need: each name is followed through
+`export * from` / `export { } from` chains to the module defining it.
+
+Export tables are computed once per module and memoized, so re-export
+chains shared by many barrels are only followed once.
+"""
+
+import os
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .extractor import SOURCE_TOKEN_RE
+from .graph import ModuleGraph
+from .reader import SkippedFile, read_source
+
+BARREL_NAMES = frozenset(f"index.{extension}" for extension in ("ts", "tsx", "js", "jsx", "mjs"))
+
+_SPECIFIER = r'''\s*from\s*['"]([^'"\n]+)['"]'''
+EXPORT_STAR_RE = re.compile(r'\bexport\s+(type\s+)?\*\s*(?:as\s+([\w$]+)\s*)?' + _SPECIFIER)
+EXPORT_LIST_RE = re.compile(r'\bexport\s+(type\s+)?\{([^}]*)\}(?:' + _SPECIFIER + ')?')
+EXPORT_DECLARATION_RE = re.compile(
+    r'\bexport\s+(?:declare\s+)?(?:async\s+)?(?:abstract\s+)?'
+    r'(?:const|let|var|function\s*\*?|class|enum|namespace)\s+([\w$]+)')
+EXPORT_DEFAULT_RE = re.compile(r'\bexport\s+default\b')
+IMPORT_RE = re.compile(
+    r'\bimport\s+(type\s+)?(?:([\w$]+)\s*,?\s*)?(?:\*\s*as\s+[\w$]+|(\{[^}]*\}))?' + _SPECIFIER)
+SIDE_EFFECT_IMPORT_RE = re.compile(r'''\bimport\s*(?:\(\s*)?['"]([^'"\n]+)['"]''')
+
+# Stands for "every export of the module" in a set of used names
+ALL_NAMES = "*"
+
+
+def _strip_comments(content: str) -> str:
+    """Drop comments so commented-out imports and exports are not seen"""
+    return SOURCE_TOKEN_RE.sub(lambda match: "" if match.group(0)[0] == "/" else match.group(0), content)
+
+
+def _bindings(binding_list: str) -> List[Tuple[str, str]]:
+    """(source, local) name pairs of a `{ a, b as c }` list, without type-only items"""
+    pairs = []
+    for item in binding_list.strip("{} \n\t").split(","):
+        parts = item.split()
+        if not parts or parts[0] == "type":
+            continue
+        pairs.append((parts[0], parts[2] if len(parts) == 3 and parts[1] == "as" else parts[0]))
+    return pairs
+
+
+class ModuleExports:
+    """Re-exports and local exports of one module"""
+
+    __slots__ = ("local", "named", "stars", "namespaces")
+
+    def __init__(self, content: str):
+        content = _strip_comments(content)
+        self.local: Set[str] = set(EXPORT_DECLARATION_RE.findall(content))
+        if EXPORT_DEFAULT_RE.search(content):
+            self.local.add("default")
+        # exported name -> (specifier, name in that module)
+        self.named: Dict[str, Tuple[str, str]] = {}
+        self.stars: List[str] = []
+        self.namespaces: Dict[str, str] = {}
+
+        for type_only, namespace, specifier in EXPORT_STAR_RE.findall(content):
+            if type_only:
+                continue
+            if namespace:
+                self.namespaces[namespace] = specifier
+            else:
+                self.stars.append(specifier)
+        for type_only, binding_list, specifier in EXPORT_LIST_RE.findall(content):
+            if type_only:
+                continue
+            for source, exported in _bindings(binding_list):
+                if specifier:
+                    self.named[exported] = (specifier, source)
+                else:
+                    self.local.add(exported)
+
+
+def imported_names(content: str) -> Dict[str, Set[str]]:
+    """
+    Runtime names a module imports (or re-exports) from each specifier.
+
+    A namespace, side-effect or dynamic import and `export *` use every
+    export (ALL_NAMES); type-only imports use none.
+    """
+    content = _strip_comments(content)
+    names: Dict[str, Set[str]] = {}
+    for match in IMPORT_RE.finditer(content):
+        type_only, default, binding_list, specifier = match.groups()
+        used = names.setdefault(specifier, set())
+        if type_only:
+            continue
+        if default:
+            used.add("default")
+        if binding_list:
+            used.update(source for source, _ in _bindings(binding_list))
+        if not default and not binding_list:
+            used.add(ALL_NAMES)
+    for specifier in SIDE_EFFECT_IMPORT_RE.findall(content):
+        names.setdefault(specifier, set()).add(ALL_NAMES)
+    for type_only, _, specifier in EXPORT_STAR_RE.findall(content):
+        names.setdefault(specifier, set()).update(() if type_only else (ALL_NAMES,))
+    for type_only, binding_list, specifier in EXPORT_LIST_RE.findall(content):
+        if specifier:
+            names.setdefault(specifier, set()).update(
+                () if type_only else (source for source, _ in _bindings(binding_list)))
+    return names
+
+
+class BarrelAnalyzer:
+    """Measures what importing each barrel loads and what its importers use"""
+
+    def __init__(self, base_dir: str, file_imports: List[Tuple[str, Optional[Tuple[List[List[Any]], Any]]]],
+                 graph: ModuleGraph, read_options: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            base_dir: Base directory containing FSD layers
+            file_imports: Resolved imports of every file, as kept by FSDChecker.analyze_imports
+            graph: Runtime module graph of the same imports (type-only imports load nothing)
+            read_options: Keyword arguments for read_source (size caps)
+        """
+        self.base_dir = base_dir
+        self.graph = graph
+        self.read_options = read_options or {}
+        # file -> {specifier: resolved file}
+        self.resolved: Dict[str, Dict[str, str]] = {}
+        for file_path, loaded in file_imports:
+            if loaded and not loaded[1]:
+                self.resolved[file_path] = {entry[0]: entry[2] for entry in loaded[0] if entry[2]}
+
+        self._contents: Dict[str, str] = {}
+        self._exports: Dict[str, Dict[str, str]] = {}
+        self._sizes: Dict[int, int] = {}
+
+    def _content(self, file_path: str) -> str:
+        content = self._contents.get(file_path)
+        if content is None:
+            try:
+                content = read_source(file_path, **self.read_options)[1]
+            except (OSError, SkippedFile):
+                content = ""
+            self._contents[file_path] = content
+        return content
+
+    def _size(self, node: int) -> int:
+        size = self._sizes.get(node)
+        if size is None:
+            try:
+                size = os.path.getsize(self.graph.paths[node])
+            except OSError:
+                size = 0
+            self._sizes[node] = size
+        return size
+
+    def barrels(self) -> List[str]:
+        """Index files directly inside a slice (layer/slice/index.ts)"""
+        base = os.path.join(os.path.normpath(self.base_dir), '')
+        return [file_path for file_path in self.resolved
+                if os.path.basename(file_path) in BARREL_NAMES and file_path.startswith(base)
+                and file_path[len(base):].count(os.sep) == 2]
+
+    def export_table(self, file_path: str) -> Dict[str, str]:
+        """
+        Map each runtime name a module exports to the module defining it.
+
+        Memoized per module; modules on an export cycle see the partial
+        table of the module that started the cycle.
+        """
+        table = self._exports.get(file_path)
+        if table is not None:
+            return table
+        table = self._exports[file_path] = {}
+
+        exports = ModuleExports(self._content(file_path))
+        resolved = self.resolved.get(file_path, {})
+        for name in exports.local:
+            table[name] = file_path
+        for name, specifier in exports.namespaces.items():
+            if specifier in resolved:
+                table[name] = resolved[specifier]
+        for name, (specifier, source) in exports.named.items():
+            target = resolved.get(specifier)
+            if target:
+                table[name] = self.export_table(target).get(source, target)
+        for specifier in exports.stars:
+            target = resolved.get(specifier)
+            if target:
+                for name, module in self.export_table(target).items():
+                    if name != "default":
+                        table.setdefault(name, module)
+        return table
+
+    def _bytes(self, nodes: Set[int]) -> int:
+        return sum(self._size(node) for node in nodes)
+
+    def analyze(self, barrel: str) -> Dict[str, Any]:
+        """Cost of one barrel and the share of it used by each importer"""
+        graph = self.graph
+        barrel_node = graph.id_of(barrel)
+        loaded = graph.closure([barrel_node])
+        loaded_bytes = self._bytes(loaded)
+        table = self.export_table(barrel)
+
+        importers = []
+        for importer in sorted(graph.paths[node] for node in graph.dependents(barrel_node)):
+            specifiers = [specifier for specifier, target in self.resolved.get(importer, {}).items()
+                          if target == barrel]
+            names = imported_names(self._content(importer))
+            used_names = set().union(*(names.get(specifier, {ALL_NAMES}) for specifier in specifiers))
+            if not used_names:
+                # Type-only imports are erased and load nothing
+                continue
+
+            if ALL_NAMES in used_names:
+                used = loaded
+            else:
+                defining = {graph.id_of(table.get(name, barrel)) for name in used_names}
+                used = graph.closure(node for node in defining if node is not None) & loaded
+            used_bytes = self._bytes(used)
+            importers.append({
+                "file": importer,
+                "names": sorted(used_names),
+                "used_modules": len(used),
+                "used_bytes": used_bytes,
+                "unused_bytes": loaded_bytes - used_bytes,
+            })
+
+        return {
+            "barrel": barrel,
+            "modules": len(loaded),
+            "bytes": loaded_bytes,
+            "exports": len(table),
+            "importers": importers,
+            "unused_bytes": sum(importer["unused_bytes"] for importer in importers),
+        }
+
+    def rank(self) -> List[Dict[str, Any]]:
+        """Analyze every barrel, worst first: the most bytes loaded but unused across importers"""
+        results = [self.analyze(barrel) for barrel in self.barrels()]
+        return sorted(results, key=lambda result: (-result["unused_bytes"], -result["bytes"], result["barrel"]))
@@ -0,0 +1,126 @@
+"""
+Baselines of accepted violations.
+
+A baseline is a file of violation fingerprints. An import violation is
+identified by its file (relative to the base directory), specifier and
+source and target layers, a directory violation by its type and file;
+line numbers and messages are left out, so fingerprints survive unrelated
+edits. Checks against a baseline only report violations whose
+fingerprint is not in it.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional, Set
+
+BASELINE_FORMAT = "fsd-baseline"
+BASELINE_VERSION = 1
+
+DEFAULT_BASELINE_PATH = "fsd_baseline.json"
+
+
+def fingerprint(*parts: str) -> str:
+    """Stable 64-bit hex digest of the identifying parts of a violation"""
+    return hashlib.sha1("\0".join(parts).encode('utf-8')).hexdigest()[:16]
+
+
+class Baseline:
+    """Set of accepted violation fingerprints, recording which ones a check matched"""
+
+    def __init__(self, base_dir: str, fingerprints: Optional[Set[str]] = None,
+                 path: str = DEFAULT_BASELINE_PATH, update: bool = False):
+        """
+        Args:
+            base_dir: Base directory the violation paths are made relative to
+            fingerprints: Accepted fingerprints
+            path: File the baseline is loaded from and saved to
+            update: Accept every violation found, to rewrite the baseline from this check
+        """
+        self.base_dir = base_dir
+        self.fingerprints = fingerprints or set()
+        self.path = path
+        self.update = update
+        # Fingerprints of the violations found by this check that the baseline accepts
+        self.matched: Set[str] = set()
+        self.suppressed = 0
+        self._relative_paths: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: str, base_dir: str, update: bool = False) -> "Baseline":
+        """
+        Load a baseline file; a missing file is an empty baseline.
+
+        Raises:
+            ValueError: If the file is not a baseline of a known version
+        """
+        if not os.path.exists(path):
+            return cls(base_dir, path=path, update=update)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("format") != BASELINE_FORMAT \
+                or data.get("version") != BASELINE_VERSION:
+            raise ValueError(f"{path} is not an FSD baseline of version {BASELINE_VERSION}")
+        return cls(base_dir, set(data["fingerprints"]), path=path, update=update)
+
+    def _relative(self, file_path: str) -> str:
+        relative = self._relative_paths.get(file_path)
+        if relative is None:
+            relative = os.path.relpath(file_path, self.base_dir).replace(os.sep, "/")
+            self._relative_paths[file_path] = relative
+        return relative
+
+    def _accepts(self, key: str) -> bool:
+        if self.update or key in self.fingerprints:
+            self.matched.add(key)
+            self.suppressed += 1
+            return True
+        return False
+
+    def accepts_import(self, file_path: str, import_path: str, from_layer: str, to_layer: str) -> bool:
+        """Check whether an import violation is accepted (and record the match)"""
+        return self._accepts(fingerprint("import", self._relative(file_path), import_path, from_layer, to_layer))
+
+    def accepts_directory(self, violation: Dict[str, Any]) -> bool:
+        """Check whether a directory violation is accepted (and record the match)"""
+        return self._accepts(fingerprint("directory", violation["type"], self._relative(violation["file"])))
+
+    def resolved(self) -> Set[str]:
+        """Accepted fingerprints that this check did not find"""
+        return self.fingerprints - self.matched
+
+    def finish(self, full_check: bool) -> int:
+        """
+        Drop resolved entries after a full check and save the baseline if it changed.
+
+        Entries can only be pruned after a full check (see
+        FSDChecker.is_full_check); any other check keeps them, and an update
+        only adds to them.
+
+        Returns:
+            Number of entries removed
+        """
+        if full_check:
+            fingerprints = set(self.matched)
+        elif self.update:
+            fingerprints = self.fingerprints | self.matched
+        else:
+            fingerprints = self.fingerprints
+
+        removed = len(self.fingerprints - fingerprints)
+        if fingerprints != self.fingerprints or (self.update and not os.path.exists(self.path)):
+            self.save(fingerprints)
+        return removed
+
+    def save(self, fingerprints: Set[str]) -> None:
+        """Write fingerprints to the baseline file, one per line in sorted order"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"format": BASELINE_FORMAT, "version": BASELINE_VERSION,
+                       "fingerprints": sorted(fingerprints)}, f, indent=2)
+            f.write("\n")
+        os.replace(temp_path, self.path)
+        self.fingerprints = fingerprints
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Benchmark of the single-pass import extractor against the legacy regex set.
+
+Runs both extractors over every source file under a base directory and
+over a synthetic minified bundle, and prints timings and the number of
+specifiers each one found.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Callable, List, Tuple
+
+from fsd_checker.extractor import extract_specifiers
+
+# The three patterns FSDChecker used before the single-pass extractor
+LEGACY_IMPORT_PATTERNS = [
+    r'import\s+.*\s+from\s+[\'"](.+?)[\'"]',  # import X from 'path'
+    r'import\s+[\'"](.+?)[\'"]',              # import 'path'
+    r'require\s*\(\s*[\'"](.+?)[\'"]'         # require('path')
+]
+
+
+def legacy_extract(content: str) -> List[str]:
+    """Extract specifiers the way the legacy checker did"""
+    all_imports = []
+    for pattern in LEGACY_IMPORT_PATTERNS:
+        all_imports.extend(re.findall(pattern, content))
+    return all_imports
+
+
+def load_sources(base_dir: str) -> List[str]:
+    """Read every JS/TS source file under base_dir"""
+    contents = []
+    for root, _, files in os.walk(base_dir):
+        for file in files:
+            if file.endswith(('.ts', '.tsx', '.js', '.jsx')):
+                with open(os.path.join(root, file), 'r', encoding='utf-8', errors='replace') as f:
+                    contents.append(f.read())
+    return contents
+
+
+def make_minified_source(modules: int) -> str:
+    """Build a single-line bundle: hoisted imports followed by long code"""
+    parts = []
+    for i in range(modules):
+        # Alternate tight and spaced forms, as different minifiers emit them
+        if i % 2:
+            parts.append(f'import {{ m{i} as a{i} }} from "@/shared/lib/m{i}";')
+        else:
+            parts.append(f'import{{m{i} as a{i}}}from"@/shared/lib/m{i}";')
+    for i in range(modules):
+        parts.append(f'var v{i}=function(e){{return e.map(function(t){{return t+{i}}})}};' * 4)
+        # Keyword text inside strings makes `import\s+.*\s+from` scan to the end of the line
+        parts.append(f'var w{i}=function(e){{throw Error("cannot import "+e)}};')
+    return "".join(parts)
+
+
+def time_extractor(extract: Callable[[str], List[str]], contents: List[str], repeat: int) -> Tuple[float, int]:
+    """Return the best wall time over `repeat` runs and the specifiers found"""
+    best = float("inf")
+    found = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = sum(len(extract(content)) for content in contents)
+        best = min(best, time.perf_counter() - start)
+    return best, found
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Benchmark import extraction")
+    parser.add_argument("--base-dir", default="src", help="Source tree to benchmark on")
+    parser.add_argument("--minified-modules", type=int, default=1000,
+                        help="Number of imports in the synthetic minified file")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args(args)
+
+    datasets = [
+        (f"{args.base_dir} tree", load_sources(args.base_dir)),
+        (f"minified ({args.minified_modules} imports)", [make_minified_source(args.minified_modules)]),
+    ]
+
+    print(f"\n{'Dataset':<32} {'Extractor':<12} {'Time (ms)':>10} {'Specifiers':>11}")
+    for name, contents in datasets:
+        for label, extract in (("legacy", legacy_extract), ("single-pass", extract_specifiers)):
+            elapsed, found = time_extractor(extract, contents, args.repeat)
+            print(f"{name:<32} {label:<12} {elapsed * 1000:>10.1f} {found:>11}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
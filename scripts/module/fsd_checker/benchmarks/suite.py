@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+"""
+End-to-end benchmark suite for the FSD Architecture Checker.
+
+For each tree size a synthetic monorepo is generated, then `run_checks`
+(cold and with a warm cache), every reporter and `process` are timed in
+a fresh interpreter. Wall time, files/sec and peak RSS are written to a
+JSON results file, which can be compared against a stored baseline to
+flag regressions.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from fsd_checker.benchmarks.synthetic import generate_tree
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Relative slowdown above which a phase counts as a regression
+DEFAULT_THRESHOLD = 0.2
+
+# Phases faster than this are too noisy to compare
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+def _peak_rss_mb(children: bool = False) -> Optional[float]:
+    """
+    High-water mark of the resident set size of this process (or its largest child), in MB.
+
+    Without the Unix resource module, the peak working set from psutil is
+    used (Windows), else the peak of Python allocations traced by
+    tracemalloc. None if none of them is available.
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    if children:
+        return None
+    peak = getattr(psutil.Process().memory_info(), "peak_wset", None) if psutil is not None else None
+    if peak is None and tracemalloc.is_tracing():
+        peak = tracemalloc.get_traced_memory()[1]
+    return peak / (1024 * 1024) if peak is not None else None
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+
+def _measure(phases: Dict[str, Any], name: str, files: int, action: Callable[[], Any]) -> Any:
+    """Run an action, recording its wall time, throughput and the peak RSS so far"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = action()
+    elapsed = time.perf_counter() - start
+    phases[name] = {
+        "seconds": round(elapsed, 4),
+        "files_per_sec": round(files / elapsed, 1) if elapsed else None,
+        "peak_rss_mb": _round(_peak_rss_mb()),
+        "peak_worker_rss_mb": _round(_peak_rss_mb(children=True)),
+    }
+    return result
+
+
+def run_size(tree_dir: str, work_dir: str, files: int, jobs: int) -> Dict[str, Any]:
+    """
+    Time every phase on one generated tree.
+
+    Runs in a fresh process (see benchmark_size), so peak RSS starts from a
+    bare interpreter. RSS is a high-water mark: the reporter phases include
+    the memory of the report they render.
+    """
+    from fsd_checker.core import FSDChecker
+    from fsd_checker.reporters import (JsonlReportWriter, export_report_to_json, generate_markdown_report,
+                                       print_report)
+    from fsd_checker.scripts.moderators.moderate_fsd_report import main as process_main
+
+    if resource is None and _peak_rss_mb() is None:
+        tracemalloc.start()
+
+    base_dir = os.path.join(tree_dir, "src")
+    cache_dir = os.path.join(work_dir, "cache")
+    json_path = os.path.join(work_dir, "report.json")
+    phases: Dict[str, Any] = {}
+
+    report = _measure(phases, "run_checks", files,
+                      lambda: FSDChecker(base_dir, jobs=jobs).run_checks())
+
+    # Populate the cache untimed, then time a warm run
+    FSDChecker(base_dir, jobs=jobs, cache_dir=cache_dir).run_checks()
+    _measure(phases, "run_checks_cached", files,
+             lambda: FSDChecker(base_dir, jobs=jobs, cache_dir=cache_dir).run_checks())
+
+    _measure(phases, "report_console", files, lambda: print_report(report))
+    _measure(phases, "report_json", files, lambda: export_report_to_json(report, json_path))
+    _measure(phases, "report_markdown", files,
+             lambda: generate_markdown_report(report, os.path.join(work_dir, "report.md")))
+
+    def write_stream():
+        writer = JsonlReportWriter(os.path.join(work_dir, "report.jsonl"))
+        for violation in report["imports"]["violations"]:
+            writer.write_violation(dict(violation))
+        writer.finish(report)
+
+    _measure(phases, "report_jsonl", files, write_stream)
+    _measure(phases, "process", files,
+             lambda: process_main([json_path, "--from-layers", "features", "widgets",
+                                   "--output-md", os.path.join(work_dir, "process.md"), "--summary"]))
+
+    return {"violations": report["imports"]["total"], "phases": phases}
+
+
+def _run_size_child(queue: multiprocessing.Queue, *args) -> None:
+    try:
+        queue.put(run_size(*args))
+    except Exception as e:
+        queue.put({"error": repr(e)})
+
+
+def benchmark_size(tree_dir: str, work_dir: str, files: int, jobs: int) -> Dict[str, Any]:
+    """Run run_size in a freshly spawned interpreter and return its results"""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run_size_child, args=(queue, tree_dir, work_dir, files, jobs))
+    process.start()
+    result = queue.get()
+    process.join()
+    if "error" in result:
+        raise RuntimeError(f"Benchmark of {tree_dir} failed: {result['error']}")
+    return result
+
+
+def compare_results(results: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare phase timings against a baseline.
+
+    Returns:
+        One entry per phase present in both, with the time ratio and
+        whether it is a regression (slower by more than threshold)
+    """
+    comparisons = []
+    for size, current in results["sizes"].items():
+        previous = baseline.get("sizes", {}).get(size)
+        if not previous:
+            continue
+        for phase, measurement in current["phases"].items():
+            before = previous["phases"].get(phase)
+            if not before or not before["seconds"]:
+                continue
+            ratio = measurement["seconds"] / before["seconds"]
+            comparable = max(measurement["seconds"], before["seconds"]) >= MIN_COMPARABLE_SECONDS
+            comparisons.append({
+                "size": size,
+                "phase": phase,
+                "baseline_seconds": before["seconds"],
+                "seconds": measurement["seconds"],
+                "ratio": round(ratio, 3),
+                "regression": comparable and ratio > 1 + threshold,
+            })
+    return comparisons
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Benchmark the FSD Checker on synthetic monorepos")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Tree sizes in files")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results output path")
+    parser.add_argument("--baseline", help="Results file to compare against; regressions exit with 1")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown that counts as a regression (default: 0.2)")
+    parser.add_argument("--work-dir", help="Directory for generated trees (temporary by default)")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated trees")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for run_checks (default: CPU count)")
+    parser.add_argument("--fan-out", type=int, default=6, help="Imports per generated file")
+    parser.add_argument("--violation-rate", type=float, default=0.05,
+                        help="Share of alias imports that target a forbidden layer")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the generator")
+    args = parser.parse_args(args)
+
+    work_root = args.work_dir or tempfile.mkdtemp(prefix="fsd-bench-")
+    results: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "jobs": args.jobs,
+        "sizes": {},
+    }
+
+    try:
+        for size in args.sizes:
+            tree_dir = os.path.join(work_root, f"tree-{size}")
+            run_dir = os.path.join(work_root, f"run-{size}")
+            shutil.rmtree(tree_dir, ignore_errors=True)
+            shutil.rmtree(run_dir, ignore_errors=True)
+            os.makedirs(run_dir)
+
+            print(f"Generating {size} files...")
+            spec = generate_tree(tree_dir, size, fan_out=args.fan_out,
+                                 violation_rate=args.violation_rate, seed=args.seed)
+            files = spec["counts"]["files"]
+
+            print(f"Benchmarking {files} files...")
+            measured = benchmark_size(tree_dir, run_dir, files, args.jobs)
+            results["sizes"][str(size)] = {"files": files, "generator": spec, **measured}
+
+            for phase, measurement in measured["phases"].items():
+                peak = measurement["peak_rss_mb"]
+                print(f"  {phase:<20} {measurement['seconds']:>9.3f}s {measurement['files_per_sec'] or 0:>12.0f} files/s "
+                      + (f"{peak:>8.1f} MB" if peak is not None else f"{'n/a':>8}"))
+    finally:
+        if not args.keep and not args.work_dir:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        comparisons = compare_results(results, baseline, args.threshold)
+        results["comparison"] = {"baseline": args.baseline, "threshold": args.threshold, "phases": comparisons}
+        regressions = [entry for entry in comparisons if entry["regression"]]
+
+        print(f"\nCompared with {args.baseline}:")
+        for entry in comparisons:
+            marker = "REGRESSION" if entry["regression"] else "ok"
+            print(f"  {entry['size']:>7} {entry['phase']:<20} {entry['ratio']:>6.2f}x  {marker}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if regressions:
+        print(f"❌ {len(regressions)} phases regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+Generator of synthetic FSD monorepos for benchmarking.
+
+Builds a tree of layers and slices with a tsconfig.json mapping `@/*` to
+`src/*`. Every file gets a fixed number of imports drawn from a mix of
+relative, `@/` alias and package specifiers; a share of the alias
+imports targets a layer the rules forbid, and those are the only
+violations. The output is deterministic for a given seed.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from fsd_checker.core import FSDChecker
+
+PACKAGES = ["react", "react-dom", "lodash/fp", "classnames", "zustand", "@tanstack/react-query"]
+
+# Lines of plain code after the imports, so files are not import-only
+BODY_LINES = 30
+
+
+def _file_name(index: int) -> str:
+    return f"Module{index}"
+
+
+def generate_tree(output_dir: str,
+                  files: int,
+                  layers: Optional[List[str]] = None,
+                  allowed_access: Optional[Dict[str, List[str]]] = None,
+                  files_per_slice: int = 20,
+                  slices_per_layer: Optional[int] = None,
+                  fan_out: int = 6,
+                  import_mix: Tuple[float, float, float] = (0.3, 0.5, 0.2),
+                  violation_rate: float = 0.05,
+                  seed: int = 0) -> Dict[str, Any]:
+    """
+    Write a synthetic FSD project.
+
+    Args:
+        output_dir: Project root; sources go to output_dir/src
+        files: Approximate number of source files
+        layers: Layer names (defaults to FSDChecker.DEFAULT_LAYERS)
+        allowed_access: Layer rules (defaults to FSDChecker.DEFAULT_ALLOWED_ACCESS)
+        files_per_slice: Source files in each slice
+        slices_per_layer: Slices in each layer (derived from files if None)
+        fan_out: Imports per file
+        import_mix: Shares of relative, `@/` alias and package imports
+        violation_rate: Share of alias imports that target a forbidden layer
+        seed: Random seed
+
+    Returns:
+        Parameters and counts of the generated tree
+    """
+    layers = layers or FSDChecker.DEFAULT_LAYERS
+    allowed_access = allowed_access or FSDChecker.DEFAULT_ALLOWED_ACCESS
+    if slices_per_layer is None:
+        slices_per_layer = max(1, math.ceil(files / (len(layers) * files_per_slice)))
+
+    rng = random.Random(seed)
+    base_dir = os.path.join(output_dir, "src")
+    os.makedirs(base_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "tsconfig.json"), 'w', encoding='utf-8') as f:
+        json.dump({"compilerOptions": {"baseUrl": ".", "paths": {"@/*": ["src/*"]}}}, f, indent=2)
+
+    relative_share, alias_share, _ = import_mix
+    counts = {"files": 0, "relative": 0, "alias": 0, "package": 0, "violations": 0}
+
+    for layer in layers:
+        allowed = [target for target in allowed_access.get(layer, []) if target in layers]
+        forbidden = [target for target in layers if target not in allowed]
+
+        for slice_index in range(slices_per_layer):
+            slice_dir = os.path.join(base_dir, layer, f"slice{slice_index}")
+            os.makedirs(slice_dir, exist_ok=True)
+
+            for file_index in range(files_per_slice):
+                lines = []
+                for _ in range(fan_out):
+                    roll = rng.random()
+                    # Relative imports stay in the layer, so only layers allowed to import themselves get them
+                    if roll < relative_share and files_per_slice > 1 and layer in allowed:
+                        target = rng.randrange(files_per_slice)
+                        if target == file_index:
+                            target = (target + 1) % files_per_slice
+                        lines.append(f"import {{ value{len(lines)} }} from './{_file_name(target)}';")
+                        counts["relative"] += 1
+                    elif roll < relative_share + alias_share and allowed:
+                        # Layers that may import nothing (shared) only get package imports
+                        violates = bool(forbidden) and rng.random() < violation_rate
+                        target_layer = rng.choice(forbidden if violates else allowed)
+                        target = f"@/{target_layer}/slice{rng.randrange(slices_per_layer)}/" \
+                                 f"{_file_name(rng.randrange(files_per_slice))}"
+                        lines.append(f"import {{ value{len(lines)} }} from '{target}';")
+                        counts["alias"] += 1
+                        counts["violations"] += 1 if violates else 0
+                    else:
+                        lines.append(f"import * as pkg{len(lines)} from '{rng.choice(PACKAGES)}';")
+                        counts["package"] += 1
+
+                lines.append("")
+                lines.append(f"export const value = {file_index};")
+                for line in range(BODY_LINES):
+                    lines.append(f"export function helper{line}(input: number): number {{ return input * {line} + value; }}")
+
+                path = os.path.join(slice_dir, f"{_file_name(file_index)}.ts")
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+                counts["files"] += 1
+
+    return {
+        "layers": layers,
+        "slices_per_layer": slices_per_layer,
+        "files_per_slice": files_per_slice,
+        "fan_out": fan_out,
+        "import_mix": list(import_mix),
+        "violation_rate": violation_rate,
+        "seed": seed,
+        "counts": counts,
+    }
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic FSD monorepo")
+    parser.add_argument("output_dir", help="Project root to create (sources go to OUTPUT_DIR/src)")
+    parser.add_argument("--files", type=int, default=1000, help="Approximate number of source files")
+    parser.add_argument("--layers", nargs="+", help="Layer names (default: the standard FSD layers)")
+    parser.add_argument("--slices-per-layer", type=int, help="Slices in each layer (derived from --files by default)")
+    parser.add_argument("--files-per-slice", type=int, default=20, help="Source files in each slice")
+    parser.add_argument("--fan-out", type=int, default=6, help="Imports per file")
+    parser.add_argument("--import-mix", type=float, nargs=3, default=[0.3, 0.5, 0.2],
+                        metavar=("RELATIVE", "ALIAS", "PACKAGE"), help="Shares of each import kind")
+    parser.add_argument("--violation-rate", type=float, default=0.05,
+                        help="Share of alias imports that target a forbidden layer")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args(args)
+
+    spec = generate_tree(args.output_dir, args.files, layers=args.layers,
+                         files_per_slice=args.files_per_slice, slices_per_layer=args.slices_per_layer,
+                         fan_out=args.fan_out, import_mix=tuple(args.import_mix),
+                         violation_rate=args.violation_rate, seed=args.seed)
+    print(json.dumps(spec["counts"], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
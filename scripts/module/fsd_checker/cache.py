@@ -0,0 +1,112 @@
+"""
+Persistent cache of per-file import extraction for the FSD Architecture Checker.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+# Bump whenever the layout of a cache entry changes
+CACHE_VERSION = 4
+
+CACHE_FILE_NAME = "imports.json"
+
+
+def hash_content(data: bytes) -> str:
+    """
+    Return the content hash stored alongside each cache entry.
+
+    This is the git blob SHA of the data, so hashes of clean tracked files
+    can be taken straight from the git index without reading them.
+    """
+    digest = hashlib.sha1(b"blob %d\0" % len(data))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class ImportCache:
+    """
+    On-disk cache of the import specifiers extracted from each source file.
+
+    Entries are keyed by file path and validated against the file's mtime and
+    size; when those change, the content hash decides whether the stored
+    specifiers can still be reused. They are stored unresolved: where an
+    import points depends on other files, so resolution is redone on every
+    run. The whole cache is discarded when its version stamp does not match
+    the current one.
+    """
+
+    def __init__(self, cache_dir: str = ".fsd-cache", stamp: str = ""):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache file
+            stamp: Fingerprint of everything the cached data depends on
+                   (extractor version, read options)
+        """
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, CACHE_FILE_NAME)
+        self.stamp = f"{CACHE_VERSION}:{stamp}"
+        self.entries: Dict[str, List[Any]] = {}
+        self.dirty = False
+
+        self.load()
+
+    def load(self) -> None:
+        """Load cache entries from disk, ignoring missing or stale caches"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("stamp") == self.stamp:
+            self.entries = data.get("entries", {})
+        else:
+            # Extractor or read options changed - start from scratch
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if anything changed"""
+        if not self.dirty:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_file = self.cache_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"stamp": self.stamp, "entries": self.entries}, f, separators=(',', ':'))
+        os.replace(tmp_file, self.cache_file)
+        self.dirty = False
+
+    def lookup(self, file_path: str, stat: os.stat_result) -> Optional[List[Any]]:
+        """Return the cached result if the file's mtime and size are unchanged"""
+        entry = self.entries.get(file_path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[3]
+        return None
+
+    def known_digest(self, file_path: str) -> Optional[str]:
+        """Return the content hash recorded for a file, if any"""
+        entry = self.entries.get(file_path)
+        return entry[2] if entry else None
+
+    def cached_result(self, file_path: str) -> Optional[List[Any]]:
+        """Return the stored result of a file regardless of its stat data"""
+        entry = self.entries.get(file_path)
+        return entry[3] if entry else None
+
+    def store(self, file_path: str, stat: os.stat_result, digest: str, result: Any) -> None:
+        """Record the result of reading a file (its specifiers and skip record)"""
+        self.entries[file_path] = [stat.st_mtime_ns, stat.st_size, digest, list(result)]
+        self.dirty = True
+
+    def evict_missing(self, seen_files: Iterable[str]) -> None:
+        """Drop entries for files that were not part of the latest scan"""
+        seen = set(seen_files)
+        stale = [path for path in self.entries if path not in seen]
+        for path in stale:
+            del self.entries[path]
+        if stale:
+            self.dirty = True
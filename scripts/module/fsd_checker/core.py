@@ -1,221 +1,902 @@
-"""
-Core functionality for the FSD Architecture Checker.
-"""
-
-import os
-import re
-from typing import Dict, List, Tuple, Optional, Any
-
-
-class FSDChecker:
-    """
-    Feature-Sliced Design architecture checker that validates project structure
-    and import dependencies against FSD principles.
-    """
-
-    # Default FSD layers
-    DEFAULT_LAYERS = ["shared", "entities", "features", "widgets", "pages", "app", "composers"]
-
-    # Default allowed access between layers
-    DEFAULT_ALLOWED_ACCESS = {
-        "shared": [],
-        "entities": ["shared", "entities", "composers"],
-        "features": ["shared", "entities", "features", "composers"],
-        "widgets": ["shared", "entities", "features", "widgets", "composers"],
-        "pages": ["shared", "entities", "features", "widgets", "pages"],
-        "app": ["shared", "entities", "features", "widgets", "pages", "app"],
-        "composers": ["shared"]  # Composers can only access shared
-    }
-
-    def __init__(self,
-                 base_dir: str = "src",
-                 layers: Optional[List[str]] = None,
-                 allowed_access: Optional[Dict[str, List[str]]] = None):
-        """
-        Initialize the FSD checker.
-
-        Args:
-            base_dir: Root directory to start scanning from
-            layers: List of FSD layers to check (defaults to DEFAULT_LAYERS)
-            allowed_access: Dict of allowed dependencies (defaults to DEFAULT_ALLOWED_ACCESS)
-        """
-        self.base_dir = base_dir
-        self.layers = layers or self.DEFAULT_LAYERS
-        self.allowed_access = allowed_access or self.DEFAULT_ALLOWED_ACCESS
-
-        self.layer_modules: Dict[str, List[str]] = {layer: [] for layer in self.layers}
-        self.import_violations: List[Dict[str, Any]] = []
-        self.directory_violations: List[Dict[str, Any]] = []
-        self.missing_layers: List[str] = []
-
-        # Scan project structure immediately
-        self.collect_layers_structure()
-
-    def collect_layers_structure(self) -> None:
-        """Scan project directory to map layer structure"""
-        for layer in self.layers:
-            layer_dir = os.path.join(self.base_dir, layer)
-            if os.path.isdir(layer_dir):
-                for sub in os.listdir(layer_dir):
-                    sub_path = os.path.join(layer_dir, sub)
-                    if os.path.isdir(sub_path):
-                        self.layer_modules[layer].append(sub)
-            else:
-                self.missing_layers.append(layer)
-
-    def check_directory_structure(self) -> None:
-        """Verify directory structure follows FSD principles"""
-        # Check for files at the root level of each layer (should be in a slice)
-        for layer in self.layers:
-            if layer in self.missing_layers:
-                continue
-
-            layer_dir = os.path.join(self.base_dir, layer)
-            for item in os.listdir(layer_dir):
-                item_path = os.path.join(layer_dir, item)
-                if os.path.isfile(item_path) and not item.startswith('.') and not item == "index.ts":
-                    self.directory_violations.append({
-                        "type": "root_level_file",
-                        "layer": layer,
-                        "file": item_path,
-                        "message": f"File should be within a slice, not at layer root"
-                    })
-
-    def _get_layer_from_path(self, file_path: str) -> Optional[str]:
-        """Extract layer from file path"""
-        path_parts = file_path.split(os.sep)
-        for i, part in enumerate(path_parts):
-            if part in self.layers and i < len(path_parts) - 1:
-                return part
-        return None
-
-    def _get_layer_and_slice_from_import(self, import_path: str, current_layer: str) -> Tuple[Optional[str], Optional[str]]:
-        """Parse import path to identify layer and slice"""
-        if import_path.startswith('@') or import_path.startswith('src/'):
-            # Handle absolute paths
-            path_parts = import_path.replace('@/', '').replace('src/', '').split('/')
-        else:
-            # Handle relative paths - needs current file context
-            return None, None  # Handled separately
-
-        if len(path_parts) >= 2 and path_parts[0] in self.layers:
-            return path_parts[0], path_parts[1]
-        return None, None
-
-    def analyze_imports(self) -> None:
-        """Scan project files for imports and check against rules"""
-        for layer in self.layers:
-            if layer in self.missing_layers:
-                continue
-
-            layer_dir = os.path.join(self.base_dir, layer)
-            self._scan_directory_for_imports(layer_dir, layer)
-
-    def _scan_directory_for_imports(self, directory: str, layer: str) -> None:
-        """Recursively scan directories for import violations"""
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                    file_path = os.path.join(root, file)
-                    self._check_file_imports(file_path, layer)
-
-    def _check_file_imports(self, file_path: str, layer: str) -> None:
-        """Check imports in a file against FSD rules"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Extract imports
-            import_patterns = [
-                r'import\s+.*\s+from\s+[\'"](.+?)[\'"]',  # import X from 'path'
-                r'import\s+[\'"](.+?)[\'"]',              # import 'path'
-                r'require\s*\(\s*[\'"](.+?)[\'"]'         # require('path')
-            ]
-
-            all_imports = []
-            for pattern in import_patterns:
-                all_imports.extend(re.findall(pattern, content))
-
-            # Filter out node_modules and relative imports within same directory
-            project_imports = [imp for imp in all_imports if not (
-                imp.startswith('.') and '/' not in imp and '\\' not in imp or
-                not (imp.startswith('.') or imp.startswith('@') or imp.startswith('src/'))
-            )]
-
-            # Check each import against rules
-            for import_path in project_imports:
-                if import_path.startswith('.'):
-                    # Handle relative imports
-                    resolved_path = self._resolve_relative_import(file_path, import_path)
-                    if resolved_path:
-                        target_layer = self._get_layer_from_path(resolved_path)
-                        if target_layer and target_layer not in self.allowed_access.get(layer, []):
-                            self.import_violations.append({
-                                "file": file_path,
-                                "import": import_path,
-                                "from_layer": layer,
-                                "to_layer": target_layer,
-                                "message": f"Layer '{layer}' cannot import from '{target_layer}'"
-                            })
-                else:
-                    # Handle absolute imports
-                    target_layer, _ = self._get_layer_and_slice_from_import(import_path, layer)
-                    if target_layer and target_layer not in self.allowed_access.get(layer, []):
-                        self.import_violations.append({
-                            "file": file_path,
-                            "import": import_path,
-                            "from_layer": layer,
-                            "to_layer": target_layer,
-                            "message": f"Layer '{layer}' cannot import from '{target_layer}'"
-                        })
-        except Exception as e:
-            print(f"Error processing file {file_path}: {e}")
-
-    def _resolve_relative_import(self, file_path: str, relative_import: str) -> Optional[str]:
-        """Resolve relative import to absolute path"""
-        try:
-            dir_path = os.path.dirname(file_path)
-            if relative_import.startswith('./'):
-                relative_import = relative_import[2:]
-            elif relative_import.startswith('../'):
-                parts = relative_import.split('/')
-                up_count = 0
-                for part in parts:
-                    if part == '..':
-                        up_count += 1
-                    else:
-                        break
-
-                current_dir = dir_path
-                for _ in range(up_count):
-                    current_dir = os.path.dirname(current_dir)
-
-                relative_part = '/'.join(parts[up_count:])
-                return os.path.normpath(os.path.join(current_dir, relative_part))
-
-            return os.path.normpath(os.path.join(dir_path, relative_import))
-        except Exception:
-            return None
-
-    def generate_report(self) -> Dict[str, Any]:
-        """Generate a comprehensive report of FSD violations"""
-        return {
-            "structure": {
-                "layers": {layer: modules for layer, modules in self.layer_modules.items()},
-                "missing_layers": self.missing_layers,
-                "directory_violations": self.directory_violations
-            },
-            "imports": {
-                "violations": self.import_violations,
-                "total": len(self.import_violations)
-            },
-            "rules": {
-                "allowed_access": self.allowed_access
-            }
-        }
-
-    def run_checks(self) -> Dict[str, Any]:
-        """Run all checks and generate report"""
-        self.check_directory_structure()
-        self.analyze_imports()
-        return self.generate_report()
+"""
+Core functionality for the FSD Architecture Checker.
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, List, Set, Tuple, Optional
+
+from .assets import AssetAnalyzer
+from .baseline import Baseline
+from .cache import ImportCache, hash_content
+from .extractor import IMPORT_KINDS, TYPE_IMPORT, extract_imports, extract_stylesheet_imports
+from .reader import SkippedFile, decode_source, read_source
+from .cycles import find_cycles
+from .graph import ModuleGraph, tree_fingerprint
+from .ignore import DEFAULT_EXCLUDES, TEST_DIRECTORIES, IgnoreRules, file_role, measure_subtree
+from .lazy import DEFAULT_ENTRY, check_lazy_boundaries
+from .resolver import ModuleResolver
+from .rules import RuleEngine
+from .shard import assign_shards, hash_shard
+from .stylesheets import stylesheet_fan_in
+from .profiling import NULL_PROFILER, Profiler
+from .snapshot import SOURCE_EXTENSIONS, STYLESHEET_EXTENSIONS, TreeSnapshot
+from .violations import ImportViolationTable, make_violation
+from .vcs import (list_changed_files, list_index_files, list_modified_files,
+                  list_staged_files, list_untracked_files, read_blobs)
+
+
+# Bump whenever import extraction changes its output
+EXTRACTOR_VERSION = 11
+
+# Result of reading one file, as cached: its [import_path, kind] pairs and, for
+# files that were not analyzed, a {"type", "message"} skip record
+FileSpecifiers = Tuple[List[List[str]], Optional[Dict[str, str]]]
+
+# Resolved result of one file: its [import_path, target_layer, resolved_file, kind]
+# entries and the skip record
+FileImports = Tuple[List[List[Any]], Optional[Dict[str, str]]]
+
+# Checker instance shared by the worker processes of a parallel run
+_worker_checker: Optional["FSDChecker"] = None
+
+
+def _init_worker(checker: "FSDChecker") -> None:
+    """Install the checker used by this worker process"""
+    global _worker_checker
+    _worker_checker = checker
+    # A forked worker inherits the parent's profile records; only report its own
+    checker.profiler.drain()
+
+
+def _read_files_batch(batch: List[Tuple[str, Optional[str]]]) -> Tuple[List[Optional[Tuple[str, Optional[FileSpecifiers]]]], Any]:
+    """Read and extract imports for a batch of (file_path, known_digest) pairs, plus the batch's profile records"""
+    results = [_worker_checker._read_file_specifiers(file_path, known_digest) for file_path, known_digest in batch]
+    return results, _worker_checker.profiler.drain()
+
+
+def report_exit_code(report: Dict[str, Any]) -> int:
+    """Exit code of the check command for a report: 1 if it has violations, else 0"""
+    has_violations = (
+        report["imports"]["total"] > 0 or
+        len(report["structure"]["directory_violations"]) > 0
+    )
+    return 1 if has_violations else 0
+
+
+class FSDChecker:
+    """
+    Feature-Sliced Design architecture checker that validates project structure
+    and import dependencies against FSD principles.
+    """
+
+    # Default FSD layers
+    DEFAULT_LAYERS = ["shared", "entities", "features", "widgets", "pages", "app", "composers"]
+
+    # Default allowed access between layers
+    DEFAULT_ALLOWED_ACCESS = {
+        "shared": [],
+        "entities": ["shared", "entities", "composers"],
+        "features": ["shared", "entities", "features", "composers"],
+        "widgets": ["shared", "entities", "features", "widgets", "composers"],
+        "pages": ["shared", "entities", "features", "widgets", "pages"],
+        "app": ["shared", "entities", "features", "widgets", "pages", "app"],
+        "composers": ["shared"]  # Composers can only access shared
+    }
+
+    # Number of files handed to a worker process at a time
+    PARALLEL_BATCH_SIZE = 64
+
+    def __init__(self,
+                 base_dir: str = "src",
+                 layers: Optional[List[str]] = None,
+                 allowed_access: Optional[Dict[str, List[str]]] = None,
+                 jobs: Optional[int] = None,
+                 cache_dir: Optional[str] = None,
+                 read_mode: str = "full",
+                 dynamic_imports: bool = True,
+                 max_file_size: Optional[int] = None,
+                 minified_line_length: Optional[int] = None,
+                 tsconfig: Optional[str] = None,
+                 files_from_git: bool = False,
+                 changed_since: Optional[str] = None,
+                 staged: bool = False,
+                 violation_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 profiler: Optional[Profiler] = None,
+                 baseline: Optional[Baseline] = None,
+                 slice_rules: Optional[List[Dict[str, Any]]] = None,
+                 entry: Optional[str] = None,
+                 runtime_only: bool = False,
+                 shard: Optional[Tuple[int, int]] = None,
+                 shard_balance: str = "hash",
+                 excludes: Optional[List[str]] = None,
+                 gitignore: bool = True,
+                 test_files: str = "include",
+                 graph_checks: bool = True):
+        """
+        Initialize the FSD checker.
+
+        Args:
+            base_dir: Root directory to start scanning from
+            layers: List of FSD layers to check (defaults to DEFAULT_LAYERS)
+            allowed_access: Dict of allowed dependencies (defaults to DEFAULT_ALLOWED_ACCESS)
+            jobs: Number of worker processes for import analysis (defaults to CPU count)
+            cache_dir: Directory of the persistent import cache (disabled if None)
+            read_mode: "full" to read whole files, "header" to stop after the
+                       static import/export header
+            dynamic_imports: In header mode, also scan file bodies for import()/require()
+            max_file_size: Skip files larger than this many bytes (no cap if None)
+            minified_line_length: Skip files whose average line length exceeds this
+            tsconfig: tsconfig.json used for module resolution (searched upwards from base_dir if None)
+            files_from_git: Enumerate files with git instead of walking the tree
+            changed_since: Only check files changed since this git ref and their importers
+            staged: Only check staged files, reading their content from the git index
+            violation_sink: Called with each import violation as soon as it is found;
+                            violations are then not kept in memory
+            profiler: Records phase and per-file timings (profiling is off if None)
+            baseline: Accepted violations, left out of the report
+            slice_rules: Path-level rules checked on top of the layer rules (see rules.py)
+            entry: Entry point of the application for the lazy-boundary check
+                   (defaults to app/main.tsx in base_dir)
+            runtime_only: Leave type-only imports out of the rules and the module graph
+            shard: (index, count) of the shard to check, from 1 to count; the
+                   report is then a partial report for `merge` (see shard.py)
+            shard_balance: "hash" to assign files to shards by path hash,
+                           "size" to balance the bytes read per shard
+            excludes: Globs of directories and files pruned from the tree walk
+                      (defaults to DEFAULT_EXCLUDES; see ignore.py)
+            gitignore: Also prune what the repository's .gitignore files ignore
+            test_files: "include" to check test and story files like other code,
+                        "exclude" to leave them out, "only" to check nothing else
+            graph_checks: Run the checks that need the whole import table (cycles,
+                          lazy boundaries, assets, stylesheets); without them and with
+                          a violation_sink, imports are checked file by file and the
+                          table is not kept
+        """
+        self.base_dir = base_dir
+        self.layers = layers or self.DEFAULT_LAYERS
+        self.allowed_access = allowed_access or self.DEFAULT_ALLOWED_ACCESS
+        self.rules = RuleEngine(base_dir, self.layers, self.allowed_access, slice_rules)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache_dir = cache_dir
+        self.read_mode = read_mode
+        self.dynamic_imports = dynamic_imports
+        self.max_file_size = max_file_size
+        self.minified_line_length = minified_line_length
+        self.resolver = ModuleResolver(base_dir, tsconfig)
+        self.files_from_git = files_from_git or staged
+        self.changed_since = changed_since
+        self.staged = staged
+        self.entry = entry or os.path.join(base_dir, DEFAULT_ENTRY)
+        self.runtime_only = runtime_only
+        self.shard = shard
+        self.shard_balance = shard_balance
+        self.test_files = test_files
+        self.graph_checks = graph_checks
+        self.excludes = list(DEFAULT_EXCLUDES if excludes is None else excludes)
+        if test_files == "exclude":
+            self.excludes.extend(TEST_DIRECTORIES)
+        self.ignore = IgnoreRules(base_dir, self.excludes, gitignore)
+        # Shard of each source file, and (scan position, file) of the files of this shard
+        self.shard_assignment: Dict[str, int] = {}
+        self.shard_files: List[Tuple[int, str]] = []
+        # Positions of the directory violations in the unsharded list
+        self.directory_positions: List[int] = []
+
+        # Trusted content hashes (git blob SHAs) and index contents for staged checks
+        self.git_hashes: Dict[str, str] = {}
+        self.blob_contents: Dict[str, bytes] = {}
+        # Files the report is restricted to (None checks everything)
+        self.scope: Optional[Set[str]] = None
+        # Resolved imports of every analyzed file, kept for the module graph
+        self.file_imports: List[Tuple[str, Optional[FileImports]]] = []
+
+        self.import_violations = ImportViolationTable()
+        self.violation_sink = violation_sink
+        self.profiler = profiler or NULL_PROFILER
+        self.baseline = baseline
+        self.streamed_violations = 0
+        # Edge counts of a check that did not keep the import table
+        self.streamed_edges: Optional[Dict[str, int]] = None
+        self.directory_violations: List[Dict[str, Any]] = []
+        self.skipped_files: List[Dict[str, Any]] = []
+        self.cycles: Dict[str, List[Dict[str, Any]]] = {"file": [], "slice": [], "layer": []}
+        self.lazy_boundaries: Optional[Dict[str, Any]] = None
+        self.assets: Optional[Dict[str, Any]] = None
+        self.stylesheets: Optional[Dict[str, Any]] = None
+
+        # The tree is scanned on first use, not on construction
+        self._snapshot: Optional[TreeSnapshot] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers only extract imports; do not ship the snapshot, baseline or output stream to them
+        state = self.__dict__.copy()
+        state["_snapshot"] = None
+        state["violation_sink"] = None
+        state["baseline"] = None
+        return state
+
+    @property
+    def snapshot(self) -> TreeSnapshot:
+        """Filesystem snapshot of base_dir, taken on first use"""
+        if self._snapshot is None:
+            self.collect_layers_structure()
+        return self._snapshot
+
+    @property
+    def layer_modules(self) -> Dict[str, List[str]]:
+        """Slices of each layer"""
+        return self.snapshot.slices
+
+    @property
+    def missing_layers(self) -> List[str]:
+        """Layers without a directory under base_dir"""
+        return self.snapshot.missing_layers
+
+    def collect_layers_structure(self) -> None:
+        """Scan project directory to map layer structure"""
+        # In git mode the file list comes from the index, only the layer level is listed
+        with self.profiler.span("scan"):
+            self._snapshot = TreeSnapshot.scan(self.base_dir, self.layers, source_files=not self.files_from_git,
+                                               ignore=self.ignore)
+        if self.profiler.enabled:
+            # Listing what was pruned shows the time the pruning saved
+            for directory, reason in self._snapshot.pruned:
+                self.profiler.record_pruned(directory, reason, *measure_subtree(directory))
+            self.profiler.record_ignored_files(self._snapshot.files_ignored)
+
+    def check_directory_structure(self) -> None:
+        """Verify directory structure follows FSD principles"""
+        # Check for files at the root level of each layer (should be in a slice)
+        for layer in self.layers:
+            for item_path in self.snapshot.root_files[layer]:
+                item = os.path.basename(item_path)
+                if not item.startswith('.') and not item == "index.ts":
+                    self.directory_violations.append({
+                        "type": "root_level_file",
+                        "layer": layer,
+                        "file": item_path,
+                        "message": f"File should be within a slice, not at layer root"
+                    })
+
+    def _get_layer_and_slice_from_path(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """Identify the layer and slice of a path inside base_dir"""
+        base = os.path.join(os.path.normpath(self.base_dir), '')
+        if not file_path.startswith(base):
+            return None, None
+
+        path_parts = file_path[len(base):].split(os.sep)
+        if len(path_parts) >= 2 and path_parts[0] in self.layers:
+            return path_parts[0], path_parts[1]
+        return None, None
+
+    def collect_source_files(self) -> List[Tuple[str, str]]:
+        """List (file_path, layer) pairs of all source files in scan order"""
+        if self.files_from_git:
+            source_files = self._collect_git_source_files()
+        else:
+            source_files = list(self.snapshot.source_files)
+        if self.test_files != "include":
+            wanted = self.test_files == "only"
+            source_files = [(file_path, layer) for file_path, layer in source_files
+                            if (self.file_role(file_path) is not None) == wanted]
+        return source_files
+
+    def file_role(self, file_path: str) -> Optional[str]:
+        """Role of a file that is not application code ("test" or "story"), None otherwise"""
+        base = os.path.join(os.path.normpath(self.base_dir), '')
+        return file_role(file_path[len(base):] if file_path.startswith(base) else file_path)
+
+    def _collect_git_source_files(self) -> List[Tuple[str, str]]:
+        """
+        List source files known to git, recording blob SHAs as content hashes.
+
+        Clean tracked files get their index SHA as a trusted hash; in staged
+        mode only the index matters, so untracked and unstaged edits are ignored.
+        """
+        index_files = list_index_files(self.base_dir)
+        if self.staged:
+            self.git_hashes = index_files
+            candidates = list(index_files)
+        else:
+            modified = list_modified_files(self.base_dir)
+            self.git_hashes = {path: sha for path, sha in index_files.items() if path not in modified}
+            candidates = list(index_files) + list_untracked_files(self.base_dir)
+
+        by_layer: Dict[str, List[str]] = {layer: [] for layer in self.layers}
+        for file_path in candidates:
+            if not file_path.endswith(SOURCE_EXTENSIONS) or self.ignore.excludes_path(file_path) \
+                    or not os.path.exists(file_path):
+                continue
+            layer = self._get_layer_and_slice_from_path(file_path)[0]
+            if layer and layer not in self.missing_layers:
+                by_layer[layer].append(file_path)
+
+        return [(file_path, layer) for layer in self.layers for file_path in by_layer[layer]]
+
+    def analyze_imports(self) -> None:
+        """Scan project files for imports and check against rules"""
+        source_files = self.collect_source_files()
+
+        if self.staged:
+            self.scope = list_staged_files(self.base_dir)
+            source_files = [(file_path, layer) for file_path, layer in source_files if file_path in self.scope]
+            self.blob_contents = {
+                file_path: data for file_path, data in zip(
+                    [file_path for file_path, _ in source_files],
+                    self._read_index_blobs([file_path for file_path, _ in source_files]),
+                )
+            }
+        elif self.changed_since:
+            self.scope = list_changed_files(self.base_dir, self.changed_since)
+
+        if self.shard:
+            source_files = self._shard_source_files(source_files)
+
+        file_paths = [file_path for file_path, _ in source_files]
+        if self._streams_imports():
+            self._stream_file_imports(source_files)
+            return
+
+        # Other shards' files are not seen, so a shard keeps their cache entries
+        file_imports = self._load_file_imports(file_paths, evict=not self.staged and not self.shard,
+                                               follow_stylesheets=not self.staged)
+        # Stylesheets outside the layers are followed for the graph, but have no layer rules
+        source_files += [(file_path, None) for file_path in file_paths[len(source_files):]]
+        self.file_imports = [(file_path, loaded) for (file_path, _), loaded in zip(source_files, file_imports)]
+
+        if self.changed_since and not self.staged:
+            # Files importing a changed file can gain or lose violations too
+            changed = set(self.scope)
+            for (file_path, _), loaded in zip(source_files, file_imports):
+                if loaded and any(entry[2] in changed for entry in loaded[0]):
+                    self.scope.add(file_path)
+
+        with self.profiler.span("rules"):
+            for (file_path, layer), loaded in zip(source_files, file_imports):
+                if layer is not None and (self.scope is None or file_path in self.scope):
+                    self._apply_file_imports(file_path, layer, loaded)
+
+    def _streams_imports(self) -> bool:
+        """Whether rules can be applied to each file as it is resolved, without keeping the import table"""
+        # A shard reports its table for `merge`; a changed-since scope needs every importer first
+        return (self.violation_sink is not None and not self.graph_checks and not self.shard
+                and (self.staged or not self.changed_since))
+
+    def _stream_file_imports(self, source_files: List[Tuple[str, str]]) -> None:
+        """Apply the rules to each file's imports as they are resolved, keeping only the edge counts"""
+        layers = dict(source_files)
+        counts = self.streamed_edges = dict.fromkeys(IMPORT_KINDS, 0)
+
+        def apply(file_path: str, loaded: Optional[FileImports]) -> None:
+            if not loaded:
+                return
+            for entry in loaded[0]:
+                counts[entry[3]] += 1
+            layer = layers.get(file_path)
+            if layer is not None and (self.scope is None or file_path in self.scope):
+                self._apply_file_imports(file_path, layer, loaded)
+
+        self._load_file_imports([file_path for file_path, _ in source_files], evict=not self.staged,
+                                follow_stylesheets=not self.staged, on_loaded=apply)
+
+    def _shard_source_files(self, source_files: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Keep the source files of this shard, recording their positions in the full list"""
+        index, count = self.shard
+        self.shard_assignment = assign_shards([file_path for file_path, _ in source_files], self.base_dir, count,
+                                              self.shard_balance, self._file_size)
+        self.shard_files = [(position, file_path) for position, (file_path, _) in enumerate(source_files)
+                            if self.shard_assignment[file_path] == index]
+        return [(file_path, layer) for file_path, layer in source_files
+                if self.shard_assignment[file_path] == index]
+
+    def _in_shard(self, file_path: str) -> bool:
+        """Whether findings about a file belong to this shard (files that are not sources go by path hash)"""
+        shard = self.shard_assignment.get(file_path) or hash_shard(file_path, self.base_dir, self.shard[1])
+        return shard == self.shard[0]
+
+    def _file_size(self, file_path: str) -> int:
+        stat = self._stat(file_path)
+        return stat.st_size if stat else 0
+
+    def build_graph(self, runtime_only: Optional[bool] = None) -> ModuleGraph:
+        """
+        Build the module dependency graph of the files seen by analyze_imports.
+
+        Args:
+            runtime_only: Leave out type-only imports and test and story files,
+                          keeping what actually ships (defaults to the checker's setting)
+        """
+        if runtime_only is None:
+            runtime_only = self.runtime_only
+        file_imports = self.file_imports
+        if runtime_only:
+            file_imports = [(file_path, loaded) for file_path, loaded in file_imports
+                            if self.file_role(file_path) is None]
+        return ModuleGraph.build(
+            (file_path for file_path, _ in file_imports),
+            ((file_path, entry[2]) for file_path, loaded in file_imports if loaded
+             for entry in loaded[0] if entry[2] and not (runtime_only and entry[3] == TYPE_IMPORT)),
+        )
+
+    def _graph_stamp(self, runtime_only: bool) -> str:
+        """Fingerprint of the settings a module graph depends on"""
+        return hash_content(json.dumps(
+            [self._cache_stamp(), self.resolver.fingerprint(), self.layers, self.excludes,
+             self.ignore.gitignore, self.test_files, runtime_only], sort_keys=True
+        ).encode('utf-8'))
+
+    def graph_metadata(self, graph: ModuleGraph, runtime_only: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        What a saved graph needs to tell whether it is still current.
+
+        Besides the settings, this is the stat data of the graph's files and
+        of every directory the tree walk or resolution listed: adding,
+        removing or renaming an entry changes its directory's mtime.
+        """
+        if runtime_only is None:
+            runtime_only = self.runtime_only
+        directories = set(self.snapshot.directories) | self.resolver.listed_dirs
+        directories.update(os.path.dirname(file_path) for file_path in graph.paths)
+        directories = sorted(directories)
+        return {
+            "stamp": self._graph_stamp(runtime_only),
+            "directories": directories,
+            "fingerprint": tree_fingerprint(directories + graph.paths),
+        }
+
+    def graph_is_current(self, graph: ModuleGraph, runtime_only: Optional[bool] = None) -> bool:
+        """Whether a loaded graph was built with these settings from the tree as it is now"""
+        if runtime_only is None:
+            runtime_only = self.runtime_only
+        meta = graph.meta
+        if meta.get("stamp") != self._graph_stamp(runtime_only):
+            return False
+        return meta.get("fingerprint") == tree_fingerprint(meta["directories"] + graph.paths)
+
+    def edge_counts(self) -> Dict[str, int]:
+        """Number of resolved imports of each kind (runtime, type, side-effect, dynamic)"""
+        if self.streamed_edges is not None:
+            return dict(self.streamed_edges)
+        counts = dict.fromkeys(IMPORT_KINDS, 0)
+        for _, loaded in self.file_imports:
+            if loaded:
+                for entry in loaded[0]:
+                    counts[entry[3]] += 1
+        return counts
+
+    def analyze_cycles(self) -> None:
+        """Find import cycles between files, slices and layers"""
+        graph = self.build_graph()
+
+        def slice_key(file_path: str) -> Optional[str]:
+            layer, slice_name = self._get_layer_and_slice_from_path(file_path)
+            return f"{layer}/{slice_name}" if layer else None
+
+        self.cycles = {
+            "file": find_cycles(graph),
+            "slice": find_cycles(graph, slice_key),
+            "layer": find_cycles(graph, lambda file_path: self._get_layer_and_slice_from_path(file_path)[0]),
+        }
+
+    def analyze_lazy_boundaries(self) -> None:
+        """Find static imports that pull lazily loaded modules into the entry point's bundle"""
+        self.lazy_boundaries = check_lazy_boundaries(self.file_imports, self.entry)
+
+    def analyze_assets(self) -> None:
+        """Attribute the sizes of imported stylesheets, images, fonts and media to layers and slices"""
+        def owner(file_path: str) -> Optional[str]:
+            layer, slice_name = self._get_layer_and_slice_from_path(file_path)
+            if not layer:
+                return None
+            # Files at a layer root count towards the layer itself
+            return layer if os.path.dirname(file_path) == os.path.join(self.base_dir, layer) else f"{layer}/{slice_name}"
+
+        self.assets = AssetAnalyzer(self.file_imports, self._stat, owner).analyze()
+
+    def analyze_stylesheets(self) -> None:
+        """Rank the stylesheets by how many components recompile when they change"""
+        self.stylesheets = stylesheet_fan_in(self.file_imports)
+
+    def _read_index_blobs(self, file_paths: List[str]) -> List[bytes]:
+        """Read the staged content of files from the git index"""
+        blobs = read_blobs(self.base_dir, [self.git_hashes[file_path] for file_path in file_paths])
+        return [blobs.get(self.git_hashes[file_path], b"") for file_path in file_paths]
+
+    def _apply_file_imports(self, file_path: str, layer: str, loaded: Optional[FileImports]) -> None:
+        """Record the violations or the skip record of one file"""
+        if loaded is None:
+            return
+
+        imports, skipped = loaded
+        if skipped:
+            self.skipped_files.append({"file": file_path, **skipped})
+            return
+
+        violations = self._evaluate_imports(file_path, layer, imports)
+        if self.baseline:
+            violations = [violation for violation in violations
+                          if not self.baseline.accepts_import(file_path, violation[0], layer, violation[1])]
+        if self.violation_sink:
+            for import_path, target_layer, message in violations:
+                self.violation_sink(make_violation(file_path, import_path, layer, target_layer, message))
+                self.streamed_violations += 1
+        else:
+            for import_path, target_layer, message in violations:
+                self.import_violations.append(file_path, import_path, layer, target_layer, message)
+
+    def _cache_stamp(self) -> str:
+        """Fingerprint of everything cached import data depends on"""
+        # Specifiers are resolved on every run, so layers and resolver settings are not part of it
+        return hash_content(json.dumps(
+            [EXTRACTOR_VERSION, self.read_mode, self.dynamic_imports,
+             self.max_file_size, self.minified_line_length], sort_keys=True
+        ).encode('utf-8'))
+
+    def unloaded_stylesheets(self, loaded_files: List[Optional[FileImports]], known: Set[str]) -> List[str]:
+        """Stylesheets imported by the loaded files that are not in known yet (and are added to it)"""
+        found = []
+        for loaded in loaded_files:
+            if not loaded or loaded[1]:
+                continue
+            for entry in loaded[0]:
+                target = entry[2]
+                if target and target.endswith(STYLESHEET_EXTENSIONS) and target not in known:
+                    known.add(target)
+                    found.append(target)
+        return found
+
+    def _load_file_imports(self, file_paths: List[str], evict: bool = True,
+                           follow_stylesheets: bool = False,
+                           specifiers: Optional[List[Optional[FileSpecifiers]]] = None,
+                           on_loaded: Optional[Callable[[str, Optional[FileImports]], None]] = None
+                           ) -> List[Optional[FileImports]]:
+        """
+        Get the resolved imports of each file, reusing cached extraction where possible.
+
+        Only the extracted specifiers are cached; they are resolved on every
+        run, since creating, deleting or renaming a target changes where an
+        import points without touching the importer.
+
+        Args:
+            file_paths: Files to load
+            evict: Drop cache entries of files not in file_paths (only for full scans)
+            follow_stylesheets: Also load the stylesheets the files import that are
+                                not in file_paths (such as global styles outside the
+                                layers), appending them to file_paths
+            specifiers: If given, receives the unresolved specifiers of each file,
+                        parallel to the result
+            on_loaded: If given, called with each file and its resolved imports as
+                       soon as they are resolved, instead of collecting them
+
+        Returns a list parallel to file_paths (empty with on_loaded); entries are
+        None for files that could not be processed.
+        """
+        with self.profiler.span("cache_load"):
+            cache = ImportCache(self.cache_dir, self._cache_stamp()) if self.cache_dir else None
+        results: List[Optional[FileImports]] = []
+        known = set(file_paths)
+        followed: List[str] = []
+
+        def collect(file_path: str, imports: Optional[FileImports]) -> None:
+            if on_loaded is None:
+                results.append(imports)
+            else:
+                on_loaded(file_path, imports)
+            if follow_stylesheets:
+                followed.extend(self.unloaded_stylesheets([imports], known))
+
+        start = 0
+        while start < len(file_paths):
+            end = len(file_paths)
+            self._load_round(cache, file_paths, start, collect, specifiers)
+            file_paths.extend(followed)
+            followed.clear()
+            start = end
+
+        if cache:
+            with self.profiler.span("cache_save"):
+                if evict:
+                    cache.evict_missing(file_paths)
+                cache.save()
+
+        return results
+
+    def _load_round(self, cache: Optional[ImportCache], file_paths: List[str], start: int,
+                    collect: Callable[[str, Optional[FileImports]], None],
+                    specifiers: Optional[List[Optional[FileSpecifiers]]] = None) -> None:
+        """
+        Load the imports of file_paths[start:] from the cache or by reading the
+        files, and pass each file with its resolved imports to collect, in order.
+        """
+        results: List[Optional[FileSpecifiers]] = [None] * (len(file_paths) - start)
+        pending: List[Tuple[int, Optional[os.stat_result]]] = []
+
+        for index, file_path in enumerate(file_paths[start:]):
+            stat = None
+            if cache:
+                git_hash = self.git_hashes.get(file_path)
+                if git_hash and cache.known_digest(file_path) == git_hash:
+                    # Blob SHA from git matches: no stat or read needed
+                    results[index] = cache.cached_result(file_path)
+                    continue
+                if file_path in self.blob_contents:
+                    # Index content differs from the working tree, stat data does not apply
+                    pending.append((index, None))
+                    continue
+                stat = self._stat(file_path)
+                if stat is not None:
+                    cached = cache.lookup(file_path, stat)
+                    if cached is not None:
+                        results[index] = cached
+                        continue
+            pending.append((index, stat))
+
+        requests = [(file_paths[start + index], cache.known_digest(file_paths[start + index]) if cache else None)
+                    for index, _ in pending]
+        with self.profiler.span("read_files", files=len(requests)):
+            extracted_files = self._read_files(requests)
+
+        for (index, stat), extracted in zip(pending, extracted_files):
+            if extracted is None:
+                continue
+
+            file_path = file_paths[start + index]
+            digest, loaded = extracted
+            if loaded is None:
+                # Content unchanged since it was cached, only the stat data moved
+                loaded = cache.cached_result(file_path)
+            results[index] = loaded
+            if cache and stat is not None:
+                cache.store(file_path, stat, digest, loaded)
+
+        if specifiers is not None:
+            specifiers.extend(results)
+        with self.profiler.span("resolve_files", files=len(results)):
+            for file_path, loaded in zip(file_paths[start:], results):
+                collect(file_path, self.resolve_file(file_path, loaded))
+
+    def _stat(self, file_path: str) -> Optional[os.stat_result]:
+        """Stat data of a file, from the snapshot when it has it (and added to it otherwise)"""
+        stat = self.snapshot.stats.get(file_path)
+        if stat is None:
+            try:
+                stat = self.snapshot.stats[file_path] = os.stat(file_path)
+            except OSError:
+                pass
+        return stat
+
+    def _read_files(self, requests: List[Tuple[str, Optional[str]]]) -> List[Optional[Tuple[str, Optional[FileSpecifiers]]]]:
+        """Read and extract files serially or in batches over a process pool, keeping order"""
+        if self.jobs <= 1 or len(requests) <= self.PARALLEL_BATCH_SIZE:
+            return [self._read_file_specifiers(file_path, known_digest) for file_path, known_digest in requests]
+
+        batch_size = self.PARALLEL_BATCH_SIZE
+        batches = [requests[i:i + batch_size] for i in range(0, len(requests), batch_size)]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=min(self.jobs, len(batches)),
+                                 initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            # map() yields batch results in submission order
+            for batch_results, profile_records in executor.map(_read_files_batch, batches):
+                results.extend(batch_results)
+                self.profiler.merge(profile_records)
+        return results
+
+    def resolve_file(self, file_path: str, loaded: Optional[FileSpecifiers]) -> Optional[FileImports]:
+        """Resolve the extracted specifiers of a file against the current tree"""
+        if loaded is None:
+            return None
+        specifiers, skipped = loaded
+        if skipped:
+            return [], skipped
+        if not self.profiler.enabled:
+            return self._resolve_specifiers(file_path, specifiers), None
+        started = time.perf_counter()
+        imports = self._resolve_specifiers(file_path, specifiers)
+        self.profiler.record_file_phase(file_path, "resolve", started, time.perf_counter() - started)
+        return imports, None
+
+    def resolution_directories(self, file_path: str, loaded: Optional[FileSpecifiers]) -> FrozenSet[str]:
+        """Directories whose contents the resolution of a file's extracted specifiers depends on"""
+        if loaded is None or loaded[1]:
+            return frozenset()
+        importer_dir = os.path.dirname(file_path)
+        stylesheet = file_path.endswith(STYLESHEET_EXTENSIONS)
+        directories: Set[str] = set()
+        for import_path, _ in loaded[0]:
+            directories.update(self.resolver.probed_directories(import_path, importer_dir, stylesheet))
+        return frozenset(directories)
+
+    def _read_file_specifiers(self, file_path: str,
+                              known_digest: Optional[str] = None) -> Optional[Tuple[str, Optional[FileSpecifiers]]]:
+        """
+        Read a file and extract its import specifiers, unresolved.
+
+        Returns a (content_hash, file_specifiers) pair, where file_specifiers is None
+        if the content hash equals known_digest, or None if the file cannot be read.
+        """
+        profiling = self.profiler.enabled
+        stylesheet = file_path.endswith(STYLESHEET_EXTENSIONS)
+        try:
+            if profiling:
+                started = time.perf_counter()
+            if file_path in self.blob_contents:
+                data = self.blob_contents[file_path]
+                if self.max_file_size and len(data) > self.max_file_size:
+                    raise SkippedFile("oversized",
+                                      f"File size {len(data)} bytes exceeds the {self.max_file_size} byte cap")
+                digest, content, extra_imports = decode_source(data, self.minified_line_length)
+            else:
+                digest, content, extra_imports = read_source(
+                    file_path,
+                    # Stylesheet rules are not confined to a header
+                    header_only=self.read_mode == "header" and not stylesheet,
+                    dynamic_imports=self.dynamic_imports,
+                    max_file_size=self.max_file_size,
+                    minified_line_length=self.minified_line_length,
+                )
+            if digest == known_digest:
+                return digest, None
+
+            if not profiling:
+                return digest, (self._extract_specifiers(file_path, content, extra_imports), None)
+
+            read_done = time.perf_counter()
+            specifiers = self._extract_specifiers(file_path, content, extra_imports)
+            self.profiler.record_file(file_path, started, (read_done - started, time.perf_counter() - read_done))
+            return digest, (specifiers, None)
+        except SkippedFile as e:
+            return "", ([], {"type": e.kind, "message": e.message})
+        except Exception as e:
+            print(f"Error processing file {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def _extract_specifiers(file_path: str, content: str,
+                            extra_imports: Optional[List[Tuple[str, str]]] = None) -> List[Tuple[str, str]]:
+        """(specifier, kind) pairs of a script or stylesheet"""
+        if file_path.endswith(STYLESHEET_EXTENSIONS):
+            return extract_stylesheet_imports(content)
+        return extract_imports(content) + (extra_imports or [])
+
+    def _resolve_specifiers(self, file_path: str, specifiers: List[Tuple[str, str]]) -> List[List[Any]]:
+        """Resolve a file's (specifier, kind) pairs to [import_path, target_layer, resolved_file, kind] entries"""
+        importer_dir = os.path.dirname(file_path)
+        stylesheet = file_path.endswith(STYLESHEET_EXTENSIONS)
+        resolve = self.resolver.resolve_stylesheet if stylesheet else self.resolver.resolve
+
+        imports = []
+        for import_path, kind in specifiers:
+            resolved_file = resolve(import_path, importer_dir)
+            target_path = resolved_file
+            if target_path is None:
+                # Missing file: classify by where the specifier points
+                candidates = self.resolver.candidates(import_path, importer_dir)
+                if stylesheet and not import_path.startswith('.'):
+                    # Sass looks next to the stylesheet first
+                    candidates.insert(0, os.path.join(importer_dir, import_path.lstrip('~')))
+                target_path = os.path.normpath(candidates[0]) if candidates else None
+
+            target_layer = self._get_layer_and_slice_from_path(target_path)[0] if target_path else None
+            if resolved_file or target_layer:
+                # Packages and paths outside the project are dropped
+                imports.append([import_path, target_layer, resolved_file, kind])
+        return imports
+
+    def _evaluate_imports(self, file_path: str, layer: str,
+                          imports: List[List[Any]]) -> List[Tuple[str, str, Optional[str]]]:
+        """Return (import_path, target_layer, message) of each resolved import that breaks the rules"""
+        if self.runtime_only:
+            imports = [entry for entry in imports if entry[3] != TYPE_IMPORT]
+        return self.rules.evaluate(file_path, layer, imports)
+
+    def generate_report(self) -> Dict[str, Any]:
+        """Generate a comprehensive report of FSD violations"""
+        report = {
+            "structure": {
+                "layers": {layer: modules for layer, modules in self.layer_modules.items()},
+                "missing_layers": self.missing_layers,
+                "directory_violations": self.directory_violations
+            },
+            "imports": {
+                "violations": self.import_violations,
+                "total": len(self.import_violations) + self.streamed_violations,
+                "skipped": self.skipped_files,
+                "edges": self.edge_counts()
+            },
+            "cycles": self.cycles,
+            "lazy": self.lazy_boundaries,
+            "assets": self.assets,
+            "stylesheets": self.stylesheets,
+            "rules": {
+                "allowed_access": self.allowed_access
+            }
+        }
+        if self.rules.slice_rules:
+            report["rules"]["slice_rules"] = self.rules.slice_rules
+        if self.runtime_only:
+            report["rules"]["runtime_only"] = True
+        if self.baseline:
+            report["baseline"] = {
+                "file": self.baseline.path,
+                "suppressed": self.baseline.suppressed,
+                # Only a full check can tell which accepted violations are gone
+                "resolved": len(self.baseline.resolved()) if self.is_full_check() else None,
+            }
+        if self.shard:
+            report["shard"] = self.shard_summary()
+        return report
+
+    def shard_summary(self) -> Dict[str, Any]:
+        """What `merge` needs of a shard besides its findings: its files and their resolved imports"""
+        index, count = self.shard
+        return {
+            "index": index,
+            "count": count,
+            "balance": self.shard_balance,
+            "base_dir": self.base_dir,
+            "layers": self.layers,
+            "entry": self.entry,
+            "test_files": self.test_files,
+            "files": self.shard_files,
+            "file_imports": self.file_imports,
+            "directory_positions": self.directory_positions,
+            "baseline": {
+                "fingerprints": len(self.baseline.fingerprints),
+                "matched": sorted(self.baseline.matched),
+                "complete": self._sees_every_violation(),
+            } if self.baseline else None,
+        }
+
+    def is_full_check(self) -> bool:
+        """
+        Whether this check found every violation the baseline can accept.
+
+        Only then are the baseline entries it did not match resolved. Checks
+        of some files (changed, staged or one shard), of runtime imports only,
+        without test files or extra excluded paths, or with skipped files miss
+        violations that may still be in the tree.
+        """
+        return not self.shard and self._sees_every_violation()
+
+    def _sees_every_violation(self) -> bool:
+        """is_full_check, leaving out the shard: a check whose shards together see everything"""
+        return (self.scope is None
+                and not self.runtime_only
+                and self.test_files == "include"
+                and set(self.excludes) <= set(DEFAULT_EXCLUDES)
+                and not self.skipped_files)
+
+    def run_checks(self) -> Dict[str, Any]:
+        """Run all checks and generate report"""
+        if self._snapshot is None:
+            self.collect_layers_structure()
+        with self.profiler.span("structure"):
+            self.check_directory_structure()
+        self.analyze_imports()
+        # The graph of a shard is partial; `merge` analyzes the combined one
+        if self.graph_checks and not self.shard:
+            with self.profiler.span("cycles"):
+                self.analyze_cycles()
+            with self.profiler.span("lazy"):
+                self.analyze_lazy_boundaries()
+            with self.profiler.span("assets"):
+                self.analyze_assets()
+            with self.profiler.span("stylesheets"):
+                self.analyze_stylesheets()
+
+        directory_violations = list(enumerate(self.directory_violations))
+        if self.shard:
+            directory_violations = [(position, v) for position, v in directory_violations if self._in_shard(v["file"])]
+        if self.scope is not None:
+            directory_violations = [(position, v) for position, v in directory_violations if v["file"] in self.scope]
+        if self.baseline:
+            directory_violations = [(position, v) for position, v in directory_violations
+                                    if not self.baseline.accepts_directory(v)]
+        self.directory_violations = [v for _, v in directory_violations]
+        self.directory_positions = [position for position, _ in directory_violations]
+        return self.generate_report()
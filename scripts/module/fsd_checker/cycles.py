@@ -0,0 +1,152 @@
+"""
+Import cycle detection for the FSD Architecture Checker.
+
+Cycles are the strongly connected components of the module graph, found
+with an iterative version of Tarjan's algorithm (linear time, no
+recursion). The graph can first be collapsed to slices or layers, so the
+same pass finds file, slice and layer cycles. Each cycle comes with the
+shortest example path through its first member.
+"""
+
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from .graph import ModuleGraph
+
+Successors = Callable[[int], Sequence[int]]
+
+
+def strongly_connected_components(node_count: int, successors: Successors) -> List[List[int]]:
+    """Return the strongly connected components of a graph, in reverse topological order"""
+    index = [-1] * node_count
+    low = [0] * node_count
+    on_stack = [False] * node_count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(node_count):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(successors(root)))]
+
+        while work:
+            node, edges = work[-1]
+            for successor in edges:
+                if index[successor] == -1:
+                    # Descend; the rest of this node's edges are resumed later
+                    index[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack[successor] = True
+                    work.append((successor, iter(successors(successor))))
+                    break
+                if on_stack[successor] and index[successor] < low[node]:
+                    low[node] = index[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def shortest_cycle(start: int, members: Set[int], successors: Successors) -> List[int]:
+    """Shortest path from start back to itself inside a component, as a node list ending at start"""
+    parents: Dict[int, int] = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for successor in successors(node):
+            if successor == start:
+                path = [start, node]
+                while node != start:
+                    node = parents[node]
+                    path.append(node)
+                path.reverse()
+                return path
+            if successor in members and successor not in parents:
+                parents[successor] = node
+                queue.append(successor)
+    return [start]
+
+
+def _group_graph(graph: ModuleGraph, key_of: Callable[[str], Optional[str]]) -> Tuple[List[str], List[List[int]]]:
+    """Collapse files into groups (e.g. slices) and return group labels and adjacency"""
+    labels: List[str] = []
+    group_ids: Dict[str, int] = {}
+    node_groups: List[int] = []
+    for path in graph.paths:
+        key = key_of(path)
+        if key is None:
+            node_groups.append(-1)
+            continue
+        group = group_ids.get(key)
+        if group is None:
+            group = group_ids[key] = len(labels)
+            labels.append(key)
+        node_groups.append(group)
+
+    edges: List[Set[int]] = [set() for _ in labels]
+    for node, group in enumerate(node_groups):
+        if group == -1:
+            continue
+        for target in graph.dependencies(node):
+            target_group = node_groups[target]
+            if target_group != -1 and target_group != group:
+                edges[group].add(target_group)
+
+    return labels, [sorted(targets) for targets in edges]
+
+
+def find_cycles(graph: ModuleGraph, key_of: Optional[Callable[[str], Optional[str]]] = None) -> List[Dict]:
+    """
+    Find import cycles.
+
+    Args:
+        graph: Module graph to search
+        key_of: Maps a file path to its group (slice, layer); files mapped
+                to None are ignored. Cycles are between files if None.
+
+    Returns:
+        One entry per cycle with its sorted members, size and an example
+        path that starts and ends at the first member; largest cycles first
+    """
+    if key_of is None:
+        labels = graph.paths
+        successors: Successors = graph.dependencies
+    else:
+        labels, adjacency = _group_graph(graph, key_of)
+        successors = adjacency.__getitem__
+
+    cycles = []
+    for component in strongly_connected_components(len(labels), successors):
+        if len(component) < 2:
+            continue
+        start = min(component, key=lambda node: labels[node])
+        path = shortest_cycle(start, set(component), successors)
+        cycles.append({
+            "members": sorted(labels[node] for node in component),
+            "size": len(component),
+            "path": [labels[node] for node in path],
+        })
+
+    cycles.sort(key=lambda cycle: (-cycle["size"], cycle["members"][0]))
+    return cycles
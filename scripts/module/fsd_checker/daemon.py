@@ -0,0 +1,429 @@
+"""
+Long-running daemon for the FSD Architecture Checker.
+
+The daemon keeps the layer map and the per-file import table in memory,
+refreshes them by polling file mtimes and answers requests over a local
+Unix socket using newline-delimited JSON messages.
+"""
+
+import copy
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .baseline import Baseline
+from .core import FSDChecker, report_exit_code
+from .violations import ImportViolationTable, json_default
+
+DEFAULT_SOCKET_PATH = os.path.join(".fsd-cache", "daemon.sock")
+
+# Directories modified this close to a resolution are resolved against
+# again on the next refresh: an entry added in the same mtime tick would
+# not change the recorded mtime
+RACY_WINDOW_NS = 2 * 10**9
+
+# Some platforms (older Windows builds of Python) have no Unix domain sockets
+UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+UNIX_SOCKETS_ERROR = "the FSD Checker daemon needs Unix domain sockets, which this platform does not support"
+
+
+def _directory_mtime(directory: str) -> Optional[int]:
+    """mtime of a directory in nanoseconds, or None if it does not exist"""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ImportIndex:
+    """
+    In-memory table of the imports of every source file.
+
+    Each entry stores the file's mtime and size, its extracted specifiers,
+    their resolution and the directories the resolution listed. A refresh
+    only re-reads files whose stat data changed, and only resolves an
+    unchanged file again if one of its directories changed since (adding,
+    moving or deleting a target changes where an unchanged importer's
+    imports point) or the layer or resolver settings did.
+    """
+
+    def __init__(self, checker_options: Dict[str, Any],
+                 load_options: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Initialize and build the index.
+
+        Args:
+            checker_options: Keyword arguments used to construct FSDChecker
+            load_options: Called on every build and refresh for the FSDChecker
+                          keyword arguments read from files (rules, baseline),
+                          so edits to those files apply without a restart
+        """
+        self.checker_options = checker_options
+        self.load_options = load_options
+        self.lock = threading.Lock()
+        # Serializes refreshes from the poller and from check requests
+        self.refresh_lock = threading.RLock()
+        self.checker: Optional[FSDChecker] = None
+        # Accepted violations; each report matches against its own copy
+        self.baseline: Optional[Baseline] = None
+        self.source_files: List[Tuple[str, str]] = []
+        # [mtime_ns, size, specifiers, resolved imports, resolution directories] of each file
+        self.files: Dict[str, List[Any]] = {}
+        # Settings the resolved imports were computed with
+        self.resolution_stamp: Optional[str] = None
+        # mtime of each directory some resolution listed, and when they were taken
+        self.directory_mtimes: Dict[str, Optional[int]] = {}
+        self.resolved_at = 0
+
+        self.build()
+
+    def _create_checker(self) -> Tuple[FSDChecker, Optional[Baseline]]:
+        """Checker of a new scan, and the baseline its reports are filtered by"""
+        options = dict(self.checker_options)
+        if self.load_options:
+            options.update(self.load_options())
+        # The scan keeps every violation; reports leave out the accepted ones
+        baseline = options.pop("baseline", None)
+        return FSDChecker(**options), baseline
+
+    def _record_directories(self, checker: FSDChecker, files: Dict[str, List[Any]],
+                            directory_mtimes: Dict[str, Optional[int]], started: int) -> None:
+        """Remember the directories the entries in files depend on, reusing the mtimes already taken"""
+        directories: Set[str] = set()
+        for entry in files.values():
+            directories.update(entry[4])
+        self.resolution_stamp = checker._graph_stamp(False)
+        self.directory_mtimes = {
+            directory: directory_mtimes[directory] if directory in directory_mtimes else _directory_mtime(directory)
+            for directory in directories
+        }
+        self.resolved_at = started
+
+    def _stale_directories(self, checker: FSDChecker) -> Tuple[Optional[Set[str]], Dict[str, Optional[int]]]:
+        """
+        Directories changed since the last resolution, or None if every file
+        needs resolving again, and the mtimes taken of the known directories.
+        """
+        if checker._graph_stamp(False) != self.resolution_stamp:
+            return None, {}
+        directory_mtimes = {directory: _directory_mtime(directory) for directory in self.directory_mtimes}
+        racy = self.resolved_at - RACY_WINDOW_NS
+        stale = {
+            directory for directory, mtime in self.directory_mtimes.items()
+            if directory_mtimes[directory] != mtime or (mtime is not None and mtime > racy)
+        }
+        return stale, directory_mtimes
+
+    def build(self) -> None:
+        """Scan the whole tree and extract every file's imports"""
+        with self.refresh_lock:
+            self._build()
+
+    def _build(self) -> None:
+        started = time.time_ns()
+        checker, baseline = self._create_checker()
+        checker.check_directory_structure()
+        source_files = checker.collect_source_files()
+        file_paths = [file_path for file_path, _ in source_files]
+        specifiers: List[Any] = []
+        file_imports = checker._load_file_imports(file_paths, follow_stylesheets=True, specifiers=specifiers)
+        source_files += [(file_path, None) for file_path in file_paths[len(source_files):]]
+
+        files = {}
+        for file_path, loaded, imports in zip(file_paths, specifiers, file_imports):
+            stat = checker._stat(file_path)
+            if stat is None:
+                continue
+            files[file_path] = [stat.st_mtime_ns, stat.st_size, loaded, imports,
+                                checker.resolution_directories(file_path, loaded)]
+
+        self._record_directories(checker, files, {}, started)
+        with self.lock:
+            self.checker = checker
+            self.baseline = baseline
+            self.source_files = source_files
+            self.files = files
+
+    def refresh(self) -> int:
+        """
+        Reload the rules and the baseline, re-scan the layer map, re-extract
+        files whose mtime or size changed and resolve them, and the unchanged
+        files whose targets may have moved, against the new tree.
+
+        Returns:
+            Number of files added, changed or removed
+        """
+        with self.refresh_lock:
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        started = time.time_ns()
+        checker, baseline = self._create_checker()
+        checker.check_directory_structure()
+        source_files = checker.collect_source_files()
+        stale, directory_mtimes = self._stale_directories(checker)
+
+        with self.lock:
+            previous = self.files
+
+        files = {}
+        changed = 0
+        pending = [file_path for file_path, _ in source_files]
+        known = set(pending)
+        while pending:
+            loaded_files = []
+            for file_path in pending:
+                # Stat data comes from the snapshot the checker just took
+                stat = checker._stat(file_path)
+                if stat is None:
+                    continue
+
+                entry = previous.get(file_path)
+                if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+                    extracted = checker._read_file_specifiers(file_path)
+                    loaded = extracted[1] if extracted else None
+                    changed += 1
+                elif stale is not None and stale.isdisjoint(entry[4]):
+                    # Nothing the resolution looked at changed
+                    files[file_path] = entry
+                    loaded_files.append(entry[3])
+                    continue
+                else:
+                    loaded = entry[2]
+                entry = files[file_path] = [stat.st_mtime_ns, stat.st_size, loaded,
+                                            checker.resolve_file(file_path, loaded),
+                                            checker.resolution_directories(file_path, loaded)]
+                loaded_files.append(entry[3])
+
+            # Stylesheets outside the layers, loaded by the files just visited
+            pending = checker.unloaded_stylesheets(loaded_files, known)
+            source_files += [(file_path, None) for file_path in pending]
+
+        changed += len(set(previous) - set(files))
+
+        self._record_directories(checker, files, directory_mtimes, started)
+        with self.lock:
+            self.checker = checker
+            self.baseline = baseline
+            self.source_files = source_files
+            self.files = files
+
+        return changed
+
+    def refresh_files(self, file_paths: List[str]) -> None:
+        """
+        Re-extract the given files if they changed and resolve them against the
+        current tree, falling back to a full refresh for unknown files.
+        """
+        with self.refresh_lock:
+            self._refresh_files(file_paths)
+
+    def _refresh_files(self, file_paths: List[str]) -> None:
+        with self.lock:
+            checker = copy.copy(self.checker)
+            files = self.files
+        known = {os.path.abspath(file_path): file_path for file_path in files}
+        # Targets may have appeared or gone since the last refresh
+        checker.resolver = checker.resolver.fresh()
+
+        updates = {}
+        for file_path in file_paths:
+            indexed_path = known.get(os.path.abspath(file_path))
+            if indexed_path is None:
+                self._refresh()
+                return
+
+            try:
+                stat = os.stat(indexed_path)
+            except OSError:
+                self._refresh()
+                return
+
+            entry = files.get(indexed_path)
+            if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+                extracted = checker._read_file_specifiers(indexed_path)
+                loaded = extracted[1] if extracted else None
+            else:
+                loaded = entry[2]
+            updates[indexed_path] = [stat.st_mtime_ns, stat.st_size, loaded,
+                                     checker.resolve_file(indexed_path, loaded),
+                                     checker.resolution_directories(indexed_path, loaded)]
+
+        if updates:
+            for entry in updates.values():
+                for directory in entry[4]:
+                    if directory not in self.directory_mtimes:
+                        self.directory_mtimes[directory] = _directory_mtime(directory)
+            with self.lock:
+                files = dict(self.files)
+                files.update(updates)
+                self.files = files
+
+    def report(self, only_files: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Build a check report from the index.
+
+        Args:
+            only_files: Restrict violations to these files (all files if None)
+        """
+        with self.lock:
+            # Shallow copy: the layer map is shared, violation lists are not
+            checker = copy.copy(self.checker)
+            baseline = self.baseline
+            source_files = self.source_files
+            files = self.files
+
+        selected = None
+        if only_files is not None:
+            selected = {os.path.abspath(file_path) for file_path in only_files}
+
+        checker.import_violations = ImportViolationTable()
+        checker.skipped_files = []
+        if baseline:
+            checker.baseline = Baseline(baseline.base_dir, baseline.fingerprints, path=baseline.path)
+        if selected is not None:
+            checker.scope = {file_path for file_path, _ in source_files if os.path.abspath(file_path) in selected}
+            checker.directory_violations = [
+                v for v in checker.directory_violations if os.path.abspath(v["file"]) in selected
+            ]
+        if checker.baseline:
+            checker.directory_violations = [
+                v for v in checker.directory_violations if not checker.baseline.accepts_directory(v)
+            ]
+
+        for file_path, layer in source_files:
+            if selected is not None and os.path.abspath(file_path) not in selected:
+                continue
+            entry = files.get(file_path)
+            if entry and layer is not None:
+                checker._apply_file_imports(file_path, layer, entry[3])
+
+        if selected is None:
+            checker.file_imports = [(file_path, files[file_path][3])
+                                    for file_path, _ in source_files if file_path in files]
+            checker.analyze_cycles()
+            checker.analyze_lazy_boundaries()
+            checker.analyze_assets()
+            checker.analyze_stylesheets()
+
+        return checker.generate_report()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one newline-delimited JSON request per connection"""
+
+    def handle(self) -> None:
+        request: Dict[str, Any] = {}
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8'))
+            response = self.server.dispatch(request)
+        except Exception as e:
+            response = {"error": str(e)}
+
+        self.wfile.write(json.dumps(response, default=json_default).encode('utf-8') + b"\n")
+        self.wfile.flush()
+
+        if request.get("command") == "shutdown":
+            # Stop only after the client has its answer
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+# socketserver only defines UnixStreamServer where AF_UNIX exists; FSDDaemon refuses to start elsewhere
+_StreamServer = socketserver.UnixStreamServer if UNIX_SOCKETS else socketserver.BaseServer
+
+
+class FSDDaemon(socketserver.ThreadingMixIn, _StreamServer):
+    """Unix-socket server answering check requests from an ImportIndex"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, index: ImportIndex, poll_interval: float = 1.0):
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+            index: Import index to answer requests from
+            poll_interval: Seconds between mtime polls of the tree
+
+        Raises:
+            OSError: If the platform has no Unix domain sockets
+        """
+        if not UNIX_SOCKETS:
+            raise OSError(UNIX_SOCKETS_ERROR)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        socket_dir = os.path.dirname(socket_path)
+        if socket_dir:
+            os.makedirs(socket_dir, exist_ok=True)
+
+        super().__init__(socket_path, _RequestHandler)
+        self.socket_path = socket_path
+        self.index = index
+        self.poll_interval = poll_interval
+        self._stopped = threading.Event()
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a decoded request"""
+        command = request.get("command")
+
+        if command == "report":
+            report = self.index.report()
+        elif command == "check":
+            # Pick up edits made since the last poll before answering
+            self.index.refresh_files(request.get("files", []))
+            report = self.index.report(request.get("files", []))
+        elif command == "shutdown":
+            return {"status": "stopping"}
+        else:
+            return {"error": f"Unknown command: {command}"}
+
+        return {"report": report, "exit_code": report_exit_code(report)}
+
+    def _poll(self) -> None:
+        """Refresh the index periodically until the server stops"""
+        while not self._stopped.wait(self.poll_interval):
+            try:
+                self.index.refresh()
+            except Exception as e:
+                print(f"Error refreshing index: {e}")
+
+    def serve(self) -> None:
+        """Serve requests until shut down"""
+        poller = threading.Thread(target=self._poll, daemon=True)
+        poller.start()
+        try:
+            self.serve_forever()
+        finally:
+            self._stopped.set()
+            self.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def send_request(socket_path: str, request: Dict[str, Any], timeout: float = 30.0) -> Dict[str, Any]:
+    """
+    Send a request to a running daemon and return its decoded response.
+
+    Raises:
+        OSError: If the daemon cannot be reached or the platform has no Unix domain sockets
+    """
+    if not UNIX_SOCKETS:
+        raise OSError(UNIX_SOCKETS_ERROR)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode('utf-8') + b"\n")
+
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    return json.loads(b"".join(chunks).decode('utf-8'))
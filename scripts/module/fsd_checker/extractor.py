@@ -0,0 +1,272 @@
+"""
+Import extraction for the FSD Architecture Checker.
+
+A single precompiled pattern walks the source once and yields comments,
+template literals and string literals as whole tokens. Every string
+literal is a candidate module specifier; it is kept when the code right
+before it is `from`, `import`, `import(` or `require(`. This covers
+`import ... from`, `export ... from`, bare `import '...'`, dynamic
+`import('...')` and `require('...')`, including specifier lists spread
+over several lines, while keywords inside comments and strings are never
+seen. Regex literals are skipped whole too, so a quote or backtick in one
+does not open a string.
+
+Each specifier is tagged with the kind of import:
+
+    runtime      loads the module with the importer (`require()` included)
+    type         type-only, erased at build time: `import type`,
+                 `export type ... from`, and lists whose every item is an
+                 inline `type X`
+    side-effect  bare `import '...'`, loading the module for its side effects
+    dynamic      `import('...')`, loading the module on demand in a separate chunk
+
+Only `from` specifiers look further back than the keyword, to the start
+of their statement, to tell type-only lists from runtime ones.
+
+Stylesheets have their own single-pass token pattern: the targets of
+`@use`, `@forward` and `@import` rules and of `url()` references are
+runtime imports, while comments and strings elsewhere are skipped whole.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+# Kinds of import edges
+RUNTIME_IMPORT = "runtime"
+TYPE_IMPORT = "type"
+SIDE_EFFECT_IMPORT = "side-effect"
+DYNAMIC_IMPORT = "dynamic"
+IMPORT_KINDS = (RUNTIME_IMPORT, TYPE_IMPORT, SIDE_EFFECT_IMPORT, DYNAMIC_IMPORT)
+
+# Every token starts with one of / ` ' " so the regex engine can skip
+# ahead to candidates without trying a match at every position. Regex
+# literals are not tokens (telling them from divisions needs the code
+# before them); extract_imports looks for one only when a `/` precedes a
+# token on its line.
+SOURCE_TOKEN_RE = re.compile(r'''
+    //[^\n]*                                # line comment
+  | /\*[^*]*\*+(?:[^/*][^*]*\*+)*/          # block comment
+  | `(?:\\.|[^`\\])*`                       # template literal
+  | '(?P<single>(?:\\.|[^'\\\n])*)'         # single-quoted string
+  | "(?P<double>(?:\\.|[^"\\\n])*)"         # double-quoted string
+''', re.VERBOSE)
+
+# One item of the static header of a module: whitespace, a comment, a
+# directive such as 'use client', or an import/export-from statement.
+# Specifier lists may span lines and contain comments.
+HEADER_ITEM_RE = re.compile(r'''
+    \s+
+  | //[^\n]*\n
+  | /\*[^*]*\*+(?:[^/*][^*]*\*+)*/
+  | (?:'[^'\\\n]*'|"[^"\\\n]*")[ \t]*;?                            # directive
+  | (?:import|export)\b
+    (?:[\w\s{},*$]|//[^\n]*\n|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/)*?
+    \bfrom\s*(?:'[^'\\\n]*'|"[^"\\\n]*")[ \t]*;?                     # import/export ... from
+  | import\s*(?:'[^'\\\n]*'|"[^"\\\n]*")[ \t]*;?                     # side-effect import
+''', re.VERBOSE)
+
+# One token of a stylesheet: a comment, a rule loading other stylesheets,
+# a url() reference or a string. `//` only starts a comment outside url().
+STYLESHEET_TOKEN_RE = re.compile(r'''
+    //[^\n]*
+  | /\*[^*]*\*+(?:[^/*][^*]*\*+)*/
+  | @(?:use|forward|import)\b(?P<targets>\s*(?:'[^'\n]*'|"[^"\n]*")(?:\s*,\s*(?:'[^'\n]*'|"[^"\n]*"))*)
+  | \burl\(\s*(?:'(?P<single>[^'\n]*)'|"(?P<double>[^"\n]*)"|(?P<bare>[^'")\s]*))\s*\)
+  | '(?:\\.|[^'\\\n])*'
+  | "(?:\\.|[^"\\\n])*"
+''', re.VERBOSE)
+
+_QUOTED_RE = re.compile(r'''['"]([^'"\n]*)['"]''')
+
+# Stylesheet references that are not project files: built-in Sass modules, remote and inline resources
+_EXTERNAL_PREFIXES = ('sass:', 'http:', 'https:', '//', 'data:', '/')
+
+# Characters that make a preceding keyword part of a longer name (foo.import, reimport)
+_IDENTIFIER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$.")
+
+# Characters and keywords after which a `/` starts a regex literal rather than a division
+_REGEX_PRECEDERS = frozenset("(,=:[!&|?{};")
+_REGEX_KEYWORDS = frozenset(("return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw",
+                             "case", "do", "else", "yield", "await"))
+_TRAILING_WORD_RE = re.compile(r'[\w$]+$')
+
+# A regex literal: escapes, character classes (which may hold a `/`) and other characters up to the closing `/`
+_REGEX_LITERAL_RE = re.compile(r'/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/')
+
+# How far back to look for the keyword in front of a string literal
+_LOOKBEHIND = 64
+
+# How far back from `from` to look for the import/export keyword of its statement
+_STATEMENT_LOOKBEHIND = 4096
+
+_COMMENT_RE = re.compile(r'//[^\n]*|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/')
+
+# `type {`, `type *` or `type Name` right after import/export (not a default import named type)
+_TYPE_CLAUSE_RE = re.compile(r'\s*type(?:\s*[{*]|\s+[\w$]+\s*$)')
+
+
+def _ends_with_keyword(text: str, keyword: str) -> bool:
+    """Check that text ends with keyword as a standalone word"""
+    if not text.endswith(keyword):
+        return False
+    index = len(text) - len(keyword) - 1
+    return index < 0 or text[index] not in _IDENTIFIER_CHARS
+
+
+def _starts_statement(content: str, index: int, keyword: str) -> bool:
+    """Check that the keyword at index is a whole word at the start of a statement"""
+    after = content[index + len(keyword):index + len(keyword) + 1]
+    if after and after in _IDENTIFIER_CHARS:
+        return False
+    before = content[max(0, index - _LOOKBEHIND):index].rstrip(' \t')
+    # Keywords in comments (`// import ...`, ` * export ...`) are not preceded by a statement boundary
+    return not before or before[-1] in '\n;{}' or before.endswith('*/')
+
+
+def _statement_start(content: str, end: int) -> int:
+    """Offset just past the last import/export keyword starting a statement before end, or -1"""
+    low = max(0, end - _STATEMENT_LOOKBEHIND)
+    start = -1
+    for keyword in ('import', 'export'):
+        # Only a later keyword than the one already found can start the statement
+        index = content.rfind(keyword, low, end)
+        while index != -1 and not _starts_statement(content, index, keyword):
+            index = content.rfind(keyword, low, index)
+        if index != -1:
+            start = index + len(keyword)
+            low = start
+    return start
+
+
+def _clause_kind(clause: str) -> str:
+    """Kind of an import/export statement from the text between its keyword and `from`"""
+    if 'type' not in clause:
+        return RUNTIME_IMPORT
+    if '/' in clause:
+        clause = _COMMENT_RE.sub(' ', clause)
+    if _TYPE_CLAUSE_RE.match(clause):
+        return TYPE_IMPORT
+    brace = clause.find('{')
+    if brace == -1 or clause[:brace].strip():
+        # Default, namespace or `*` bindings are values
+        return RUNTIME_IMPORT
+    items = [item.split() for item in clause[brace + 1:clause.rfind('}')].split(',')]
+    items = [item for item in items if item]
+    if items and all(item[0] == 'type' and len(item) > 1 and item[1] != 'as' for item in items):
+        return TYPE_IMPORT
+    return RUNTIME_IMPORT
+
+
+def _starts_regex(content: str, start: int) -> bool:
+    """Check that the `/` at start is in expression position, so it opens a regex literal"""
+    before = content[max(0, start - _LOOKBEHIND):start].rstrip()
+    if not before or before[-1] in _REGEX_PRECEDERS:
+        return True
+    if before[-1] == '>':
+        return before.endswith('=>')
+    word = _TRAILING_WORD_RE.search(before)
+    return bool(word) and word.group() in _REGEX_KEYWORDS and not before[:word.start()].endswith('.')
+
+
+def _regex_literal_end(content: str, low: int, start: int) -> int:
+    """
+    End of a regex literal that opens between low and start on the line of
+    start and contains start, or 0.
+
+    low must be the end of the previous token, so the text from there to
+    start is code.
+    """
+    slash = content.find('/', max(low, content.rfind('\n', low, start) + 1), start)
+    while slash != -1:
+        if _starts_regex(content, slash):
+            literal = _REGEX_LITERAL_RE.match(content, slash)
+            if literal:
+                if literal.end() > start:
+                    return literal.end()
+                slash = content.find('/', literal.end(), start)
+                continue
+        slash = content.find('/', slash + 1, start)
+    return 0
+
+
+def _specifier_kind(content: str, start: int) -> Optional[str]:
+    """Kind of import of the string literal at start, or None if it is not a module specifier"""
+    low = max(0, start - _LOOKBEHIND)
+    before = content[low:start].rstrip()
+    if before.endswith('('):
+        before = before[:-1].rstrip()
+        if _ends_with_keyword(before, 'import'):
+            return DYNAMIC_IMPORT
+        return RUNTIME_IMPORT if _ends_with_keyword(before, 'require') else None
+    if _ends_with_keyword(before, 'import'):
+        return SIDE_EFFECT_IMPORT
+    if _ends_with_keyword(before, 'from'):
+        from_index = low + len(before) - len('from')
+        statement_start = _statement_start(content, from_index)
+        if statement_start == -1:
+            return RUNTIME_IMPORT
+        return _clause_kind(content[statement_start:from_index])
+    return None
+
+
+def find_header_end(content: str, start: int = 0) -> int:
+    """
+    Return the offset where the static import/export header of a module ends.
+
+    Scanning resumes from start, which must be the end of an earlier header
+    item (or 0).
+    """
+    position = start
+    while True:
+        match = HEADER_ITEM_RE.match(content, position)
+        if not match or match.end() == position:
+            return position
+        position = match.end()
+
+
+def extract_imports(content: str) -> List[Tuple[str, str]]:
+    """Return (specifier, kind) of all module specifiers in a source file, in source order"""
+    imports = []
+    search = SOURCE_TOKEN_RE.search
+    position = 0
+    match = search(content)
+    while match:
+        start = match.start()
+        if content.find('/', position, start) != -1:
+            # The token may be part of a regex literal, such as the backtick in /`/
+            regex_end = _regex_literal_end(content, position, start)
+            if regex_end:
+                position = regex_end
+                match = search(content, position)
+                continue
+        group = match.lastgroup
+        if group:
+            kind = _specifier_kind(content, start)
+            if kind:
+                imports.append((match.group(group), kind))
+        position = match.end()
+        match = search(content, position)
+    return imports
+
+
+def extract_stylesheet_imports(content: str) -> List[Tuple[str, str]]:
+    """Return (specifier, kind) of the stylesheets and files a stylesheet loads, in source order"""
+    imports = []
+    for match in STYLESHEET_TOKEN_RE.finditer(content):
+        targets = match.group('targets')
+        if targets is not None:
+            specifiers = _QUOTED_RE.findall(targets)
+        else:
+            url = match.group('single') or match.group('double') or match.group('bare')
+            # Interpolated urls are only known at compile time; check before `#` is cut as a fragment
+            if not url or '#{' in url:
+                continue
+            specifiers = [url.split('?')[0].split('#')[0]]
+        imports.extend((specifier, RUNTIME_IMPORT) for specifier in specifiers
+                       if specifier and not specifier.startswith(_EXTERNAL_PREFIXES) and '#{' not in specifier)
+    return imports
+
+
+def extract_specifiers(content: str) -> List[str]:
+    """Return all module specifiers in a source file, in source order"""
+    return [specifier for specifier, _ in extract_imports(content)]
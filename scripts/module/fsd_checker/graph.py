@@ -0,0 +1,231 @@
+"""
+Module dependency graph for the FSD Architecture Checker.
+
+Files are interned to integer IDs and edges are kept in compressed
+adjacency arrays (offsets plus targets) for both directions, so
+dependents, dependencies and fan-in/fan-out are slices of flat arrays.
+The graph is saved as a small binary file that loads without parsing,
+along with metadata that tells whether it still matches the sources.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+GRAPH_MAGIC = b"FSDG"
+GRAPH_VERSION = 2
+
+DEFAULT_GRAPH_PATH = os.path.join(".fsd-cache", "graph.bin")
+RUNTIME_GRAPH_PATH = os.path.join(".fsd-cache", "graph-runtime.bin")
+
+# magic, version, node count, edge count, byte length of the path table, byte length of the metadata
+_HEADER = struct.Struct("<4sIIIQQ")
+
+
+def tree_fingerprint(paths: Iterable[str]) -> str:
+    """Hash of the stat data (mtime and size) of paths, including which of them are missing"""
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode('utf-8'))
+        except OSError:
+            digest.update(f"{path}\0-\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _compress(node_count: int, edges: List[Tuple[int, int]]) -> Tuple[array, array]:
+    """Turn (source, target) pairs sorted by source into offset and target arrays"""
+    offsets = array('I', bytes(4 * (node_count + 1)))
+    targets = array('I', (target for _, target in edges))
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+    return offsets, targets
+
+
+class ModuleGraph:
+    """Directed graph of resolved imports between files"""
+
+    def __init__(self, paths: List[str],
+                 forward_offsets: array, forward_targets: array,
+                 reverse_offsets: array, reverse_targets: array):
+        """
+        Initialize a graph from its arrays; use ModuleGraph.build or load to create one.
+
+        Args:
+            paths: File path of each node ID
+            forward_offsets: Start of each node's dependencies in forward_targets
+            forward_targets: Dependency node IDs
+            reverse_offsets: Start of each node's dependents in reverse_targets
+            reverse_targets: Dependent node IDs
+        """
+        self.paths = paths
+        self.ids: Dict[str, int] = {path: node for node, path in enumerate(paths)}
+        self.forward_offsets = forward_offsets
+        self.forward_targets = forward_targets
+        self.reverse_offsets = reverse_offsets
+        self.reverse_targets = reverse_targets
+        # Saved along with the graph (see FSDChecker.graph_metadata)
+        self.meta: Dict[str, Any] = {}
+
+    @classmethod
+    def build(cls, files: Iterable[str], edges: Iterable[Tuple[str, str]]) -> "ModuleGraph":
+        """
+        Build a graph from file paths and (importer, imported) path pairs.
+
+        Files only referenced by edges become nodes too; duplicate edges
+        and self-imports are dropped.
+        """
+        ids: Dict[str, int] = {}
+        paths: List[str] = []
+
+        def intern(path: str) -> int:
+            node = ids.get(path)
+            if node is None:
+                node = ids[path] = len(paths)
+                paths.append(path)
+            return node
+
+        for path in files:
+            intern(path)
+        pairs = {(intern(source), intern(target)) for source, target in edges if source != target}
+
+        forward = sorted(pairs)
+        reverse = sorted((target, source) for source, target in pairs)
+        return cls(paths, *_compress(len(paths), forward), *_compress(len(paths), reverse))
+
+    @property
+    def node_count(self) -> int:
+        return len(self.paths)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.forward_targets)
+
+    def id_of(self, path: str) -> Optional[int]:
+        """Node ID of a file path, or None if it is not in the graph"""
+        return self.ids.get(os.path.normpath(path))
+
+    def nodes_under(self, path: str) -> List[int]:
+        """Node IDs of a file, or of all files inside a directory such as a slice"""
+        path = os.path.normpath(path)
+        node = self.ids.get(path)
+        if node is not None:
+            return [node]
+        prefix = os.path.join(path, '')
+        return [node for node, node_path in enumerate(self.paths) if node_path.startswith(prefix)]
+
+    def dependencies(self, node: int) -> array:
+        """Nodes imported by a node"""
+        return self.forward_targets[self.forward_offsets[node]:self.forward_offsets[node + 1]]
+
+    def dependents(self, node: int) -> array:
+        """Nodes importing a node"""
+        return self.reverse_targets[self.reverse_offsets[node]:self.reverse_offsets[node + 1]]
+
+    def fan_out(self, node: int) -> int:
+        return self.forward_offsets[node + 1] - self.forward_offsets[node]
+
+    def fan_in(self, node: int) -> int:
+        return self.reverse_offsets[node + 1] - self.reverse_offsets[node]
+
+    def direct_dependents(self, nodes: Iterable[int]) -> Set[int]:
+        """Nodes outside the given set that import any of them"""
+        nodes = set(nodes)
+        result = set()
+        for node in nodes:
+            result.update(self.dependents(node))
+        return result - nodes
+
+    def impact(self, nodes: Iterable[int]) -> Set[int]:
+        """Nodes outside the given set that depend on any of them, directly or transitively"""
+        seeds = set(nodes)
+        seen = set(seeds)
+        queue = deque(seeds)
+        while queue:
+            node = queue.popleft()
+            for dependent in self.dependents(node):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    queue.append(dependent)
+        return seen - seeds
+
+    def closure(self, nodes: Iterable[int]) -> Set[int]:
+        """The given nodes and everything they depend on, directly or transitively"""
+        seen = set(nodes)
+        queue = deque(seen)
+        while queue:
+            node = queue.popleft()
+            for dependency in self.dependencies(node):
+                if dependency not in seen:
+                    seen.add(dependency)
+                    queue.append(dependency)
+        return seen
+
+    def save(self, file_path: str) -> None:
+        """Write the graph to a binary file (atomically)"""
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        path_table = "\0".join(self.paths).encode('utf-8')
+        meta = json.dumps(self.meta, separators=(',', ':')).encode('utf-8')
+        arrays = [self.forward_offsets, self.forward_targets, self.reverse_offsets, self.reverse_targets]
+        if sys.byteorder != 'little':
+            arrays = [array('I', values) for values in arrays]
+            for values in arrays:
+                values.byteswap()
+
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(GRAPH_MAGIC, GRAPH_VERSION, self.node_count, self.edge_count,
+                                 len(path_table), len(meta)))
+            f.write(path_table)
+            f.write(meta)
+            for values in arrays:
+                values.tofile(f)
+        os.replace(tmp_path, file_path)
+
+    @classmethod
+    def load(cls, file_path: str) -> "ModuleGraph":
+        """
+        Read a graph written by save.
+
+        Raises:
+            ValueError: If the file is not a graph of the current version
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{file_path} is not a module graph")
+        magic, version, node_count, edge_count, table_size, meta_size = _HEADER.unpack_from(data)
+        if magic != GRAPH_MAGIC or version != GRAPH_VERSION:
+            raise ValueError(f"{file_path} is not a module graph of version {GRAPH_VERSION}")
+
+        position = _HEADER.size
+        table = data[position:position + table_size].decode('utf-8')
+        paths = table.split("\0") if node_count else []
+        position += table_size
+        meta = json.loads(data[position:position + meta_size].decode('utf-8'))
+        position += meta_size
+
+        arrays = []
+        for count in (node_count + 1, edge_count, node_count + 1, edge_count):
+            values = array('I')
+            values.frombytes(data[position:position + 4 * count])
+            if sys.byteorder != 'little':
+                values.byteswap()
+            arrays.append(values)
+            position += 4 * count
+
+        graph = cls(paths, *arrays)
+        graph.meta = meta
+        return graph
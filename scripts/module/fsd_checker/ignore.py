@@ -0,0 +1,265 @@
+"""
+Traversal pruning for the FSD Architecture Checker.
+
+Directories that never hold application sources (nested node_modules,
+build and coverage output, snapshots, fixtures) and everything matched by
+the project's .gitignore files are cut from the tree walk before they are
+listed, so none of their entries is ever read or stat'ed.
+
+Exclude globs match an entry's name, or its path relative to base_dir
+when they contain a `/`. The .gitignore files above base_dir (up to the
+repository root) apply to the whole walk, and nested ones to their own
+directory, with the usual rules: last match wins, `!` re-includes, a
+trailing `/` only matches directories and a `/` elsewhere anchors the
+pattern to the .gitignore's directory.
+
+Test and story files are classified by role, so they can be left out of
+a check or checked on their own with separate rules.
+"""
+
+import fnmatch
+import os
+import re
+import time
+from typing import Iterable, List, Optional, Tuple
+
+# Directories (and files) left out of every walk unless excludes are given
+DEFAULT_EXCLUDES = ("node_modules", "dist", "coverage", "__snapshots__", "fixtures", "__fixtures__")
+
+# Roles of files that are not application code, by glob on the path relative to base_dir
+TEST_GLOBS = ("*.test.*", "*.spec.*", "*/__tests__/*", "*/__mocks__/*", "*/setupTests.*")
+STORY_GLOBS = ("*.stories.*", "*.story.*")
+TEST_ROLE = "test"
+STORY_ROLE = "story"
+
+# What a check does with test and story files
+TEST_FILE_MODES = ("include", "exclude", "only")
+
+# Directories holding only test files, pruned whole when test files are excluded
+TEST_DIRECTORIES = ("__tests__", "__mocks__", "__snapshots__")
+
+
+def compile_globs(patterns: Iterable[str]) -> Optional["re.Pattern[str]"]:
+    """One regex matching any of the globs (`*` also matches `/`), or None without globs"""
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+_TEST_RE = compile_globs(TEST_GLOBS)
+_STORY_RE = compile_globs(STORY_GLOBS)
+
+
+def file_role(relative_path: str) -> Optional[str]:
+    """TEST_ROLE or STORY_ROLE for test and story files (path relative to base_dir), None for application code"""
+    relative_path = relative_path.replace(os.sep, "/")
+    if _STORY_RE.match(relative_path):
+        return STORY_ROLE
+    if _TEST_RE.match(relative_path):
+        return TEST_ROLE
+    return None
+
+
+def _translate(pattern: str) -> str:
+    """Regex of a gitignore glob: `*` and `?` stay within a segment, `**` crosses them"""
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == "*":
+            if pattern.startswith("**", i):
+                i += 2
+                if i < n and pattern[i] == "/":
+                    # Leading or inner `**/`: zero or more directories
+                    parts.append("(?:.*/)?")
+                    i += 1
+                else:
+                    parts.append(".*")
+                continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end].replace("\\", "\\\\")
+                parts.append("[" + ("^" + body[1:] if body[0] == "!" else body) + "]")
+                i = end
+        elif char == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
+
+
+class GitignoreFile:
+    """Compiled patterns of one .gitignore file"""
+
+    def __init__(self, path: str, lines: Iterable[str], prefix: str = "", offset: str = ""):
+        """
+        Args:
+            path: Path of the .gitignore file
+            lines: Lines of the file
+            prefix: Its directory relative to base_dir ("dir/"), for files inside base_dir
+            offset: base_dir relative to its directory ("src/"), for files above base_dir
+        """
+        self.path = path
+        self.prefix = prefix
+        self.offset = offset
+        # (regex, negated, directories only, matched against the relative path rather than the name)
+        self.rules: List[Tuple["re.Pattern[str]", bool, bool, bool]] = []
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            directory_only = line.endswith("/")
+            line = line.rstrip("/")
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if line:
+                self.rules.append((re.compile(_translate(line) + r"\Z"), negated, directory_only, anchored))
+
+    @classmethod
+    def load(cls, path: str, prefix: str = "", offset: str = "") -> Optional["GitignoreFile"]:
+        """Read a .gitignore file; None if it is unreadable or has no patterns"""
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                gitignore = cls(path, f, prefix, offset)
+        except OSError:
+            return None
+        return gitignore if gitignore.rules else None
+
+    def match(self, relative_path: str, name: str, is_dir: bool) -> Optional[bool]:
+        """
+        True if the file ignores a path (relative to base_dir, with `/`), False
+        if it re-includes it, None if no pattern matches.
+        """
+        if not relative_path.startswith(self.prefix):
+            return None
+        for regex, negated, directory_only, anchored in reversed(self.rules):
+            if directory_only and not is_dir:
+                continue
+            if anchored:
+                matched = regex.match(self.offset + relative_path[len(self.prefix):])
+            else:
+                matched = regex.match(name)
+            if matched:
+                return not negated
+        return None
+
+
+def _repository_root(directory: str) -> Optional[str]:
+    """Nearest directory at or above directory that holds a .git entry"""
+    directory = os.path.abspath(directory)
+    while True:
+        if os.path.exists(os.path.join(directory, ".git")):
+            return directory
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+class IgnoreRules:
+    """Decides which entries of the tree walk are pruned, and why"""
+
+    def __init__(self, base_dir: str, excludes: Iterable[str] = DEFAULT_EXCLUDES, gitignore: bool = True):
+        """
+        Args:
+            base_dir: Directory containing the FSD layers
+            excludes: Globs of names (or of paths relative to base_dir, if they contain a `/`) to prune
+            gitignore: Honor the .gitignore files of the repository
+        """
+        # Walked paths start with base_dir as given
+        self.base = os.path.join(base_dir, "")
+        excludes = list(excludes)
+        self.name_excludes = compile_globs(pattern for pattern in excludes if "/" not in pattern)
+        self.path_excludes = compile_globs(pattern.strip("/") for pattern in excludes if "/" in pattern)
+        self.gitignore = gitignore
+
+        # .gitignore files from the repository root down to base_dir apply everywhere
+        self.root_gitignores: Tuple[GitignoreFile, ...] = ()
+        if gitignore:
+            directory = os.path.abspath(base_dir)
+            root = _repository_root(directory) or directory
+            offset = ""
+            gitignores = []
+            while True:
+                loaded = GitignoreFile.load(os.path.join(directory, ".gitignore"), offset=offset)
+                if loaded is not None:
+                    gitignores.append(loaded)
+                if directory == root:
+                    break
+                offset = os.path.basename(directory) + "/" + offset
+                directory = os.path.dirname(directory)
+            # Outermost first, like the nested ones
+            self.root_gitignores = tuple(reversed(gitignores))
+
+    def nested(self, gitignores: Tuple[GitignoreFile, ...], directory: str,
+               names: Iterable[str]) -> Tuple[GitignoreFile, ...]:
+        """The .gitignore files in effect in a walked directory, given the names of its entries"""
+        if self.gitignore and ".gitignore" in names:
+            prefix = self._relative(os.path.join(directory, ""))
+            loaded = GitignoreFile.load(os.path.join(directory, ".gitignore"), prefix=prefix)
+            if loaded is not None:
+                return gitignores + (loaded,)
+        return gitignores
+
+    def _relative(self, path: str) -> str:
+        return (path[len(self.base):] if path.startswith(self.base) else path).replace(os.sep, "/")
+
+    def reason(self, path: str, name: str, is_dir: bool, gitignores: Tuple[GitignoreFile, ...]) -> Optional[str]:
+        """Why an entry is pruned ("exclude" or the .gitignore file), or None to keep it"""
+        if self.name_excludes is not None and self.name_excludes.match(name):
+            return "exclude"
+        if self.path_excludes is None and not gitignores:
+            return None
+        relative = self._relative(path)
+        if self.path_excludes is not None and self.path_excludes.match(relative):
+            return "exclude"
+        # Deeper .gitignore files take precedence
+        for gitignore in reversed(gitignores):
+            decision = gitignore.match(relative, name, is_dir)
+            if decision is not None:
+                return gitignore.path if decision else None
+        return None
+
+    def excludes_path(self, file_path: str) -> bool:
+        """Whether a file (as listed by git) lies in or is an excluded entry"""
+        parts = self._relative(file_path).split("/")
+        if self.path_excludes is not None \
+                and any(self.path_excludes.match("/".join(parts[:i])) for i in range(1, len(parts) + 1)):
+            return True
+        return self.name_excludes is not None and any(self.name_excludes.match(part) for part in parts)
+
+
+def measure_subtree(directory: str) -> Tuple[int, int, float]:
+    """
+    List a pruned directory the way the walk would have.
+
+    Returns:
+        (directories, files, seconds) of listing the whole subtree
+    """
+    started = time.perf_counter()
+    directories = files = 0
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                directories += 1
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files += 1
+        except OSError:
+            continue
+    return directories, files, time.perf_counter() - started
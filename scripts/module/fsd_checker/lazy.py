@@ -0,0 +1,140 @@
+"""
+Lazy-boundary integrity check for the FSD Architecture Checker.
+
+A module split into its own chunk stays lazy only while every path to it
+from the entry point goes through a dynamic import(). Lazy modules are
+the targets of dynamic imports, and the modules wrapped by `.async`
+files (Foo.async.tsx wraps ./Foo). A single static import of one of them
+by a module the entry point loads eagerly pulls it back into the main
+bundle.
+
+The static edges are walked breadth first from the entry point, so every
+eagerly loaded module is reached by its shortest static chain. Each
+static import of a lazy module by an eagerly loaded module is reported
+with that chain. Type-only imports are erased at build time and never
+defeat a split.
+"""
+
+import os
+from collections import deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .extractor import DYNAMIC_IMPORT, TYPE_IMPORT
+from .graph import ModuleGraph
+
+# Entry point of the application, relative to the base directory
+DEFAULT_ENTRY = os.path.join("app", "main.tsx")
+
+# Marker of lazy wrapper files (Foo.async.tsx)
+ASYNC_MARKER = ".async"
+
+
+def _stem(file_path: str) -> str:
+    """Path without its extension, and without a trailing /index"""
+    stem = os.path.splitext(file_path)[0]
+    return os.path.dirname(stem) if os.path.basename(stem) == "index" else stem
+
+
+def lazy_modules(file_imports: List[Tuple[str, Optional[Tuple[List[List[Any]], Any]]]]) -> Dict[str, Set[str]]:
+    """
+    Find the lazily loaded modules.
+
+    Returns:
+        Each lazy module mapped to the files loading it lazily: its dynamic
+        importers and its `.async` wrapper
+    """
+    lazy: Dict[str, Set[str]] = {}
+    wrappers = []
+    for file_path, loaded in file_imports:
+        if not loaded or loaded[1]:
+            continue
+        for _, _, resolved_file, kind in loaded[0]:
+            if resolved_file and kind == DYNAMIC_IMPORT:
+                lazy.setdefault(resolved_file, set()).add(file_path)
+        stem = os.path.splitext(file_path)[0]
+        if stem.endswith(ASYNC_MARKER):
+            wrappers.append((stem[:-len(ASYNC_MARKER)], file_path))
+
+    if wrappers:
+        by_stem = {_stem(file_path): file_path for file_path, _ in file_imports}
+        for stem, wrapper in wrappers:
+            wrapped = by_stem.get(stem)
+            if wrapped:
+                lazy.setdefault(wrapped, set()).add(wrapper)
+    return lazy
+
+
+def check_lazy_boundaries(file_imports: List[Tuple[str, Optional[Tuple[List[List[Any]], Any]]]],
+                          entry: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the static imports that pull lazy modules into the entry point's bundle.
+
+    Args:
+        file_imports: Resolved imports of every file, as kept by FSDChecker.analyze_imports
+        entry: Entry point of the application
+
+    Returns:
+        {"entry", "lazy_modules", "eager_modules", "defeated": [...]} where
+        each defeated split lists the module, the files loading it lazily
+        and every static import of it by an eagerly loaded file with its
+        chain from the entry; None if the entry point is not a checked file
+    """
+    static_imports: Dict[str, List[Tuple[str, str]]] = {}
+    for file_path, loaded in file_imports:
+        if loaded and not loaded[1]:
+            static_imports[file_path] = [(import_path, resolved_file)
+                                         for import_path, _, resolved_file, kind in loaded[0]
+                                         if resolved_file and kind not in (DYNAMIC_IMPORT, TYPE_IMPORT)]
+    graph = ModuleGraph.build(
+        (file_path for file_path, _ in file_imports),
+        ((file_path, resolved_file) for file_path, edges in static_imports.items() for _, resolved_file in edges),
+    )
+    root = graph.id_of(entry)
+    if root is None:
+        return None
+
+    # Breadth-first walk of the static edges: parent of each eagerly loaded module
+    parents = {root: -1}
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        for dependency in graph.dependencies(node):
+            if dependency not in parents:
+                parents[dependency] = node
+                queue.append(dependency)
+
+    def chain(node: int) -> List[str]:
+        path = []
+        while node != -1:
+            path.append(graph.paths[node])
+            node = parents[node]
+        return path[::-1]
+
+    lazy = lazy_modules(file_imports)
+    defeated = []
+    for module in sorted(lazy):
+        node = graph.id_of(module)
+        if node is None or node not in parents:
+            continue
+        static_importers = []
+        for importer in sorted(graph.paths[dependent] for dependent in graph.dependents(node)):
+            importer_node = graph.id_of(importer)
+            if importer_node not in parents:
+                continue
+            importer_chain = chain(importer_node)
+            for import_path, resolved_file in static_imports.get(importer, []):
+                if resolved_file == module:
+                    static_importers.append({"file": importer, "import": import_path,
+                                             "chain": importer_chain + [module]})
+        defeated.append({
+            "module": module,
+            "lazy_importers": sorted(lazy[module]),
+            "static_importers": static_importers,
+        })
+
+    return {
+        "entry": graph.paths[root],
+        "lazy_modules": len(lazy),
+        "eager_modules": len(parents),
+        "defeated": defeated,
+    }
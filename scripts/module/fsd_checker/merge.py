@@ -0,0 +1,143 @@
+"""
+Merging of sharded reports for the FSD Architecture Checker.
+
+Each shard of a `check --shard i/N` run reports the findings about its
+own files, tagged with their positions in the unsharded scan, and the
+resolved imports of those files. Merging puts the findings back in scan
+order and rebuilds the import table of the whole tree from the shards,
+so the graph sections (cycles, lazy boundaries, assets, stylesheets) are
+computed exactly as in an unsharded run without reading any source file.
+Asset sizes come from the tree scan, so merge runs in the same checkout
+as the shards.
+
+Shards listed twice are deduplicated; findings about a file are taken
+from the first shard that reports the file.
+"""
+
+from typing import Any, Dict, List, Optional, Set
+
+from .core import FSDChecker
+
+
+def _group_by_file(shard_reports: List[Dict[str, Any]], key: str) -> Dict[str, List[Any]]:
+    """Entries of a report list (violations, skipped files) grouped by file, from the first shard reporting it"""
+    groups: Dict[str, List[Any]] = {}
+    for report in shard_reports:
+        own: Dict[str, List[Any]] = {}
+        for entry in report["imports"][key]:
+            own.setdefault(entry["file"], []).append(entry)
+        for file_path, entries in own.items():
+            groups.setdefault(file_path, entries)
+    return groups
+
+
+def _check_shards(reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Validate a set of partial reports and order them by shard.
+
+    Raises:
+        ValueError: If a report is not a shard, the shards disagree, or some are missing
+    """
+    by_index: Dict[int, Dict[str, Any]] = {}
+    for report in reports:
+        shard = report.get("shard")
+        if not shard:
+            raise ValueError("Only reports of check --shard can be merged")
+        first = next(iter(by_index.values()), None)
+        if first is not None:
+            for key in ("count", "balance", "base_dir", "layers", "entry", "test_files"):
+                if shard[key] != first["shard"][key]:
+                    raise ValueError(f"Shards disagree on {key}: {first['shard'][key]!r} and {shard[key]!r}")
+        by_index.setdefault(shard["index"], report)
+
+    count = next(iter(by_index.values()))["shard"]["count"]
+    missing = [str(index) for index in range(1, count + 1) if index not in by_index]
+    if missing:
+        raise ValueError(f"Missing shard(s) {', '.join(missing)} of {count}")
+    return [by_index[index] for index in range(1, count + 1)]
+
+
+def merge_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine the partial reports of all shards into the report of an unsharded check.
+
+    Args:
+        reports: Reports written by check --shard i/N, for every i (in any order)
+
+    Returns:
+        The merged report
+
+    Raises:
+        ValueError: If the reports are not a complete set of shards of one check
+    """
+    shard_reports = _check_shards(reports)
+    first = shard_reports[0]
+    meta = first["shard"]
+
+    # Checked files in scan order, and the resolved imports of every file any shard loaded
+    positions: Dict[str, int] = {}
+    loaded_files: Dict[str, Any] = {}
+    for report in shard_reports:
+        for position, file_path in report["shard"]["files"]:
+            positions.setdefault(file_path, position)
+        for file_path, loaded in report["shard"]["file_imports"]:
+            loaded_files.setdefault(file_path, loaded)
+    checked = sorted(positions, key=positions.get)
+
+    checker = FSDChecker(meta["base_dir"], layers=meta["layers"], entry=meta["entry"],
+                         runtime_only=first["rules"].get("runtime_only", False))
+    # Stylesheets outside the layers follow the checked files, in the order an unsharded run loads them
+    file_imports = [(file_path, loaded_files.get(file_path)) for file_path in checked]
+    known: Set[str] = set(checked)
+    start = 0
+    while start < len(file_imports):
+        followed = checker.unloaded_stylesheets([loaded for _, loaded in file_imports[start:]], known)
+        start = len(file_imports)
+        file_imports.extend((file_path, loaded_files.get(file_path)) for file_path in followed)
+    checker.file_imports = file_imports
+
+    violations = _group_by_file(shard_reports, "violations")
+    skipped = _group_by_file(shard_reports, "skipped")
+    directory_violations: Dict[int, Dict[str, Any]] = {}
+    for report in shard_reports:
+        for position, violation in zip(report["shard"]["directory_positions"],
+                                       report["structure"]["directory_violations"]):
+            directory_violations.setdefault(position, violation)
+
+    checker.analyze_cycles()
+    checker.analyze_lazy_boundaries()
+    checker.analyze_assets()
+    checker.analyze_stylesheets()
+
+    merged_violations = [violation for file_path in checked for violation in violations.get(file_path, [])]
+    report = dict(first)
+    del report["shard"]
+    report["structure"] = dict(first["structure"], directory_violations=[
+        directory_violations[position] for position in sorted(directory_violations)])
+    report["imports"] = dict(first["imports"],
+                             violations=merged_violations,
+                             total=len(merged_violations),
+                             skipped=[entry for file_path in checked for entry in skipped.get(file_path, [])],
+                             edges=checker.edge_counts())
+    report["cycles"] = checker.cycles
+    report["lazy"] = checker.lazy_boundaries
+    report["assets"] = checker.assets
+    report["stylesheets"] = checker.stylesheets
+    if "baseline" in first:
+        report["baseline"] = _merge_baseline(shard_reports)
+    return report
+
+
+def _merge_baseline(shard_reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Baseline summary of the whole check: suppressions add up, and resolved entries are those no shard matched"""
+    matched: Set[str] = set()
+    resolved: Optional[int] = None
+    shard_baseline = shard_reports[0]["shard"]["baseline"]
+    # Resolved entries are only known if every shard saw all the violations of its files
+    if shard_baseline is not None and all(report["shard"]["baseline"]["complete"] for report in shard_reports):
+        for report in shard_reports:
+            matched.update(report["shard"]["baseline"]["matched"])
+        resolved = shard_baseline["fingerprints"] - len(matched)
+    return dict(shard_reports[0]["baseline"],
+                suppressed=sum(report["baseline"]["suppressed"] for report in shard_reports),
+                resolved=resolved)
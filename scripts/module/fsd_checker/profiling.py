@@ -0,0 +1,189 @@
+"""
+Phase profiling for the FSD Architecture Checker.
+
+A Profiler records wall-time spans of the checker's phases and the
+read/extract/resolve time of every file, along with the directories the
+tree walk pruned and what listing them would have cost. It prints a
+timing table with the slowest files and the pruned directories, and
+writes a Chrome trace-event file (chrome://tracing, Perfetto). When
+profiling is off the checker holds NULL_PROFILER, whose methods do
+nothing, and per-file timing is skipped entirely.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Per-file phases, in the order they run
+FILE_PHASES = ("read", "extract", "resolve")
+
+
+class Profiler:
+    """Collects phase spans and per-file timings"""
+
+    enabled = True
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self.phase_totals: Dict[str, List[float]] = {}
+        self.file_times: Dict[str, Dict[str, float]] = {}
+        # (directory, reason, directories, files, seconds) of each pruned subtree
+        self.pruned: List[Tuple[str, str, int, int, float]] = []
+        self.files_ignored = 0
+        self.started = time.perf_counter()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # A worker process starts with an empty profiler and sends its records back with drain()
+        return {"started": self.started}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()
+        self.started = state["started"]
+
+    def _event(self, name: str, category: str, start: float, duration: float,
+               args: Optional[Dict[str, Any]] = None) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round(start * 1e6, 1),
+            "dur": round(duration * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def _add_total(self, name: str, duration: float) -> None:
+        total = self.phase_totals.setdefault(name, [0, 0.0])
+        total[0] += 1
+        total[1] += duration
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args) -> Iterator[None]:
+        """Time a phase of the run"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._add_total(name, duration)
+            self._event(name, "phase", start, duration, args)
+
+    def record_file(self, file_path: str, start: float, durations: Tuple[float, ...]) -> None:
+        """Record the leading FILE_PHASES durations of one file, which started at start"""
+        self.file_times[file_path] = dict(zip(FILE_PHASES, durations))
+        offset = start
+        for phase, duration in zip(FILE_PHASES, durations):
+            self._add_total(phase, duration)
+            self._event(phase, "file", offset, duration, {"file": file_path})
+            offset += duration
+
+    def record_file_phase(self, file_path: str, phase: str, start: float, duration: float) -> None:
+        """Record one FILE_PHASES duration of a file measured apart from the others"""
+        self.file_times.setdefault(file_path, {})[phase] = duration
+        self._add_total(phase, duration)
+        self._event(phase, "file", start, duration, {"file": file_path})
+
+    def record_pruned(self, directory: str, reason: str, directories: int, files: int, seconds: float) -> None:
+        """Record a subtree cut from the walk, with what listing it would have cost"""
+        self.pruned.append((directory, reason, directories, files, seconds))
+
+    def record_ignored_files(self, count: int) -> None:
+        """Record files dropped from listed directories by excludes or .gitignore"""
+        self.files_ignored += count
+
+    def drain(self) -> Optional[Dict[str, Any]]:
+        """Hand over and forget the records collected so far (used by worker processes)"""
+        records = {"events": self.events, "phase_totals": self.phase_totals, "file_times": self.file_times}
+        self.events, self.phase_totals, self.file_times = [], {}, {}
+        return records
+
+    def merge(self, records: Optional[Dict[str, Any]]) -> None:
+        """Add records drained from another profiler"""
+        if not records:
+            return
+        self.events.extend(records["events"])
+        # A file's phases may be recorded in different processes
+        for file_path, times in records["file_times"].items():
+            self.file_times.setdefault(file_path, {}).update(times)
+        for name, (count, duration) in records["phase_totals"].items():
+            total = self.phase_totals.setdefault(name, [0, 0.0])
+            total[0] += count
+            total[1] += duration
+
+    def slowest_files(self, count: int) -> List[Tuple[str, float]]:
+        """The count files with the largest total read + extract + resolve time"""
+        totals = ((file_path, sum(times.values())) for file_path, times in self.file_times.items())
+        return sorted(totals, key=lambda item: item[1], reverse=True)[:count]
+
+    def print_summary(self, top_files: int = 10) -> None:
+        """Print the phase timing table and the slowest files"""
+        wall = time.perf_counter() - self.started
+        print("\n=== FSD Checker Profile ===\n")
+        print(f"{'Phase':<24} {'Calls':>8} {'Total (s)':>10} {'% wall':>7}")
+        for name, (count, duration) in self.phase_totals.items():
+            # Per-file phases are summed over files (and workers), so they may exceed wall time
+            label = f"{name} (per file)" if name in FILE_PHASES else name
+            print(f"{label:<24} {count:>8} {duration:>10.3f} {duration / wall * 100:>6.1f}%")
+        print(f"{'wall':<24} {'':>8} {wall:>10.3f}")
+
+        slowest = self.slowest_files(top_files)
+        if slowest:
+            print(f"\nSlowest {len(slowest)} files:")
+            for file_path, duration in slowest:
+                times = self.file_times[file_path]
+                breakdown = ", ".join(f"{phase} {times.get(phase, 0.0) * 1000:.1f}" for phase in FILE_PHASES)
+                print(f"  {duration * 1000:8.1f} ms  {file_path}  ({breakdown})")
+
+        if self.pruned:
+            directories = sum(entry[2] for entry in self.pruned)
+            files = sum(entry[3] for entry in self.pruned)
+            saved = sum(entry[4] for entry in self.pruned)
+            print(f"\nPruned {len(self.pruned)} directories: {directories} directories and {files} files "
+                  f"not listed, {saved * 1000:.1f} ms of listing saved")
+            costliest = sorted(self.pruned, key=lambda entry: -entry[4])[:top_files]
+            for directory, reason, _, subtree_files, seconds in costliest:
+                print(f"  {seconds * 1000:8.1f} ms  {directory}  ({subtree_files} files, {reason})")
+        if self.files_ignored:
+            print(f"Ignored {self.files_ignored} files in listed directories")
+
+    def write_chrome_trace(self, output_file: str) -> None:
+        """Write the recorded spans as a Chrome trace-event JSON file"""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        print(f"\nProfile trace exported to {output_file}")
+
+
+class _NullProfiler:
+    """Stand-in used when profiling is off; every method is a no-op"""
+
+    enabled = False
+
+    def span(self, name: str, **args) -> contextlib.nullcontext:
+        return contextlib.nullcontext()
+
+    def record_file(self, file_path: str, start: float, durations: Tuple[float, ...]) -> None:
+        pass
+
+    def record_file_phase(self, file_path: str, phase: str, start: float, duration: float) -> None:
+        pass
+
+    def record_pruned(self, directory: str, reason: str, directories: int, files: int, seconds: float) -> None:
+        pass
+
+    def record_ignored_files(self, count: int) -> None:
+        pass
+
+    def drain(self) -> None:
+        return None
+
+    def merge(self, records: Optional[Dict[str, Any]]) -> None:
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
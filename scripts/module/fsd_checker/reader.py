@@ -0,0 +1,138 @@
+"""
+Source file reading for the FSD Architecture Checker.
+
+Files can be read whole, or only up to the end of their static
+import/export header. Oversized and minified files are refused with a
+SkippedFile exception that carries the reason.
+"""
+
+import codecs
+from typing import BinaryIO, List, Optional, Tuple
+
+from .cache import hash_content
+from .extractor import extract_imports, find_header_end
+
+# Size of each read while looking for the end of the header
+CHUNK_SIZE = 8192
+
+# Text that must follow the last header item before the header is
+# considered finished, so a statement cut by a chunk boundary is not
+# mistaken for the end of the header
+HEADER_LOOKAHEAD = 4096
+
+# Amount of leading bytes sampled for minified-file detection
+MINIFIED_SAMPLE_SIZE = 65536
+
+
+class SkippedFile(Exception):
+    """Raised when a file is deliberately not analyzed"""
+
+    def __init__(self, kind: str, message: str):
+        super().__init__(message)
+        self.kind = kind
+        self.message = message
+
+
+def _normalize_newlines(text: str) -> str:
+    """Apply universal newline translation, like a text-mode read"""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _check_minified(sample: bytes, minified_line_length: Optional[int]) -> None:
+    """Raise SkippedFile if the sampled bytes look like minified code"""
+    if not minified_line_length or len(sample) < minified_line_length:
+        return
+
+    average = len(sample) // (sample.count(b'\n') + 1)
+    if average > minified_line_length:
+        raise SkippedFile("minified",
+                          f"File looks minified (average line length {average} > {minified_line_length})")
+
+
+def decode_source(data: bytes,
+                  minified_line_length: Optional[int] = None) -> Tuple[str, str, List[Tuple[str, str]]]:
+    """
+    Decode the full content of a source file, in the same form as read_source.
+
+    Raises:
+        SkippedFile: If the content looks minified
+    """
+    _check_minified(data[:MINIFIED_SAMPLE_SIZE], minified_line_length)
+    return hash_content(data), _normalize_newlines(data.decode('utf-8')), []
+
+
+def _read_header(f: BinaryIO, first_chunk: bytes, size: int) -> Tuple[bytes, str, str, codecs.IncrementalDecoder]:
+    """
+    Read chunks until the static import/export header is complete.
+
+    Returns the bytes read so far, all text decoded from them, the header
+    part of that text and the decoder to continue with.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    data = first_chunk
+    text = decoder.decode(first_chunk, final=len(data) >= size)
+    header_end = 0
+
+    while True:
+        header_end = find_header_end(text, header_end)
+        if len(data) >= size or len(text) - header_end > HEADER_LOOKAHEAD:
+            break
+
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        data += chunk
+        text += decoder.decode(chunk, final=len(data) >= size)
+
+    return data, text, text[:header_end], decoder
+
+
+def read_source(file_path: str,
+                header_only: bool = False,
+                dynamic_imports: bool = True,
+                max_file_size: Optional[int] = None,
+                minified_line_length: Optional[int] = None) -> Tuple[str, str, List[Tuple[str, str]]]:
+    """
+    Read a source file for import extraction.
+
+    Args:
+        file_path: File to read
+        header_only: Stop reading once the static import/export header ends
+        dynamic_imports: In header-only mode, also scan the rest of the file
+                         for import() and require() calls (and any other
+                         import it has)
+        max_file_size: Skip files larger than this many bytes (no cap if None)
+        minified_line_length: Skip files whose average line length exceeds this
+
+    Returns:
+        (content_hash, text, extra_imports) where text is the decoded part
+        of the file to extract imports from and extra_imports are the
+        (specifier, kind) pairs of the imports in the rest of the file.
+        The hash covers exactly the bytes that determine the result.
+
+    Raises:
+        SkippedFile: If the file is oversized or minified
+    """
+    with open(file_path, 'rb') as f:
+        size = f.seek(0, 2)
+        f.seek(0)
+        if max_file_size and size > max_file_size:
+            raise SkippedFile("oversized", f"File size {size} bytes exceeds the {max_file_size} byte cap")
+
+        if not header_only:
+            return decode_source(f.read(), minified_line_length)
+
+        first_chunk = f.read(CHUNK_SIZE)
+        _check_minified(first_chunk, minified_line_length)
+        data, text, header, decoder = _read_header(f, first_chunk, size)
+
+        if not dynamic_imports:
+            return hash_content(data), _normalize_newlines(header), []
+        if len(data) >= size:
+            # Whole file already in memory, dynamic imports come from the full text
+            return hash_content(data), _normalize_newlines(text), []
+
+        # The body goes through the same tokenizer, so calls in comments and strings are skipped
+        rest = f.read()
+        body = text[len(header):] + decoder.decode(rest, final=True)
+        return hash_content(data + rest), _normalize_newlines(header), extract_imports(_normalize_newlines(body))
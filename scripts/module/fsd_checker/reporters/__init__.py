@@ -1,10 +1,11 @@
-# ------ fsd_checker/reporters/__init__.py ------
-"""
-Reporters for FSD Architecture Checker.
-
-This package contains different output formats for FSD check reports.
-"""
-
-from .console import print_report
-from .json_reporter import export_report_to_json
-from .markdown import generate_markdown_report
+# ------ fsd_checker/reporters/__init__.py ------
+"""
+Reporters for FSD Architecture Checker.
+
+This package contains different output formats for FSD check reports.
+"""
+
+from .console import print_report
+from .json_reporter import export_report_to_json
+from .jsonl_reporter import JsonlReportWriter, is_report_stream, read_report_stream
+from .markdown import generate_markdown_report
@@ -1,42 +1,102 @@
-# ------ fsd_checker/reporters/console.py ------
-"""
-Console reporter for FSD Architecture Checker.
-"""
-
-from typing import Dict, Any
-
-def print_report(report: Dict[str, Any]) -> None:
-    """Print formatted report to console"""
-    print("\n=== FSD Architecture Check Report ===\n")
-
-    print("📁 Project Structure:")
-    layers = report["rules"]["allowed_access"].keys()
-    for layer in layers:
-        if layer in report["structure"]["missing_layers"]:
-            print(f"  ❌ {layer} (missing)")
-        else:
-            print(f"  ✅ {layer} ({len(report['structure']['layers'][layer])} slices)")
-
-    print("\n🔍 Import Violations:")
-    if not report["imports"]["violations"]:
-        print("  ✅ No import violations found")
-    else:
-        print(f"  ❌ Found {report['imports']['total']} violations:")
-        for i, violation in enumerate(report["imports"]["violations"][:10], 1):
-            print(f"  {i}. {violation['file']}")
-            print(f"     ↳ Imports from: {violation['import']}")
-            print(f"     ↳ Error: {violation['message']}")
-
-        if len(report["imports"]["violations"]) > 10:
-            print(f"     ... and {len(report['imports']['violations']) - 10} more violations")
-
-    print("\n📊 Directory Structure Issues:")
-    if not report["structure"]["directory_violations"]:
-        print("  ✅ No directory structure issues found")
-    else:
-        print(f"  ❌ Found {len(report['structure']['directory_violations'])} issues:")
-        for i, violation in enumerate(report["structure"]["directory_violations"][:10], 1):
-            print(f"  {i}. {violation['file']}")
-            print(f"     ↳ Error: {violation['message']}")
-
-    print("\n=== End of Report ===")
+# ------ fsd_checker/reporters/console.py ------
+"""
+Console reporter for FSD Architecture Checker.
+"""
+
+from typing import Dict, Any
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Print formatted report to console"""
+    print("\n=== FSD Architecture Check Report ===\n")
+
+    print("📁 Project Structure:")
+    layers = report["rules"]["allowed_access"].keys()
+    for layer in layers:
+        if layer in report["structure"]["missing_layers"]:
+            print(f"  ❌ {layer} (missing)")
+        else:
+            print(f"  ✅ {layer} ({len(report['structure']['layers'][layer])} slices)")
+
+    print("\n🔍 Import Violations:")
+    if not report["imports"]["total"]:
+        print("  ✅ No import violations found")
+    else:
+        print(f"  ❌ Found {report['imports']['total']} violations:")
+        # Streamed reports do not keep the violations, only their total
+        listed = report["imports"]["violations"][:10]
+        for i, violation in enumerate(listed, 1):
+            print(f"  {i}. {violation['file']}")
+            print(f"     ↳ Imports from: {violation['import']}")
+            print(f"     ↳ Error: {violation['message']}")
+
+        if report["imports"]["total"] > len(listed):
+            print(f"     ... and {report['imports']['total'] - len(listed)} more violations")
+
+    skipped = report["imports"].get("skipped", [])
+    if skipped:
+        print(f"\n⏭️  Skipped Files ({len(skipped)}):")
+        for i, entry in enumerate(skipped[:10], 1):
+            print(f"  {i}. {entry['file']}")
+            print(f"     ↳ Reason: {entry['message']}")
+
+        if len(skipped) > 10:
+            print(f"     ... and {len(skipped) - 10} more skipped files")
+
+    cycles = report.get("cycles", {})
+    if any(cycles.values()):
+        print("\n🔁 Import Cycles:")
+        for level in ("layer", "slice", "file"):
+            level_cycles = cycles.get(level, [])
+            if not level_cycles:
+                continue
+            print(f"  ❌ {len(level_cycles)} {level} cycles:")
+            for i, cycle in enumerate(level_cycles[:5], 1):
+                print(f"  {i}. {cycle['size']} {level}s: {' → '.join(cycle['path'])}")
+
+            if len(level_cycles) > 5:
+                print(f"     ... and {len(level_cycles) - 5} more {level} cycles")
+
+    lazy = report.get("lazy")
+    if lazy and lazy["defeated"]:
+        print(f"\n💤 Lazy Boundaries ({len(lazy['defeated'])} of {lazy['lazy_modules']} lazy modules loaded eagerly):")
+        for i, split in enumerate(lazy["defeated"][:5], 1):
+            print(f"  {i}. {split['module']}")
+            for importer in split["static_importers"][:3]:
+                print(f"     ↳ {' → '.join(importer['chain'])}")
+            if len(split["static_importers"]) > 3:
+                print(f"     ... and {len(split['static_importers']) - 3} more static imports")
+
+        if len(lazy["defeated"]) > 5:
+            print(f"     ... and {len(lazy['defeated']) - 5} more lazy modules")
+
+    assets = report.get("assets")
+    if assets and assets["total"]["files"]:
+        print(f"\n🖼️  Static Assets: {assets['total']['files']} files, {assets['total']['bytes'] / 1024:.1f} KB")
+        for entry in assets["slices"][:5]:
+            print(f"  {entry['bytes'] / 1024:>10.1f} KB  {entry['slice']} ({entry['files']} files)")
+        if assets["duplicates"]:
+            print(f"  ⚠️  {len(assets['duplicates'])} groups of identical assets")
+
+    stylesheets = report.get("stylesheets")
+    if stylesheets and stylesheets["partials"]:
+        print(f"\n🎨 Stylesheet Fan-in ({stylesheets['stylesheets']} stylesheets, "
+              f"{stylesheets['imports']} imports between them):")
+        for partial in stylesheets["partials"][:5]:
+            print(f"  {partial['components']:>5} components, {partial['stylesheets']:>4} stylesheets  {partial['file']}")
+
+    print("\n📊 Directory Structure Issues:")
+    if not report["structure"]["directory_violations"]:
+        print("  ✅ No directory structure issues found")
+    else:
+        print(f"  ❌ Found {len(report['structure']['directory_violations'])} issues:")
+        for i, violation in enumerate(report["structure"]["directory_violations"][:10], 1):
+            print(f"  {i}. {violation['file']}")
+            print(f"     ↳ Error: {violation['message']}")
+
+    baseline = report.get("baseline")
+    if baseline:
+        print(f"\n📌 Baseline {baseline['file']}: {baseline['suppressed']} known violations not shown")
+        if baseline["resolved"]:
+            print(f"  ✅ {baseline['resolved']} baseline entries resolved")
+
+    print("\n=== End of Report ===")
@@ -1,13 +1,79 @@
-# ------ fsd_checker/reporters/json_reporter.py ------
-"""
-JSON reporter for FSD Architecture Checker.
-"""
-
-import json
-from typing import Dict, Any
-
-def export_report_to_json(report: Dict[str, Any], output_file: str = "fsd_report.json") -> None:
-    """Export report to JSON file"""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
-    print(f"\nReport exported to {output_file}")
+# ------ fsd_checker/reporters/json_reporter.py ------
+"""
+JSON reporter for FSD Architecture Checker.
+"""
+
+import json
+from typing import Any, Callable, Dict, IO
+
+from ..violations import ImportViolationTable, json_default
+from .jsonl_reporter import open_output
+
+# Indentation of one nesting level in the indented form
+_INDENT = "  "
+
+
+def _encode(value: Any, level: int, compact: bool) -> str:
+    """Encode a value nested level objects deep"""
+    if compact:
+        return json.dumps(value, separators=(',', ':'), default=json_default)
+    return json.dumps(value, indent=len(_INDENT), default=json_default).replace("\n", "\n" + _INDENT * level)
+
+
+def _write_object(f: IO[str], members: Dict[str, Any], level: int, compact: bool,
+                  write_value: Callable[[str, Any, int], None]) -> None:
+    """Write a JSON object member by member, each value through write_value(key, value, level)"""
+    if not members:
+        f.write("{}")
+        return
+    pad = "" if compact else "\n" + _INDENT * (level + 1)
+    f.write("{")
+    for i, (key, value) in enumerate(members.items()):
+        if i:
+            f.write(",")
+        f.write(pad + json.dumps(key) + (":" if compact else ": "))
+        write_value(key, value, level + 1)
+    f.write("}" if compact else "\n" + _INDENT * level + "}")
+
+
+def _write_violations(f: IO[str], violations: ImportViolationTable, level: int, compact: bool) -> None:
+    """Write a violation table as a JSON array, building one row dict at a time"""
+    pad = "" if compact else "\n" + _INDENT * (level + 1)
+    f.write("[")
+    for i, violation in enumerate(violations):
+        if i:
+            f.write(",")
+        f.write(pad + _encode(dict(violation), level + 1, compact))
+    f.write("]" if compact else "\n" + _INDENT * level + "]")
+
+
+def dump_report(report: Dict[str, Any], f: IO[str], compact: bool = False) -> None:
+    """Write a report as JSON, encoding a violation table one row at a time"""
+    violations = report["imports"]["violations"]
+    if not isinstance(violations, ImportViolationTable) or not violations:
+        json.dump(report, f, indent=None if compact else len(_INDENT),
+                  separators=(',', ':') if compact else None, default=json_default)
+        return
+
+    # The output is what json.dump would write, with the table streamed in place
+    def write_import_value(key: str, value: Any, level: int) -> None:
+        if key == "violations":
+            _write_violations(f, value, level, compact)
+        else:
+            f.write(_encode(value, level, compact))
+
+    def write_report_value(key: str, value: Any, level: int) -> None:
+        if key == "imports":
+            _write_object(f, value, level, compact, write_import_value)
+        else:
+            f.write(_encode(value, level, compact))
+
+    _write_object(f, report, 0, compact, write_report_value)
+
+
+def export_report_to_json(report: Dict[str, Any], output_file: str = "fsd_report.json",
+                          compact: bool = False) -> None:
+    """Export report to JSON file (gzip-compressed if the name ends in .gz)"""
+    with open_output(output_file) as f:
+        dump_report(report, f, compact)
+    print(f"\nReport exported to {output_file}")
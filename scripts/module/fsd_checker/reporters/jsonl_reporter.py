@@ -0,0 +1,103 @@
+"""
+Streaming JSON Lines reporter for FSD Architecture Checker.
+
+Import violations are written one per line as they are found, so they
+never have to be held in memory. The stream starts with a header line and
+ends with a "report" line carrying the rest of the report (structure,
+skipped files, cycles, rules and the violation total). Files ending in
+.gz are gzip-compressed.
+"""
+
+import gzip
+import json
+from typing import Any, Dict, IO, Iterator
+
+STREAM_FORMAT = "fsd-report-stream"
+STREAM_VERSION = 1
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def open_output(output_file: str) -> IO[str]:
+    """Open a text file for writing, gzip-compressed if the name ends in .gz"""
+    if output_file.endswith(".gz"):
+        return gzip.open(output_file, 'wt', encoding='utf-8')
+    return open(output_file, 'w', encoding='utf-8')
+
+
+def open_input(input_file: str) -> IO[str]:
+    """Open a text file for reading, detecting gzip compression from its content"""
+    with open(input_file, 'rb') as f:
+        magic = f.read(2)
+    if magic == _GZIP_MAGIC:
+        return gzip.open(input_file, 'rt', encoding='utf-8')
+    return open(input_file, 'r', encoding='utf-8')
+
+
+def _dump_line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(',', ':'), ensure_ascii=False) + "\n"
+
+
+class JsonlReportWriter:
+    """Write a report as a stream of JSON lines"""
+
+    def __init__(self, output_file: str):
+        """
+        Open the stream and write its header.
+
+        Args:
+            output_file: Output path (gzip-compressed if it ends in .gz)
+        """
+        self.output_file = output_file
+        self.file = open_output(output_file)
+        self.file.write(_dump_line({"type": "header", "format": STREAM_FORMAT, "version": STREAM_VERSION}))
+
+    def write_violation(self, violation: Dict[str, Any]) -> None:
+        """Write one import violation"""
+        self.file.write(_dump_line({"type": "violation", "data": violation}))
+
+    def finish(self, report: Dict[str, Any]) -> None:
+        """Write the rest of the report and close the stream"""
+        imports = dict(report["imports"])
+        imports.pop("violations", None)
+        self.file.write(_dump_line({"type": "report", "data": dict(report, imports=imports)}))
+        self.close()
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+    def __enter__(self) -> "JsonlReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def is_report_stream(input_file: str) -> bool:
+    """Check whether a file is a streamed (JSON Lines) report"""
+    with open_input(input_file) as f:
+        # The header is short; do not pull a whole compact JSON report into memory
+        first_line = f.readline(1024)
+    try:
+        header = json.loads(first_line)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(header, dict) and header.get("format") == STREAM_FORMAT
+
+
+def read_report_stream(input_file: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a streamed report one at a time.
+
+    Raises:
+        ValueError: If the file is not a streamed report of a known version
+    """
+    with open_input(input_file) as f:
+        header = json.loads(f.readline())
+        if header.get("format") != STREAM_FORMAT or header.get("version") != STREAM_VERSION:
+            raise ValueError(f"{input_file} is not a streamed FSD report of version {STREAM_VERSION}")
+
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -1,141 +1,305 @@
-# ------ fsd_checker/reporters/markdown.py ------
-"""
-Markdown reporter for FSD Architecture Checker.
-"""
-
-import os
-import datetime
-from typing import Dict, Any
-
-def generate_markdown_report(report: Dict[str, Any], output_file: str = "fsd_report.md") -> None:
-    """Generate a markdown report of FSD architecture check results"""
-    with open(output_file, 'w', encoding='utf-8') as md_file:
-        # Header
-        md_file.write("# FSD Architecture Check Report\n\n")
-        md_file.write(f"*Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-
-        # Project structure overview
-        md_file.write("## 📁 Project Structure\n\n")
-
-        # Layer status table
-        md_file.write("| Layer | Status | Slices |\n")
-        md_file.write("|-------|--------|--------|\n")
-
-        layers = list(report["rules"]["allowed_access"].keys())
-        for layer in layers:
-            if layer in report["structure"]["missing_layers"]:
-                md_file.write(f"| `{layer}` | ❌ Missing | - |\n")
-            else:
-                slice_count = len(report["structure"]["layers"][layer])
-                md_file.write(f"| `{layer}` | ✅ Present | {slice_count} |\n")
-
-        md_file.write("\n")
-
-        # Detailed structure
-        md_file.write("### Layer Contents\n\n")
-        for layer in layers:
-            if layer not in report["structure"]["missing_layers"]:
-                slices = report["structure"]["layers"][layer]
-                md_file.write(f"<details>\n<summary><b>{layer}</b> ({len(slices)} slices)</summary>\n\n")
-
-                if slices:
-                    md_file.write("```\n")
-                    for slice_name in sorted(slices):
-                        md_file.write(f"└── {slice_name}\n")
-                    md_file.write("```\n")
-                else:
-                    md_file.write("*No slices found in this layer*\n")
-
-                md_file.write("</details>\n\n")
-
-        # Dependency Rules
-        md_file.write("## 📏 Dependency Rules\n\n")
-        md_file.write("| Layer | Can Import From |\n")
-        md_file.write("|-------|----------------|\n")
-
-        for layer, allowed in report["rules"]["allowed_access"].items():
-            allowed_str = ", ".join([f"`{l}`" for l in allowed]) if allowed else "*none*"
-            md_file.write(f"| `{layer}` | {allowed_str} |\n")
-
-        # Import Violations
-        md_file.write("\n## 🔍 Import Violations\n\n")
-
-        violations = report["imports"]["violations"]
-        if not violations:
-            md_file.write("✅ **No import violations found**\n\n")
-        else:
-            md_file.write(f"❌ **Found {len(violations)} violations**\n\n")
-
-            # Group violations by from_layer -> to_layer
-            violation_groups = {}
-            for v in violations:
-                key = f"{v['from_layer']} → {v['to_layer']}"
-                if key not in violation_groups:
-                    violation_groups[key] = []
-                violation_groups[key].append(v)
-
-            # List violation groups
-            md_file.write("### Violation Summary\n\n")
-            md_file.write("| From Layer | To Layer | Count |\n")
-            md_file.write("|------------|----------|-------|\n")
-
-            for group_key, group_violations in sorted(violation_groups.items()):
-                from_layer, to_layer = group_key.split(" → ")
-                md_file.write(f"| `{from_layer}` | `{to_layer}` | {len(group_violations)} |\n")
-
-            # Detailed violations
-            md_file.write("\n### Detailed Violations\n\n")
-
-            for group_key, group_violations in sorted(violation_groups.items()):
-                from_layer, to_layer = group_key.split(" → ")
-
-                md_file.write(f"<details>\n<summary><b>{from_layer} → {to_layer}</b> ({len(group_violations)} violations)</summary>\n\n")
-
-                for i, v in enumerate(group_violations[:20], 1):
-                    file_path = v['file'].replace(os.path.join(os.getcwd(), ''), '')
-                    md_file.write(f"**{i}.** `{file_path}`\n")
-                    md_file.write(f"   - Imports: `{v['import']}`\n")
-                    md_file.write(f"   - Error: {v['message']}\n\n")
-
-                if len(group_violations) > 20:
-                    md_file.write(f"*...and {len(group_violations) - 20} more violations*\n\n")
-
-                md_file.write("</details>\n\n")
-
-        # Directory Structure Issues
-        md_file.write("## 📊 Directory Structure Issues\n\n")
-
-        dir_violations = report["structure"]["directory_violations"]
-        if not dir_violations:
-            md_file.write("✅ **No directory structure issues found**\n\n")
-        else:
-            md_file.write(f"❌ **Found {len(dir_violations)} issues**\n\n")
-
-            md_file.write("<details>\n<summary>Directory Structure Issues</summary>\n\n")
-
-            for i, v in enumerate(dir_violations[:20], 1):
-                file_path = v['file'].replace(os.path.join(os.getcwd(), ''), '')
-                md_file.write(f"**{i}.** `{file_path}`\n")
-                md_file.write(f"   - Error: {v['message']}\n\n")
-
-            if len(dir_violations) > 20:
-                md_file.write(f"*...and {len(dir_violations) - 20} more issues*\n\n")
-
-            md_file.write("</details>\n\n")
-
-        # Conclusion
-        total_issues = len(violations) + len(dir_violations)
-        if total_issues == 0:
-            md_file.write("## ✅ Conclusion\n\n")
-            md_file.write("Your project successfully follows the FSD architecture principles. Great job! 🎉\n")
-        else:
-            md_file.write("## ⚠️ Conclusion\n\n")
-            md_file.write(f"Found **{total_issues}** issues that need to be addressed.\n\n")
-            md_file.write("### Recommendations\n\n")
-
-            if violations:
-                md_file.write("1. **Fix import violations** - Ensure imports follow the allowed layer dependencies\n")
-            if dir_violations:
-                md_file.write(f"{'2' if violations else '1'}. **Fix directory structure** - Organize files according to FSD principles\n")
-
-    print(f"\nMarkdown report exported to {output_file}")
+# ------ fsd_checker/reporters/markdown.py ------
+"""
+Markdown reporter for FSD Architecture Checker.
+"""
+
+import os
+import datetime
+from typing import Dict, Any
+
+def generate_markdown_report(report: Dict[str, Any], output_file: str = "fsd_report.md") -> None:
+    """Generate a markdown report of FSD architecture check results"""
+    with open(output_file, 'w', encoding='utf-8') as md_file:
+        # Header
+        md_file.write("# FSD Architecture Check Report\n\n")
+        md_file.write(f"*Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
+
+        # Project structure overview
+        md_file.write("## 📁 Project Structure\n\n")
+
+        # Layer status table
+        md_file.write("| Layer | Status | Slices |\n")
+        md_file.write("|-------|--------|--------|\n")
+
+        layers = list(report["rules"]["allowed_access"].keys())
+        for layer in layers:
+            if layer in report["structure"]["missing_layers"]:
+                md_file.write(f"| `{layer}` | ❌ Missing | - |\n")
+            else:
+                slice_count = len(report["structure"]["layers"][layer])
+                md_file.write(f"| `{layer}` | ✅ Present | {slice_count} |\n")
+
+        md_file.write("\n")
+
+        # Detailed structure
+        md_file.write("### Layer Contents\n\n")
+        for layer in layers:
+            if layer not in report["structure"]["missing_layers"]:
+                slices = report["structure"]["layers"][layer]
+                md_file.write(f"<details>\n<summary><b>{layer}</b> ({len(slices)} slices)</summary>\n\n")
+
+                if slices:
+                    md_file.write("```\n")
+                    for slice_name in sorted(slices):
+                        md_file.write(f"└── {slice_name}\n")
+                    md_file.write("```\n")
+                else:
+                    md_file.write("*No slices found in this layer*\n")
+
+                md_file.write("</details>\n\n")
+
+        # Dependency Rules
+        md_file.write("## 📏 Dependency Rules\n\n")
+        md_file.write("| Layer | Can Import From |\n")
+        md_file.write("|-------|----------------|\n")
+
+        for layer, allowed in report["rules"]["allowed_access"].items():
+            allowed_str = ", ".join([f"`{l}`" for l in allowed]) if allowed else "*none*"
+            md_file.write(f"| `{layer}` | {allowed_str} |\n")
+
+        slice_rules = report["rules"].get("slice_rules")
+        if slice_rules:
+            md_file.write("\n### Slice Rules\n\n")
+            md_file.write("| From | Disallow | Allow | Public API only |\n")
+            md_file.write("|------|----------|-------|-----------------|\n")
+            for rule in slice_rules:
+                cells = []
+                for key in ("disallow", "allow", "public_api"):
+                    targets = [rule[key]] if isinstance(rule.get(key), str) else rule.get(key) or []
+                    cells.append(", ".join(f"`{target}`" for target in targets) or "-")
+                md_file.write(f"| `{rule['from']}` | {' | '.join(cells)} |\n")
+
+        if report["rules"].get("runtime_only"):
+            md_file.write("\n*Only runtime imports are checked; type-only imports are erased at build time.*\n")
+
+        # Import Violations
+        md_file.write("\n## 🔍 Import Violations\n\n")
+
+        violations = report["imports"]["violations"]
+        violation_total = report["imports"]["total"]
+
+        edges = report["imports"].get("edges")
+        if edges:
+            md_file.write(f"Resolved imports: {edges['runtime']} runtime, {edges['side-effect']} side-effect, "
+                          f"{edges['dynamic']} dynamic, {edges['type']} type-only\n\n")
+
+        baseline = report.get("baseline")
+        if baseline:
+            md_file.write(f"📌 {baseline['suppressed']} known violations from the baseline `{baseline['file']}` are not shown"
+                          + (f"; {baseline['resolved']} baseline entries were resolved" if baseline["resolved"] else "")
+                          + ".\n\n")
+
+        if not violation_total:
+            md_file.write("✅ **No import violations found**\n\n")
+        else:
+            md_file.write(f"❌ **Found {violation_total} violations**\n\n")
+
+            # Group violations by from_layer -> to_layer
+            violation_groups = {}
+            for v in violations:
+                key = f"{v['from_layer']} → {v['to_layer']}"
+                if key not in violation_groups:
+                    violation_groups[key] = []
+                violation_groups[key].append(v)
+
+            # Reports read from a stream keep a sample of each group plus its full count
+            group_totals = report["imports"].get("group_totals") or {
+                key: len(group_violations) for key, group_violations in violation_groups.items()
+            }
+            # List violation groups
+            md_file.write("### Violation Summary\n\n")
+            md_file.write("| From Layer | To Layer | Count |\n")
+            md_file.write("|------------|----------|-------|\n")
+
+            for group_key, group_violations in sorted(violation_groups.items()):
+                from_layer, to_layer = group_key.split(" → ")
+                md_file.write(f"| `{from_layer}` | `{to_layer}` | {group_totals[group_key]} |\n")
+
+            # Detailed violations
+            md_file.write("\n### Detailed Violations\n\n")
+
+            for group_key, group_violations in sorted(violation_groups.items()):
+                from_layer, to_layer = group_key.split(" → ")
+
+                md_file.write(f"<details>\n<summary><b>{from_layer} → {to_layer}</b> ({group_totals[group_key]} violations)</summary>\n\n")
+
+                for i, v in enumerate(group_violations[:20], 1):
+                    file_path = v['file'].replace(os.path.join(os.getcwd(), ''), '')
+                    md_file.write(f"**{i}.** `{file_path}`\n")
+                    md_file.write(f"   - Imports: `{v['import']}`\n")
+                    md_file.write(f"   - Error: {v['message']}\n\n")
+
+                if group_totals[group_key] > 20:
+                    md_file.write(f"*...and {group_totals[group_key] - 20} more violations*\n\n")
+
+                md_file.write("</details>\n\n")
+
+        # Skipped files
+        skipped = report["imports"].get("skipped", [])
+        if skipped:
+            md_file.write("## ⏭️ Skipped Files\n\n")
+            md_file.write(f"**{len(skipped)}** files were not analyzed\n\n")
+            md_file.write("| File | Reason |\n")
+            md_file.write("|------|--------|\n")
+
+            for entry in skipped:
+                file_path = entry['file'].replace(os.path.join(os.getcwd(), ''), '')
+                md_file.write(f"| `{file_path}` | {entry['message']} |\n")
+
+            md_file.write("\n")
+
+        # Import cycles
+        cycles = report.get("cycles", {})
+        md_file.write("## 🔁 Import Cycles\n\n")
+        if not any(cycles.values()):
+            md_file.write("✅ **No import cycles found**\n\n")
+        else:
+            md_file.write("| Level | Cycles | Largest |\n")
+            md_file.write("|-------|--------|---------|\n")
+            for level in ("layer", "slice", "file"):
+                level_cycles = cycles.get(level, [])
+                largest = max((cycle["size"] for cycle in level_cycles), default=0)
+                md_file.write(f"| {level} | {len(level_cycles)} | {largest} |\n")
+            md_file.write("\n")
+
+            for level in ("layer", "slice", "file"):
+                level_cycles = cycles.get(level, [])
+                if not level_cycles:
+                    continue
+
+                md_file.write(f"<details>\n<summary><b>{level.capitalize()} cycles</b> ({len(level_cycles)} cycles)</summary>\n\n")
+
+                for i, cycle in enumerate(level_cycles[:20], 1):
+                    path = " → ".join(f"`{member.replace(os.path.join(os.getcwd(), ''), '')}`"
+                                      for member in cycle["path"])
+                    md_file.write(f"**{i}.** {cycle['size']} {level}s\n")
+                    md_file.write(f"   - Shortest path: {path}\n\n")
+
+                if len(level_cycles) > 20:
+                    md_file.write(f"*...and {len(level_cycles) - 20} more cycles*\n\n")
+
+                md_file.write("</details>\n\n")
+
+        # Lazy boundaries
+        lazy = report.get("lazy")
+        if lazy:
+            md_file.write("## 💤 Lazy Boundaries\n\n")
+            entry = lazy["entry"].replace(os.path.join(os.getcwd(), ''), '')
+            if not lazy["defeated"]:
+                md_file.write(f"✅ **All {lazy['lazy_modules']} lazy modules stay out of the `{entry}` bundle**\n\n")
+            else:
+                md_file.write(f"**{len(lazy['defeated'])}** of {lazy['lazy_modules']} lazy modules are also "
+                              f"imported statically from `{entry}`, which loads them eagerly\n\n")
+                md_file.write("| Lazy module | Loaded lazily by | Static imports |\n")
+                md_file.write("|-------------|------------------|----------------|\n")
+                for split in lazy["defeated"]:
+                    module = split["module"].replace(os.path.join(os.getcwd(), ''), '')
+                    md_file.write(f"| `{module}` | {len(split['lazy_importers'])} | {len(split['static_importers'])} |\n")
+                md_file.write("\n")
+
+                for split in lazy["defeated"][:20]:
+                    module = split["module"].replace(os.path.join(os.getcwd(), ''), '')
+                    md_file.write(f"<details>\n<summary><b>{module}</b> "
+                                  f"({len(split['static_importers'])} static imports)</summary>\n\n")
+                    for importer in split["static_importers"]:
+                        chain = " → ".join(f"`{member.replace(os.path.join(os.getcwd(), ''), '')}`"
+                                           for member in importer["chain"])
+                        md_file.write(f"- `{importer['import']}`: {chain}\n")
+                    md_file.write("\n</details>\n\n")
+
+                if len(lazy["defeated"]) > 20:
+                    md_file.write(f"*...and {len(lazy['defeated']) - 20} more lazy modules*\n\n")
+
+        # Static assets
+        assets = report.get("assets")
+        if assets and assets["total"]["files"]:
+            md_file.write("## 🖼️ Static Assets\n\n")
+            md_file.write(f"**{assets['total']['files']}** stylesheets, images, fonts and media files imported, "
+                          f"{assets['total']['bytes'] / 1024:.1f} KB in total\n\n")
+
+            md_file.write("| Layer | Files | Size |\n")
+            md_file.write("|-------|-------|------|\n")
+            for layer, totals in assets["layers"].items():
+                md_file.write(f"| `{layer}` | {totals['files']} | {totals['bytes'] / 1024:.1f} KB |\n")
+            md_file.write("\n")
+
+            md_file.write("<details>\n<summary><b>Slices</b> (heaviest first)</summary>\n\n")
+            md_file.write("| Slice | Files | Size |\n")
+            md_file.write("|-------|-------|------|\n")
+            for entry in assets["slices"][:50]:
+                md_file.write(f"| `{entry['slice']}` | {entry['files']} | {entry['bytes'] / 1024:.1f} KB |\n")
+            md_file.write("\n</details>\n\n")
+
+            for title, key in (("Largest assets", "largest"), ("Assets shared by several slices", "shared")):
+                if not assets[key]:
+                    continue
+                md_file.write(f"<details>\n<summary><b>{title}</b> ({len(assets[key])})</summary>\n\n")
+                md_file.write("| Asset | Size | Slices |\n")
+                md_file.write("|-------|------|--------|\n")
+                for entry in assets[key]:
+                    file_path = entry['file'].replace(os.path.join(os.getcwd(), ''), '')
+                    slices = ", ".join(f"`{owner}`" for owner in entry["slices"])
+                    md_file.write(f"| `{file_path}` | {entry['size'] / 1024:.1f} KB | {slices} |\n")
+                md_file.write("\n</details>\n\n")
+
+            if assets["duplicates"]:
+                md_file.write(f"⚠️ **{len(assets['duplicates'])}** groups of assets have identical content:\n\n")
+                for group in assets["duplicates"]:
+                    files = ", ".join(f"`{file_path.replace(os.path.join(os.getcwd(), ''), '')}`"
+                                      for file_path in group["files"])
+                    md_file.write(f"- {group['size'] / 1024:.1f} KB each: {files}\n")
+                md_file.write("\n")
+
+        # Stylesheet fan-in
+        stylesheets = report.get("stylesheets")
+        if stylesheets and stylesheets["partials"]:
+            md_file.write("## 🎨 Stylesheet Fan-in\n\n")
+            md_file.write(f"**{stylesheets['stylesheets']}** stylesheets checked, **{stylesheets['imports']}** "
+                          f"`@use`/`@forward`/`@import` rules between them. Partials that recompile the most "
+                          f"components when they change:\n\n")
+            md_file.write("| Partial | Stylesheets | Components | Examples |\n")
+            md_file.write("|---------|-------------|------------|----------|\n")
+            for partial in stylesheets["partials"]:
+                file_path = partial['file'].replace(os.path.join(os.getcwd(), ''), '')
+                examples = ", ".join(f"`{example.replace(os.path.join(os.getcwd(), ''), '')}`"
+                                     for example in partial["examples"])
+                md_file.write(f"| `{file_path}` | {partial['stylesheets']} | {partial['components']} | {examples} |\n")
+            md_file.write("\n")
+
+        # Directory Structure Issues
+        md_file.write("## 📊 Directory Structure Issues\n\n")
+
+        dir_violations = report["structure"]["directory_violations"]
+        if not dir_violations:
+            md_file.write("✅ **No directory structure issues found**\n\n")
+        else:
+            md_file.write(f"❌ **Found {len(dir_violations)} issues**\n\n")
+
+            md_file.write("<details>\n<summary>Directory Structure Issues</summary>\n\n")
+
+            for i, v in enumerate(dir_violations[:20], 1):
+                file_path = v['file'].replace(os.path.join(os.getcwd(), ''), '')
+                md_file.write(f"**{i}.** `{file_path}`\n")
+                md_file.write(f"   - Error: {v['message']}\n\n")
+
+            if len(dir_violations) > 20:
+                md_file.write(f"*...and {len(dir_violations) - 20} more issues*\n\n")
+
+            md_file.write("</details>\n\n")
+
+        # Conclusion
+        total_issues = violation_total + len(dir_violations)
+        if total_issues == 0:
+            md_file.write("## ✅ Conclusion\n\n")
+            md_file.write("Your project successfully follows the FSD architecture principles. Great job! 🎉\n")
+        else:
+            md_file.write("## ⚠️ Conclusion\n\n")
+            md_file.write(f"Found **{total_issues}** issues that need to be addressed.\n\n")
+            md_file.write("### Recommendations\n\n")
+
+            if violation_total:
+                md_file.write("1. **Fix import violations** - Ensure imports follow the allowed layer dependencies\n")
+            if dir_violations:
+                md_file.write(f"{'2' if violation_total else '1'}. **Fix directory structure** - Organize files according to FSD principles\n")
+
+    print(f"\nMarkdown report exported to {output_file}")
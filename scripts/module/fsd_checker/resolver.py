@@ -0,0 +1,292 @@
+"""
+Module resolution for the FSD Architecture Checker.
+
+Resolves import specifiers to real files the way the project's toolchain
+does: `paths` and `baseUrl` come from tsconfig.json, and the probed
+extensions come from the Vite resolve config. Stylesheet references
+follow the Sass rules instead: relative to the stylesheet first, with
+`_partial` and `_index` files. Resolutions and directory listings are
+memoized, so repeated specifiers cost no extra syscalls.
+"""
+
+import copy
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .cache import hash_content
+
+DEFAULT_EXTENSIONS = ['.js', '.jsx', '.ts', '.tsx']
+
+# Extensions Sass tries for an @use, @forward or @import target without one
+STYLESHEET_EXTENSIONS = ['.scss', '.sass', '.css']
+
+# Sizes of the per-resolver LRU caches
+RESOLVE_CACHE_SIZE = 65536
+LISTDIR_CACHE_SIZE = 16384
+
+_JSON_COMMENT_RE = re.compile(r'''
+    ("(?:\\.|[^"\\])*")         # strings are kept as they are
+  | //[^\n]*                    # line comment
+  | /\*.*?\*/                   # block comment
+''', re.VERBOSE | re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+_EXTENSIONS_RE = re.compile(r'extensions\s*:\s*\[([^\]]*)\]')
+_STRING_RE = re.compile(r'''['"]([^'"]+)['"]''')
+
+
+def load_jsonc(file_path: str) -> Dict[str, Any]:
+    """Load a JSON file that may contain comments and trailing commas (tsconfig style)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    text = _JSON_COMMENT_RE.sub(lambda m: m.group(1) or '', text)
+    text = _TRAILING_COMMA_RE.sub(r'\1', text)
+    return json.loads(text)
+
+
+def read_vite_extensions(config_path: str) -> Optional[List[str]]:
+    """Read the `extensions` list from a Vite resolve config file"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            match = _EXTENSIONS_RE.search(f.read())
+    except OSError:
+        return None
+    if not match:
+        return None
+    return _STRING_RE.findall(match.group(1)) or None
+
+
+def find_project_root(base_dir: str) -> Optional[str]:
+    """Find the closest directory at or above base_dir containing tsconfig.json"""
+    current = os.path.abspath(base_dir)
+    while True:
+        if os.path.isfile(os.path.join(current, "tsconfig.json")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+class ModuleResolver:
+    """
+    Resolve import specifiers to files using tsconfig paths and Vite extensions.
+
+    Paths are returned in the same form as base_dir (relative stays
+    relative), so they line up with the paths produced by the directory scan.
+    """
+
+    def __init__(self, base_dir: str = "src",
+                 tsconfig_path: Optional[str] = None,
+                 vite_resolve_config: Optional[str] = None):
+        """
+        Initialize the resolver.
+
+        Args:
+            base_dir: Directory containing the FSD layers
+            tsconfig_path: tsconfig.json to read (searched upwards from base_dir if None)
+            vite_resolve_config: Vite resolve config to read extensions from
+                                 (config/resolveConfig.ts next to tsconfig if None)
+        """
+        self.base_dir = base_dir
+        self.config: Dict[str, Any] = {}
+
+        if tsconfig_path is None:
+            root = find_project_root(base_dir)
+            tsconfig_path = os.path.join(root, "tsconfig.json") if root else None
+
+        if tsconfig_path and os.path.isfile(tsconfig_path):
+            project_root = os.path.dirname(tsconfig_path)
+            options = load_jsonc(tsconfig_path).get("compilerOptions", {})
+            self.config["tsconfig"] = options
+        else:
+            project_root = os.path.dirname(os.path.abspath(base_dir))
+            # Without a tsconfig, fall back to the conventional aliases
+            options = {"baseUrl": ".", "paths": {"@/*": [f"{os.path.basename(os.path.abspath(base_dir))}/*"]}}
+
+        # Express the project root in the same form as base_dir
+        if os.path.isabs(base_dir):
+            self.project_root = project_root
+        else:
+            self.project_root = os.path.relpath(project_root)
+
+        base_url = options.get("baseUrl")
+        self.base_url = os.path.normpath(os.path.join(self.project_root, base_url)) if base_url is not None else None
+        paths_root = self.base_url or self.project_root
+        self.path_patterns: List[Tuple[str, str, List[str]]] = []
+        for pattern, targets in options.get("paths", {}).items():
+            prefix, _, suffix = pattern.partition('*')
+            self.path_patterns.append((prefix, suffix if '*' in pattern else None,
+                                       [os.path.join(paths_root, target) for target in targets]))
+        # Longest prefix wins, as in TypeScript
+        self.path_patterns.sort(key=lambda item: len(item[0]), reverse=True)
+
+        if vite_resolve_config is None:
+            vite_resolve_config = os.path.join(project_root, "config", "resolveConfig.ts")
+        self.extensions = read_vite_extensions(vite_resolve_config) or DEFAULT_EXTENSIONS
+        self.config["extensions"] = self.extensions
+
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        """Create the memoization caches bound to this instance"""
+        self.resolve_cached = lru_cache(maxsize=RESOLVE_CACHE_SIZE)(self._resolve)
+        self.resolve_stylesheet = lru_cache(maxsize=RESOLVE_CACHE_SIZE)(self._resolve_stylesheet)
+        self.list_dir = lru_cache(maxsize=LISTDIR_CACHE_SIZE)(self._list_dir)
+        # Directories whose listing resolution depended on
+        self.listed_dirs: Set[str] = set()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Caches are per process; drop them when sent to a worker
+        state = self.__dict__.copy()
+        del state["resolve_cached"]
+        del state["resolve_stylesheet"]
+        del state["list_dir"]
+        del state["listed_dirs"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_caches()
+
+    def fresh(self) -> "ModuleResolver":
+        """A resolver with the same configuration and empty caches, seeing the tree as it is now"""
+        # Copying goes through __getstate__/__setstate__, which drop and recreate the caches
+        return copy.copy(self)
+
+    def fingerprint(self) -> str:
+        """Hash of the configuration that affects resolution results"""
+        return hash_content(json.dumps(self.config, sort_keys=True).encode('utf-8'))
+
+    def _list_dir(self, directory: str) -> Dict[str, bool]:
+        """Map entry names of a directory to whether they are directories"""
+        self.listed_dirs.add(directory)
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name: entry.is_dir() for entry in entries}
+        except OSError:
+            return {}
+
+    def _entry(self, path: str) -> Optional[bool]:
+        """Return True for a directory, False for a file, None if path does not exist"""
+        directory, name = os.path.split(path)
+        return self.list_dir(directory or os.curdir).get(name)
+
+    def _probe(self, candidate: str) -> Optional[str]:
+        """Find the file a path refers to, trying extensions and index files"""
+        candidate = os.path.normpath(candidate)
+        if self._entry(candidate) is False:
+            return candidate
+
+        for extension in self.extensions:
+            if self._entry(candidate + extension) is False:
+                return candidate + extension
+
+        if self._entry(candidate):
+            for extension in self.extensions:
+                index_file = os.path.join(candidate, "index" + extension)
+                if self._entry(index_file) is False:
+                    return index_file
+
+        return None
+
+    def candidates(self, specifier: str, importer_dir: str) -> List[str]:
+        """List the unprobed paths a specifier may refer to, in lookup order"""
+        if specifier.startswith('.'):
+            return [os.path.join(importer_dir, specifier)]
+
+        for prefix, suffix, targets in self.path_patterns:
+            if suffix is None:
+                if specifier == prefix:
+                    return list(targets)
+            elif specifier.startswith(prefix) and specifier.endswith(suffix) \
+                    and len(specifier) >= len(prefix) + len(suffix):
+                matched = specifier[len(prefix):len(specifier) - len(suffix)]
+                return [target.replace('*', matched) for target in targets]
+
+        if self.base_url is not None:
+            return [os.path.join(self.base_url, specifier)]
+        return []
+
+    def _resolve(self, specifier: str, importer_dir: Optional[str]) -> Optional[str]:
+        """Uncached resolution of a specifier"""
+        for candidate in self.candidates(specifier, importer_dir or os.curdir):
+            resolved = self._probe(candidate)
+            if resolved:
+                return resolved
+        return None
+
+    def resolve(self, specifier: str, importer_dir: str) -> Optional[str]:
+        """
+        Resolve a specifier imported from importer_dir to a file path.
+
+        Returns None for packages and for paths that do not exist.
+        """
+        # Only relative specifiers depend on the importing directory
+        return self.resolve_cached(specifier, importer_dir if specifier.startswith('.') else None)
+
+    def _probe_stylesheet(self, candidate: str) -> Optional[str]:
+        """Find the file a stylesheet reference points to, trying partials and index files"""
+        candidate = os.path.normpath(candidate)
+        if self._entry(candidate) is False:
+            return candidate
+
+        directory, name = os.path.split(candidate)
+        for extension in STYLESHEET_EXTENSIONS:
+            for file_name in (name + extension, "_" + name + extension):
+                path = os.path.join(directory, file_name)
+                if self._entry(path) is False:
+                    return path
+
+        if self._entry(candidate):
+            for extension in STYLESHEET_EXTENSIONS:
+                for file_name in ("_index" + extension, "index" + extension):
+                    index_file = os.path.join(candidate, file_name)
+                    if self._entry(index_file) is False:
+                        return index_file
+
+        return None
+
+    def _resolve_stylesheet(self, specifier: str, importer_dir: str) -> Optional[str]:
+        """
+        Resolve an @use, @forward, @import or url() target of a stylesheet
+        in importer_dir.
+
+        The target is looked up relative to the stylesheet first, then
+        through the tsconfig paths and baseUrl. A leading `~` (the webpack
+        convention for non-relative imports) is ignored.
+        """
+        for candidate in self.stylesheet_candidates(specifier, importer_dir):
+            resolved = self._probe_stylesheet(candidate)
+            if resolved:
+                return resolved
+        return None
+
+    def stylesheet_candidates(self, specifier: str, importer_dir: str) -> List[str]:
+        """List the unprobed paths a stylesheet reference may refer to, in lookup order"""
+        specifier = specifier.lstrip('~')
+        candidates = [os.path.join(importer_dir, specifier)]
+        if not specifier.startswith('.'):
+            candidates.extend(self.candidates(specifier, importer_dir))
+        return candidates
+
+    def probed_directories(self, specifier: str, importer_dir: str, stylesheet: bool = False) -> Set[str]:
+        """
+        Directories whose listings resolving a specifier reads.
+
+        Probing a candidate lists its parent (for the file itself, extensions
+        and partials) and the candidate (for index files), so the result can
+        only change when one of these directories changes.
+        """
+        if stylesheet:
+            candidates = self.stylesheet_candidates(specifier, importer_dir)
+        else:
+            candidates = self.candidates(specifier, importer_dir)
+        directories = set()
+        for candidate in candidates:
+            candidate = os.path.normpath(candidate)
+            directories.add(os.path.dirname(candidate) or os.curdir)
+            directories.add(candidate)
+        return directories
@@ -0,0 +1,244 @@
+"""
+Compiled import rules for the FSD Architecture Checker.
+
+Layer rules are compiled into a bit matrix: one integer per source layer
+whose bits are the layers it may import. Slice rules (from the
+`slice_rules` of a boundaries file) match paths relative to the base
+directory, such as "features/auth" or "features/*", and are compiled
+into two path-prefix tries whose nodes carry bit masks of rule IDs. An
+import is then checked by walking the importer's and the target's path
+once each, whatever the number of rules.
+
+A slice rule has a "from" pattern and any of:
+
+    disallow    targets the matching files may not import
+    allow       targets they may import even if another rule forbids it
+    public_api  targets that may only be imported through their index file
+
+and an optional "message". Patterns are path prefixes whose segments are
+names or "*" (any one segment). Slice rules never apply to imports within
+the importer's own slice, so {"from": "features/*", "disallow":
+["features/*"]} forbids cross-imports between feature slices.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BOUNDARIES_PATH = "fsd_boundaries.json"
+
+# Mask kinds of the target trie
+_DISALLOW, _ALLOW, _PUBLIC_API = range(3)
+
+
+class _PathTrie:
+    """Path-prefix trie whose nodes carry one bit mask per kind"""
+
+    __slots__ = ("children", "wildcard", "masks")
+
+    def __init__(self, kinds: int):
+        self.children: Dict[str, "_PathTrie"] = {}
+        self.wildcard: Optional["_PathTrie"] = None
+        self.masks = [0] * kinds
+
+    def insert(self, pattern: str, kind: int, bit: int) -> None:
+        node = self
+        for segment in _split(pattern):
+            if segment == "*":
+                if node.wildcard is None:
+                    node.wildcard = _PathTrie(len(self.masks))
+                node = node.wildcard
+            else:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _PathTrie(len(self.masks))
+                node = child
+        node.masks[kind] |= bit
+
+    def match(self, segments: Sequence[str]) -> List[int]:
+        """OR of the masks of every pattern that is a prefix of the path"""
+        masks = list(self.masks)
+        frontier = [self]
+        for segment in segments:
+            next_frontier = []
+            for node in frontier:
+                for child in (node.children.get(segment), node.wildcard):
+                    if child is not None:
+                        next_frontier.append(child)
+                        for kind, mask in enumerate(child.masks):
+                            masks[kind] |= mask
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return masks
+
+
+def _split(pattern: str) -> List[str]:
+    return [segment for segment in pattern.replace("\\", "/").split("/") if segment]
+
+
+def _as_list(value: Any) -> List[str]:
+    return [value] if isinstance(value, str) else list(value or [])
+
+
+def validate_slice_rules(slice_rules: List[Dict[str, Any]]) -> None:
+    """
+    Check the shape of slice rules.
+
+    Raises:
+        ValueError: If a rule has no "from" pattern or no targets
+    """
+    for i, rule in enumerate(slice_rules):
+        if not isinstance(rule, dict) or not isinstance(rule.get("from"), str):
+            raise ValueError(f"Slice rule {i} needs a \"from\" pattern")
+        if not any(rule.get(key) for key in ("disallow", "allow", "public_api")):
+            raise ValueError(f"Slice rule {i} ({rule['from']}) has no disallow, allow or public_api targets")
+
+
+def load_boundaries(path: str) -> Dict[str, Any]:
+    """
+    Load the layer and slice rules of a boundaries file.
+
+    The layer rules are the file's "allowed_access", with the "allow" and
+    "disallow" entries of its "rules" list applied on top.
+
+    Returns:
+        {"layers": [...], "allowed_access": {...}, "slice_rules": [...]}
+
+    Raises:
+        ValueError: If the file is not a valid boundaries file
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} is not a boundaries file")
+
+    allowed_access = {layer: list(targets) for layer, targets in data.get("allowed_access", {}).items()}
+    for rule in data.get("rules", []):
+        layer = rule.get("from")
+        if not isinstance(layer, str):
+            raise ValueError(f"{path}: layer rule without a \"from\" layer")
+        allowed = allowed_access.setdefault(layer, [])
+        allowed.extend(target for target in _as_list(rule.get("allow")) if target not in allowed)
+        disallowed = set(_as_list(rule.get("disallow")))
+        allowed[:] = [target for target in allowed if target not in disallowed]
+
+    layers = list(allowed_access)
+    for targets in allowed_access.values():
+        layers.extend(target for target in targets if target not in layers)
+    if not layers:
+        raise ValueError(f"{path} defines no layers")
+
+    slice_rules = data.get("slice_rules", [])
+    validate_slice_rules(slice_rules)
+    return {"layers": layers, "allowed_access": allowed_access, "slice_rules": slice_rules}
+
+
+def load_slice_rules(path: str) -> List[Dict[str, Any]]:
+    """Load the slice rules of a rules file ({"slice_rules": [...]} or a bare list)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    slice_rules = data.get("slice_rules", []) if isinstance(data, dict) else data
+    if not isinstance(slice_rules, list):
+        raise ValueError(f"{path} has no list of slice rules")
+    validate_slice_rules(slice_rules)
+    return slice_rules
+
+
+class RuleEngine:
+    """Evaluates imports against the compiled layer and slice rules"""
+
+    def __init__(self,
+                 base_dir: str,
+                 layers: List[str],
+                 allowed_access: Dict[str, List[str]],
+                 slice_rules: Optional[List[Dict[str, Any]]] = None):
+        """
+        Compile the rules.
+
+        Args:
+            base_dir: Base directory slice rule patterns are relative to
+            layers: Layer names
+            allowed_access: Layers each layer may import
+            slice_rules: Path-level rules (see the module docstring)
+        """
+        self.base_dir = base_dir
+        self._base_prefix = os.path.join(os.path.normpath(base_dir), '')
+        self.layer_bits = {layer: 1 << i for i, layer in enumerate(layers)}
+        self.allowed_masks = {
+            layer: sum(self.layer_bits.get(target, 0) for target in set(allowed_access.get(layer, [])))
+            for layer in layers
+        }
+
+        self.slice_rules = slice_rules or []
+        self._sources = _PathTrie(1)
+        self._targets = _PathTrie(3)
+        for rule_id, rule in enumerate(self.slice_rules):
+            bit = 1 << rule_id
+            self._sources.insert(rule["from"], 0, bit)
+            for kind, key in ((_DISALLOW, "disallow"), (_ALLOW, "allow"), (_PUBLIC_API, "public_api")):
+                for pattern in _as_list(rule.get(key)):
+                    self._targets.insert(pattern, kind, bit)
+
+    def _segments(self, file_path: str) -> List[str]:
+        """Path segments of a file relative to the base directory"""
+        if file_path.startswith(self._base_prefix):
+            relative = file_path[len(self._base_prefix):]
+        else:
+            relative = os.path.relpath(file_path, self.base_dir)
+        return relative.split(os.sep)
+
+    def evaluate(self, file_path: str, layer: str,
+                 imports: List[List[Any]]) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Check the resolved imports of one file.
+
+        Returns:
+            (import_path, target_layer, message) of each import that breaks
+            the rules; message is None for the default layer rule message
+        """
+        allowed_mask = self.allowed_masks.get(layer, 0)
+        layer_bits = self.layer_bits
+
+        # Slice rules are only looked at when one applies to this file
+        source = self._segments(file_path) if self.slice_rules else None
+        active = self._sources.match(source)[0] if source else 0
+        if not active:
+            return [(import_path, target_layer, None) for import_path, target_layer, _, _ in imports
+                    if target_layer and not allowed_mask & layer_bits.get(target_layer, 0)]
+
+        violations = []
+        for import_path, target_layer, resolved_file, _ in imports:
+            if not target_layer:
+                continue
+            layer_violation = not allowed_mask & layer_bits.get(target_layer, 0)
+            target = self._segments(resolved_file) if resolved_file else None
+            if target is None or target[:2] == source[:2]:
+                if layer_violation:
+                    violations.append((import_path, target_layer, None))
+                continue
+
+            disallow, allow, public_api = self._targets.match(target)
+            if allow & active:
+                continue
+            if layer_violation:
+                violations.append((import_path, target_layer, None))
+            elif disallow & active:
+                violations.append((import_path, target_layer,
+                                   self._message(disallow & active, source, target, "cannot import from")))
+            elif public_api & active and not self._is_public_api(target):
+                violations.append((import_path, target_layer,
+                                   self._message(public_api & active, source, target, "must use the public API of")))
+        return violations
+
+    @staticmethod
+    def _is_public_api(target: List[str]) -> bool:
+        """Whether a file is the index of its slice, or is not inside a slice at all"""
+        return len(target) < 3 or (len(target) == 3 and target[2].startswith("index."))
+
+    def _message(self, rule_bits: int, source: List[str], target: List[str], verb: str) -> str:
+        """Message of the first matching rule, or a default one"""
+        rule = self.slice_rules[(rule_bits & -rule_bits).bit_length() - 1]
+        if rule.get("message"):
+            return rule["message"]
+        return f"'{'/'.join(source[:2])}' {verb} '{'/'.join(target[:2])}'"
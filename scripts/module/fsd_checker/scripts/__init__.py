@@ -1,4 +1,4 @@
-# ------ fsd_checker/scripts/__init__.py ------
-"""
-Command-line scripts for the FSD Architecture Checker.
-"""
+# ------ fsd_checker/scripts/__init__.py ------
+"""
+Command-line scripts for the FSD Architecture Checker.
+"""
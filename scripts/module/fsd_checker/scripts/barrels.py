@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Script to rank barrel files by what they cost their importers.
+
+This script analyzes the index file of every slice: how many modules and
+bytes importing it loads, and how much of that each importing file needs
+for the names it imports. Barrels are ranked by the bytes their
+importers load without using them, which is what slows down the dev
+server and unoptimized bundles.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+from fsd_checker.barrels import BarrelAnalyzer
+from fsd_checker.scripts.options import add_read_arguments, create_checker
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def print_ranking(results: List[Dict[str, Any]], importers: int) -> None:
+    """Print the ranked barrels in plain text"""
+    if not results:
+        print("No barrel files found")
+        return
+
+    print(f"{'Unused':>12} {'Loads':>12} {'Modules':>8} {'Importers':>10}  Barrel")
+    for result in results:
+        print(f"{_kb(result['unused_bytes']):>12} {_kb(result['bytes']):>12} {result['modules']:>8} "
+              f"{len(result['importers']):>10}  {result['barrel']}")
+        worst = sorted(result["importers"], key=lambda importer: -importer["unused_bytes"])[:importers]
+        for importer in worst:
+            print(f"{'':>12} uses {importer['used_modules']}/{result['modules']} modules "
+                  f"({', '.join(importer['names'])})  {importer['file']}")
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Rank FSD barrel files by their cost to importers")
+    parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    parser.add_argument("--limit", type=int, default=20, help="Number of barrels listed")
+    parser.add_argument("--importers", type=int, default=3, help="Worst importers listed per barrel")
+    parser.add_argument("--json", action="store_true", help="Print the full result as JSON")
+    add_read_arguments(parser)
+    args = parser.parse_args(args)
+
+    checker = create_checker(args)
+    checker.analyze_imports()
+    analyzer = BarrelAnalyzer(checker.base_dir, checker.file_imports, checker.build_graph(runtime_only=True),
+                              {"max_file_size": checker.max_file_size,
+                               "minified_line_length": checker.minified_line_length})
+    results = analyzer.rank()[:args.limit]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_ranking(results, args.importers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Script to query a running FSD Checker daemon.
+
+This script asks the daemon for a full report or a check of specific
+files and exits with the same codes as the check command.
+"""
+
+import argparse
+import sys
+from typing import List
+
+from fsd_checker.daemon import DEFAULT_SOCKET_PATH, UNIX_SOCKETS, UNIX_SOCKETS_ERROR, send_request
+from fsd_checker.reporters import print_report, export_report_to_json, generate_markdown_report
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Query a running FSD Checker daemon")
+    parser.add_argument("files", nargs="*", help="Only check these files (full report if omitted)")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket path of the daemon")
+    parser.add_argument("--json-output", help="JSON report output path")
+    parser.add_argument("--md-output", help="Markdown report output path")
+    parser.add_argument("--quiet", action="store_true", help="Suppress console output")
+    parser.add_argument("--shutdown", action="store_true", help="Stop the daemon")
+    args = parser.parse_args(args)
+
+    if not UNIX_SOCKETS:
+        print(f"Error: {UNIX_SOCKETS_ERROR}")
+        return 2
+
+    if args.shutdown:
+        request = {"command": "shutdown"}
+    elif args.files:
+        request = {"command": "check", "files": args.files}
+    else:
+        request = {"command": "report"}
+
+    try:
+        response = send_request(args.socket, request)
+    except (OSError, ValueError) as e:
+        print(f"Error contacting FSD Checker daemon at {args.socket}: {e}")
+        return 2
+
+    if "error" in response:
+        print(f"Daemon error: {response['error']}")
+        return 2
+
+    if args.shutdown:
+        return 0
+
+    report = response["report"]
+    if not args.quiet:
+        print_report(report)
+
+    if args.json_output:
+        export_report_to_json(report, args.json_output)
+    if args.md_output:
+        generate_markdown_report(report, args.md_output)
+
+    return response["exit_code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
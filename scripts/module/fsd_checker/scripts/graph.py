@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+Script to query the module dependency graph.
+
+This script answers "who depends on this?" style questions for a file or
+a slice: direct dependents, dependencies, the transitive impact set and
+fan-in/fan-out. The graph is loaded from its binary file, and only built
+from the sources when the file is missing, was built with other settings
+or from another state of the tree, or a rebuild is requested. The
+runtime graph leaves out type-only imports and is saved to its own file.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+from fsd_checker.graph import DEFAULT_GRAPH_PATH, RUNTIME_GRAPH_PATH, ModuleGraph
+from fsd_checker.scripts.options import add_read_arguments, create_checker
+
+
+def load_graph(args: argparse.Namespace) -> ModuleGraph:
+    """Load the saved graph if it is current, or build and save it"""
+    checker = create_checker(args, runtime_only=args.runtime_only)
+    if not args.rebuild and os.path.exists(args.graph_file):
+        try:
+            graph = ModuleGraph.load(args.graph_file)
+        except ValueError as e:
+            print(f"Rebuilding graph: {e}", file=sys.stderr)
+        else:
+            if checker.graph_is_current(graph):
+                return graph
+            print(f"Rebuilding graph: {args.graph_file} is out of date", file=sys.stderr)
+
+    checker.analyze_imports()
+    graph = checker.build_graph()
+    graph.meta = checker.graph_metadata(graph)
+    graph.save(args.graph_file)
+    return graph
+
+
+def resolve_target(graph: ModuleGraph, base_dir: str, target: str) -> List[int]:
+    """Node IDs of a file or directory, given as a path or relative to base_dir"""
+    nodes = graph.nodes_under(target)
+    if not nodes:
+        nodes = graph.nodes_under(os.path.join(base_dir, target))
+    return nodes
+
+
+def run_query(graph: ModuleGraph, args: argparse.Namespace) -> Dict[str, Any]:
+    """Answer a query and return the result as a JSON-compatible dict"""
+    if args.query == "stats":
+        return {"nodes": graph.node_count, "edges": graph.edge_count}
+
+    if args.query == "fan" and not args.target:
+        by_fan_in = sorted(range(graph.node_count), key=lambda node: -graph.fan_in(node))[:args.limit]
+        by_fan_out = sorted(range(graph.node_count), key=lambda node: -graph.fan_out(node))[:args.limit]
+        return {
+            "fan_in": [{"file": graph.paths[node], "count": graph.fan_in(node)} for node in by_fan_in],
+            "fan_out": [{"file": graph.paths[node], "count": graph.fan_out(node)} for node in by_fan_out],
+        }
+
+    if not args.target:
+        raise ValueError(f"The {args.query} query needs a target file or slice")
+
+    nodes = resolve_target(graph, args.base_dir, args.target)
+    if not nodes:
+        raise ValueError(f"No files in the graph match {args.target}")
+
+    selected = set(nodes)
+    if args.query == "dependents":
+        result = graph.direct_dependents(nodes)
+    elif args.query == "impact":
+        result = graph.impact(nodes)
+    elif args.query == "dependencies":
+        result = set()
+        for node in nodes:
+            result.update(graph.dependencies(node))
+        result -= selected
+    else:
+        # fan-in/fan-out of the target as a whole, counting distinct files outside it
+        outgoing = set()
+        for node in nodes:
+            outgoing.update(graph.dependencies(node))
+        return {
+            "target": args.target,
+            "files": len(nodes),
+            "fan_in": len(graph.direct_dependents(nodes)),
+            "fan_out": len(outgoing - selected),
+        }
+
+    return {"target": args.target, args.query: sorted(graph.paths[node] for node in result)}
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    """Print a query result in plain text"""
+    for key, value in result.items():
+        if isinstance(value, list):
+            print(f"{key} ({len(value)}):")
+            for item in value:
+                if isinstance(item, dict):
+                    print(f"  {item['count']:6d}  {item['file']}")
+                else:
+                    print(f"  {item}")
+        else:
+            print(f"{key}: {value}")
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Query the FSD module dependency graph")
+    parser.add_argument("query", choices=["dependents", "dependencies", "impact", "fan", "stats"],
+                        help="Query to run")
+    parser.add_argument("target", nargs="?", help="File or slice (e.g. features/auth) to query")
+    parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    parser.add_argument("--graph-file",
+                        help=f"Binary graph file to load or create (default: {DEFAULT_GRAPH_PATH}, "
+                             f"or {RUNTIME_GRAPH_PATH} with --runtime-only)")
+    parser.add_argument("--runtime-only", action="store_true", help="Query the graph without type-only imports")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the graph from the sources")
+    parser.add_argument("--limit", type=int, default=20, help="Number of files listed by a fan query without target")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    add_read_arguments(parser)
+    args = parser.parse_args(args)
+    if not args.graph_file:
+        args.graph_file = RUNTIME_GRAPH_PATH if args.runtime_only else DEFAULT_GRAPH_PATH
+
+    graph = load_graph(args)
+    try:
+        result = run_query(graph, args)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_result(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
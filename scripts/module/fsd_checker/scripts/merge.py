@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Script to merge the partial reports of a sharded check.
+
+This script combines the JSON reports written by `check --shard i/N` on
+several runners into the report of an unsharded check, and produces the
+console, JSON and markdown reports from it. Run it in the same checkout
+as the shards.
+"""
+
+import argparse
+import json
+import sys
+from typing import List
+
+from fsd_checker.core import report_exit_code
+from fsd_checker.merge import merge_reports
+from fsd_checker.reporters import print_report, export_report_to_json, generate_markdown_report
+from fsd_checker.reporters.jsonl_reporter import open_input
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Merge the partial reports of a sharded FSD check")
+    parser.add_argument("reports", nargs="+", help="JSON reports written by check --shard i/N")
+    parser.add_argument("--json-output", default="fsd_report.json", help="JSON report output path")
+    parser.add_argument("--md-output", default="fsd_report.md", help="Markdown report output path")
+    parser.add_argument("--compact-json", action="store_true", help="Write the JSON report without indentation")
+    parser.add_argument("--quiet", action="store_true", help="Suppress console output")
+    args = parser.parse_args(args)
+
+    reports = []
+    try:
+        for report_file in args.reports:
+            with open_input(report_file) as f:
+                reports.append(json.load(f))
+        report = merge_reports(reports)
+    except (json.JSONDecodeError, OSError, ValueError) as e:
+        print(f"Error merging reports: {e}")
+        return 2
+
+    if not args.quiet:
+        print_report(report)
+    export_report_to_json(report, args.json_output, compact=args.compact_json)
+    generate_markdown_report(report, args.md_output)
+
+    return report_exit_code(report)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-# ------ fsd_checker/scripts/moderators/__init__.py ------
-"""
-Moderator scripts for the FSD Architecture Checker.
-"""
+# ------ fsd_checker/scripts/moderators/__init__.py ------
+"""
+Moderator scripts for the FSD Architecture Checker.
+"""
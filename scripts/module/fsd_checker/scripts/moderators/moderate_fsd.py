@@ -1,48 +1,179 @@
-# ------ fsd_checker/scripts/moderators/moderate_fsd.py ------
-#!/usr/bin/env python
-"""
-Script to check FSD architecture compliance of a project.
-
-This script runs the FSD Checker on a project directory and produces
-console, JSON, and markdown reports of any violations.
-"""
-
-import argparse
-import sys
-from fsd_checker.core import FSDChecker
-from fsd_checker.reporters import print_report, export_report_to_json, generate_markdown_report
-
-
-def main():
-    """Main entry point for the script."""
-    parser = argparse.ArgumentParser(description="Check FSD architecture compliance")
-    parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
-    parser.add_argument("--json-output", default="fsd_report.json", help="JSON report output path")
-    parser.add_argument("--md-output", default="fsd_report.md", help="Markdown report output path")
-    parser.add_argument("--quiet", action="store_true", help="Suppress console output")
-    args = parser.parse_args()
-
-    print(f"\nRunning FSD Architecture Check on {args.base_dir}")
-
-    # Initialize and run the FSD checker
-    checker = FSDChecker(args.base_dir)
-    report = checker.run_checks()
-
-    # Generate reports
-    if not args.quiet:
-        print_report(report)
-
-    export_report_to_json(report, args.json_output)
-    generate_markdown_report(report, args.md_output)
-
-    # Return exit code based on violations
-    has_violations = (
-        report["imports"]["total"] > 0 or
-        len(report["structure"]["directory_violations"]) > 0
-    )
-
-    return 1 if has_violations else 0
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+# ------ fsd_checker/scripts/moderators/moderate_fsd.py ------
+#!/usr/bin/env python
+"""
+Script to check FSD architecture compliance of a project.
+
+This script runs the FSD Checker on a project directory and produces
+console, JSON, and markdown reports of any violations.
+"""
+
+import argparse
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+from fsd_checker.core import report_exit_code
+from fsd_checker.vcs import GitError
+from fsd_checker.profiling import Profiler
+from fsd_checker.shard import SHARD_BALANCES, parse_shard
+from fsd_checker.scripts.options import (add_read_arguments, add_rule_arguments, create_checker, load_baseline,
+                                         rule_options)
+from fsd_checker.store import ReportStoreWriter, save_report
+from fsd_checker.reporters import print_report, export_report_to_json, generate_markdown_report, JsonlReportWriter
+
+
+def _violation_sink(writers: List[Any]) -> Optional[Callable[[Dict[str, Any]], None]]:
+    """A callable passing each streamed violation to every active writer, or None if there is none"""
+    writers = [writer for writer in writers if writer]
+    if not writers:
+        return None
+
+    def sink(violation: Dict[str, Any]) -> None:
+        for writer in writers:
+            writer.write_violation(violation)
+    return sink
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Check FSD architecture compliance")
+    parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    parser.add_argument("--json-output", default="fsd_report.json", help="JSON report output path")
+    parser.add_argument("--md-output", default="fsd_report.md", help="Markdown report output path")
+    parser.add_argument("--quiet", action="store_true", help="Suppress console output")
+    add_read_arguments(parser)
+    parser.add_argument("--files-from-git", action="store_true",
+                        help="Enumerate files with git ls-files instead of walking the tree")
+    parser.add_argument("--changed-since", metavar="REF",
+                        help="Only report files changed since REF and the files importing them")
+    parser.add_argument("--staged", action="store_true",
+                        help="Only report staged files, checking their content in the git index")
+    parser.add_argument("--graph-output", help="Also save the module dependency graph to this binary file")
+    parser.add_argument("--jsonl-output",
+                        help="Stream violations to this JSON Lines file as they are found (gzip if it ends in .gz), "
+                             "instead of writing the JSON and markdown reports")
+    parser.add_argument("--compact-json", action="store_true", help="Write the JSON report without indentation")
+    parser.add_argument("--skip-graph-checks", action="store_true",
+                        help="Skip the cycle, lazy-boundary, asset and stylesheet checks; with --jsonl-output, "
+                             "imports are then checked file by file without keeping the import table")
+    add_rule_arguments(parser)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Rewrite the baseline (--baseline FILE) to accept every current violation; "
+                             "otherwise a full check prunes its resolved entries")
+    parser.add_argument("--db-output", help="Also save the report to this SQLite store for `query`")
+    parser.add_argument("--shard", metavar="I/N",
+                        help="Only check the I-th of N shards of the files and write a partial report for `merge`")
+    parser.add_argument("--shard-balance", choices=SHARD_BALANCES, default="hash",
+                        help="Assign files to shards by path hash, or balance their total size")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time every phase, print the slowest files and write a Chrome trace")
+    parser.add_argument("--profile-top", type=int, default=10, help="Number of slowest files to print with --profile")
+    parser.add_argument("--profile-trace", default="fsd_profile.json",
+                        help="Chrome trace-event output path of --profile (open in chrome://tracing or Perfetto)")
+    args = parser.parse_args(args)
+
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 2
+        # A partial report needs the JSON output; scoped checks and baseline updates need every file
+        conflicts = [option for option, value in (("--jsonl-output", args.jsonl_output),
+                                                  ("--changed-since", args.changed_since),
+                                                  ("--staged", args.staged),
+                                                  ("--update-baseline", args.update_baseline)) if value]
+        if conflicts:
+            print(f"Error: --shard cannot be combined with {', '.join(conflicts)}")
+            return 2
+    if args.skip_graph_checks and args.graph_output:
+        print("Error: --skip-graph-checks cannot be combined with --graph-output")
+        return 2
+
+    print(f"\nRunning FSD Architecture Check on {args.base_dir}"
+          + (f" (shard {shard[0]} of {shard[1]})" if shard else ""))
+
+    try:
+        rules = rule_options(args)
+    except (ValueError, OSError) as e:
+        print(f"Error loading rules: {e}")
+        return 2
+
+    try:
+        baseline = load_baseline(args, update=args.update_baseline)
+    except (ValueError, OSError) as e:
+        print(f"Error loading baseline: {e}")
+        return 2
+
+    writer = JsonlReportWriter(args.jsonl_output) if args.jsonl_output else None
+    # Streamed violations are not kept, so the store has to be written as they arrive
+    store_writer = ReportStoreWriter(args.db_output) if writer and args.db_output else None
+    profiler = Profiler() if args.profile else None
+
+    # Initialize and run the FSD checker
+    checker = create_checker(args, **rules,
+                             files_from_git=args.files_from_git,
+                             changed_since=args.changed_since,
+                             staged=args.staged,
+                             violation_sink=_violation_sink([writer, store_writer]),
+                             profiler=profiler,
+                             baseline=baseline,
+                             shard=shard,
+                             shard_balance=args.shard_balance,
+                             graph_checks=not args.skip_graph_checks)
+    spans = checker.profiler
+    try:
+        report = checker.run_checks()
+    except GitError as e:
+        if writer:
+            writer.close()
+        if store_writer:
+            store_writer.close()
+        print(f"Error: {e}")
+        return 2
+
+    if baseline:
+        # Only a check that found every violation can tell which entries are resolved
+        removed = baseline.finish(full_check=checker.is_full_check())
+        if args.update_baseline:
+            print(f"Baseline {baseline.path} updated: {len(baseline.fingerprints)} accepted violations")
+        elif removed:
+            print(f"Baseline {baseline.path}: pruned {removed} resolved entries")
+
+    # Generate reports
+    if not args.quiet:
+        with spans.span("report_console"):
+            print_report(report)
+
+    if writer:
+        with spans.span("report_jsonl"):
+            writer.finish(report)
+        print(f"\nViolation stream exported to {args.jsonl_output}")
+    else:
+        with spans.span("report_json"):
+            export_report_to_json(report, args.json_output, compact=args.compact_json)
+        with spans.span("report_markdown"):
+            generate_markdown_report(report, args.md_output)
+    if store_writer:
+        with spans.span("report_db"):
+            store_writer.finish(report)
+        print(f"\nReport store exported to {args.db_output}")
+    elif args.db_output:
+        with spans.span("report_db"):
+            save_report(report, args.db_output)
+    if args.graph_output:
+        with spans.span("graph"):
+            graph = checker.build_graph()
+            graph.meta = checker.graph_metadata(graph)
+            graph.save(args.graph_output)
+
+    if profiler:
+        profiler.print_summary(args.profile_top)
+        profiler.write_chrome_trace(args.profile_trace)
+
+    # Return exit code based on violations
+    return report_exit_code(report)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Read and rule options shared by the scripts that analyze the sources.
+
+`check`, `graph`, `barrels`, `unused` and `serve` read files through the
+same import cache. Its stamp covers the read options, so every script
+takes them with the same defaults and builds its checker here; otherwise
+running one script after another would discard the cache each time.
+
+`check` and `serve` also share the rule options: the daemon has to load
+the boundaries, rule files and baseline the way `check` does to report
+the same violations.
+"""
+
+import argparse
+import os
+from typing import Any, Dict, List, Optional
+
+from fsd_checker.baseline import DEFAULT_BASELINE_PATH, Baseline
+from fsd_checker.core import FSDChecker
+from fsd_checker.ignore import DEFAULT_EXCLUDES, TEST_FILE_MODES
+from fsd_checker.rules import DEFAULT_BOUNDARIES_PATH, load_boundaries, load_slice_rules
+
+# Defaults of the read options
+DEFAULT_CACHE_DIR = ".fsd-cache"
+DEFAULT_MAX_FILE_SIZE = 1048576
+DEFAULT_MINIFIED_LINE_LENGTH = 500
+
+
+def add_read_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that control how files are read and cached"""
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Number of worker processes for import analysis (default: CPU count)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory of the persistent import cache")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the persistent import cache")
+    parser.add_argument("--read-mode", choices=["full", "header"], default="full",
+                        help="Read whole files or stop after the static import/export header")
+    parser.add_argument("--no-dynamic-imports", action="store_true",
+                        help="In header mode, do not scan file bodies for import()/require()")
+    parser.add_argument("--max-file-size", type=int, default=DEFAULT_MAX_FILE_SIZE,
+                        help="Skip files larger than this many bytes (0 disables the cap)")
+    parser.add_argument("--minified-line-length", type=int, default=DEFAULT_MINIFIED_LINE_LENGTH,
+                        help="Skip files whose average line length exceeds this (0 disables the check)")
+    parser.add_argument("--tsconfig", help="tsconfig.json used for module resolution (searched upwards by default)")
+
+
+def read_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """FSDChecker keyword arguments of the options added by add_read_arguments"""
+    return {
+        "jobs": args.jobs,
+        "cache_dir": None if args.no_cache else args.cache_dir,
+        "read_mode": args.read_mode,
+        "dynamic_imports": not args.no_dynamic_imports,
+        "max_file_size": args.max_file_size or None,
+        "minified_line_length": args.minified_line_length or None,
+        "tsconfig": args.tsconfig,
+    }
+
+
+def forward_read_arguments(args: argparse.Namespace) -> List[str]:
+    """The options added by add_read_arguments, as command-line arguments for another script"""
+    return [
+        *(["--jobs", str(args.jobs)] if args.jobs else []),
+        "--cache-dir", args.cache_dir,
+        *(["--no-cache"] if args.no_cache else []),
+        "--read-mode", args.read_mode,
+        *(["--no-dynamic-imports"] if args.no_dynamic_imports else []),
+        "--max-file-size", str(args.max_file_size),
+        "--minified-line-length", str(args.minified_line_length),
+        *(["--tsconfig", args.tsconfig] if args.tsconfig else []),
+    ]
+
+
+def add_rule_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that select the rules, the baseline and the checked files"""
+    parser.add_argument("--boundaries", metavar="FILE",
+                        help="Layer and slice rules written by `generate` "
+                             f"(default: {DEFAULT_BOUNDARIES_PATH} if it exists, else the built-in layer rules)")
+    parser.add_argument("--rules", nargs="+", metavar="FILE", help="Extra slice rule files")
+    parser.add_argument("--baseline", nargs="?", const=DEFAULT_BASELINE_PATH, metavar="FILE",
+                        help="Only report and fail on violations missing from this baseline "
+                             f"(default file: {DEFAULT_BASELINE_PATH})")
+    parser.add_argument("--runtime-only", action="store_true",
+                        help="Only check runtime imports; type-only imports are erased at build time")
+    parser.add_argument("--entry", help="Entry point of the lazy-boundary check (default: app/main.tsx in --base-dir)")
+    parser.add_argument("--exclude", action="append", metavar="GLOB",
+                        help="Also prune directories and files matching this glob from the tree walk (repeatable; "
+                             "globs with a / match the path relative to --base-dir)")
+    parser.add_argument("--no-default-excludes", action="store_true",
+                        help=f"Do not prune the default excludes ({', '.join(DEFAULT_EXCLUDES)})")
+    parser.add_argument("--no-gitignore", action="store_true", help="Do not prune what the .gitignore files ignore")
+    parser.add_argument("--test-files", choices=TEST_FILE_MODES, default="include",
+                        help="Check test and story files with the rest, leave them out, or check only them "
+                             "(e.g. under separate --boundaries)")
+
+
+def rule_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    FSDChecker keyword arguments of the options added by add_rule_arguments, except the baseline.
+
+    The boundaries file (--boundaries, or DEFAULT_BOUNDARIES_PATH if it
+    exists) and the --rules files are read on every call.
+
+    Raises:
+        ValueError: If a rule file is not valid JSON or not a valid rule file
+        OSError: If a rule file cannot be read
+    """
+    layers = allowed_access = None
+    slice_rules = []
+    boundaries_path = args.boundaries or (DEFAULT_BOUNDARIES_PATH if os.path.exists(DEFAULT_BOUNDARIES_PATH) else None)
+    if boundaries_path:
+        boundaries = load_boundaries(boundaries_path)
+        layers, allowed_access = boundaries["layers"], boundaries["allowed_access"]
+        slice_rules.extend(boundaries["slice_rules"])
+    for rules_path in args.rules or []:
+        slice_rules.extend(load_slice_rules(rules_path))
+
+    return {
+        "layers": layers,
+        "allowed_access": allowed_access,
+        "slice_rules": slice_rules,
+        "runtime_only": args.runtime_only,
+        "entry": args.entry,
+        "excludes": ([] if args.no_default_excludes else list(DEFAULT_EXCLUDES)) + (args.exclude or []),
+        "gitignore": not args.no_gitignore,
+        "test_files": args.test_files,
+    }
+
+
+def load_baseline(args: argparse.Namespace, update: bool = False) -> Optional[Baseline]:
+    """
+    Load the baseline selected by --baseline (or the default one for an update).
+
+    Raises:
+        ValueError: If the file is not a baseline of a known version
+        OSError: If the file cannot be read
+    """
+    if not args.baseline and not update:
+        return None
+    return Baseline.load(args.baseline or DEFAULT_BASELINE_PATH, args.base_dir, update=update)
+
+
+def forward_rule_arguments(args: argparse.Namespace) -> List[str]:
+    """The options added by add_rule_arguments, as command-line arguments for another script"""
+    return [
+        *(["--boundaries", args.boundaries] if args.boundaries else []),
+        *(["--rules", *args.rules] if args.rules else []),
+        *(["--baseline", args.baseline] if args.baseline else []),
+        *(["--runtime-only"] if args.runtime_only else []),
+        *(["--entry", args.entry] if args.entry else []),
+        *[option for glob in args.exclude or [] for option in ("--exclude", glob)],
+        *(["--no-default-excludes"] if args.no_default_excludes else []),
+        *(["--no-gitignore"] if args.no_gitignore else []),
+        "--test-files", args.test_files,
+    ]
+
+
+def create_checker(args: argparse.Namespace, **options: Any) -> FSDChecker:
+    """Build the checker of a script from its --base-dir, its read options and further FSDChecker options"""
+    return FSDChecker(args.base_dir, **read_options(args), **options)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Script to query a saved SQLite report store.
+
+This script filters the violations of a report saved with `--db-output`
+(or `process --output-db`) by layer, slice and file glob, and counts
+them per group. Only the matching rows are read, so queries on large
+reports answer in milliseconds. The result can also be rendered with the
+console and markdown reporters.
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from typing import Any, Dict, List
+
+from fsd_checker.reporters import generate_markdown_report, print_report
+from fsd_checker.store import GROUP_FIELDS, ReportStore
+
+
+def print_groups(groups: List[Dict[str, Any]], fields: List[str]) -> None:
+    """Print group counts as a plain text table"""
+    print(f"  {'count':>8}  {'  '.join(fields)}")
+    for group in groups:
+        labels = "  ".join(str(group[field] or "-") for field in fields)
+        print(f"  {group['count']:8d}  {labels}")
+
+
+def print_violations(violations: List[Dict[str, Any]], total: int) -> None:
+    """Print matching violations in plain text"""
+    print(f"{total} matching violations")
+    for violation in violations:
+        print(f"  {violation['file']}")
+        print(f"     ↳ {violation['import']} ({violation['from_layer']} → {violation['to_layer']})")
+    if total > len(violations):
+        print(f"  ... and {total - len(violations)} more")
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Query an FSD report store")
+    parser.add_argument("db_file", help="SQLite report store")
+    parser.add_argument("--from-layers", nargs="+", help="Only violations from these layers")
+    parser.add_argument("--to-layers", nargs="+", help="Only violations to these layers")
+    parser.add_argument("--slices", nargs="+", help="Only violations in these slices (e.g. features/auth)")
+    parser.add_argument("--files", nargs="+", metavar="GLOB",
+                        help="Only violations in files matching these globs (case-sensitive, * also matches /)")
+    parser.add_argument("--group-by", nargs="+", choices=GROUP_FIELDS, help="Count violations per group")
+    parser.add_argument("--limit", type=int, default=20, help="Number of violations or groups listed")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    parser.add_argument("--console", action="store_true", help="Print the matching violations as a console report")
+    parser.add_argument("--output-md", help="Write the matching violations as a markdown report")
+    args = parser.parse_args(args)
+
+    filters = {"from_layers": args.from_layers, "to_layers": args.to_layers,
+               "slices": args.slices, "file_globs": args.files}
+    try:
+        with ReportStore(args.db_file) as store:
+            if args.console or args.output_md:
+                report = store.query_report(**filters)
+                if args.console:
+                    print_report(report)
+                if args.output_md:
+                    generate_markdown_report(report, args.output_md)
+                return 0
+
+            if args.group_by:
+                result = {"group_by": args.group_by,
+                          "groups": store.group_counts(args.group_by, limit=args.limit, **filters)}
+            else:
+                result = {"total": store.count(**filters),
+                          "violations": store.violations(limit=args.limit, **filters)}
+    except (ValueError, sqlite3.Error) as e:
+        print(f"Error: {e}")
+        return 2
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    elif args.group_by:
+        print_groups(result["groups"], args.group_by)
+    else:
+        print_violations(result["violations"], result["total"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
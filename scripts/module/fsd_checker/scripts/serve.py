@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Script to run the FSD Checker daemon.
+
+This script builds the in-memory import index once and then answers
+check requests over a local Unix socket, refreshing the index by
+polling file mtimes. It takes the read and rule options of the check
+script, and reloads the rule files and the baseline on every poll.
+"""
+
+import argparse
+import sys
+from typing import Any, Dict, List
+
+from fsd_checker.daemon import DEFAULT_SOCKET_PATH, UNIX_SOCKETS, UNIX_SOCKETS_ERROR, FSDDaemon, ImportIndex
+from fsd_checker.scripts.options import add_read_arguments, add_rule_arguments, load_baseline, read_options, rule_options
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Run the FSD Checker daemon")
+    parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket path to listen on")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between mtime polls")
+    add_read_arguments(parser)
+    add_rule_arguments(parser)
+    args = parser.parse_args(args)
+
+    if not UNIX_SOCKETS:
+        print(f"Error: {UNIX_SOCKETS_ERROR}")
+        return 2
+
+    def load_options() -> Dict[str, Any]:
+        return {**rule_options(args), "baseline": load_baseline(args)}
+
+    print(f"\nIndexing {args.base_dir}")
+    try:
+        index = ImportIndex({"base_dir": args.base_dir, **read_options(args)}, load_options)
+    except (ValueError, OSError) as e:
+        print(f"Error loading rules or baseline: {e}")
+        return 2
+
+    server = FSDDaemon(args.socket, index, args.poll_interval)
+    print(f"FSD Checker daemon listening on {args.socket}")
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
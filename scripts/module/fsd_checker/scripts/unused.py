@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Script to list the modules no entry point reaches.
+
+This script walks the import graph from the application entry point,
+lazy modules and the story and test files, and lists every checked file
+it never reaches with its layer, slice and size. Such files still cost
+typecheck, lint and test time, and can leak into bundles through barrels.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+from fsd_checker.scripts.options import add_read_arguments, create_checker
+from fsd_checker.unused import DEFAULT_ENTRY_GLOBS, find_unused
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def print_unused(result: Dict[str, Any], limit: int) -> None:
+    """Print the unused files per layer in plain text"""
+    unused = result["unused"]
+    print(f"{len(result['entries'])} entry points, {len(unused)} unused files "
+          f"({_kb(sum(entry['size'] for entry in unused))})")
+    if not unused:
+        return
+
+    print(f"\n{'Layer':<12} {'Files':>6} {'Size':>12}")
+    for layer, totals in result["layers"].items():
+        print(f"{layer:<12} {totals['files']:>6} {_kb(totals['bytes']):>12}")
+
+    print()
+    for entry in unused[:limit]:
+        print(f"{_kb(entry['size']):>12}  {entry['slice'] or '-':<30} {entry['file']}")
+    if len(unused) > limit:
+        print(f"... and {len(unused) - limit} more unused files")
+
+
+def main(args: List[str] = None):
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="List FSD modules unreachable from the entry points")
+    parser.add_argument("--base-dir", default="src", help="Base directory containing FSD layers")
+    parser.add_argument("--entry", action="append",
+                        help="Entry point file, repeatable (default: app/main.tsx in --base-dir)")
+    parser.add_argument("--entry-glob", action="append",
+                        help="Glob of files that are entry points too, relative to --base-dir; repeatable "
+                             f"(default: {' '.join(DEFAULT_ENTRY_GLOBS)})")
+    parser.add_argument("--limit", type=int, default=50, help="Number of unused files listed")
+    parser.add_argument("--json", action="store_true", help="Print the full result as JSON")
+    add_read_arguments(parser)
+    args = parser.parse_args(args)
+
+    checker = create_checker(args)
+    checker.analyze_imports()
+    entries, unused = find_unused(checker.base_dir, checker.file_imports, checker.build_graph(runtime_only=False),
+                                  args.entry or [checker.entry],
+                                  DEFAULT_ENTRY_GLOBS if args.entry_glob is None else args.entry_glob)
+
+    records = []
+    layers: Dict[str, Dict[str, int]] = {}
+    for file_path in unused:
+        layer, slice_name = checker._get_layer_and_slice_from_path(file_path)
+        stat = checker._stat(file_path)
+        size = stat.st_size if stat else 0
+        records.append({
+            "file": file_path,
+            "layer": layer,
+            "slice": f"{layer}/{slice_name}" if slice_name and slice_name != os.path.basename(file_path) else None,
+            "size": size,
+        })
+        totals = layers.setdefault(layer, {"files": 0, "bytes": 0})
+        totals["files"] += 1
+        totals["bytes"] += size
+    result = {
+        "entries": entries,
+        "unused": records,
+        "layers": {layer: layers[layer] for layer in checker.layers if layer in layers},
+    }
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_unused(result, args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,29 @@
-# ------ setup.py ------
-from setuptools import setup, find_packages
-
-setup(
-    name="fsd-checker",
-    version="1.0.0",
-    description="Feature-Sliced Design Architecture Checker",
-    author="Your Name",
-    author_email="your.email@example.com",
-    packages=find_packages(),
-    entry_points={
-        'console_scripts': [
-            'fsd-checker=fsd_checker.__main__:main',
-        ],
-    },
-    python_requires='>=3.7',
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Topic :: Software Development :: Quality Assurance",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-    ],
-)
+# ------ setup.py ------
+from setuptools import setup, find_packages
+
+setup(
+    name="fsd-checker",
+    version="1.0.0",
+    description="Feature-Sliced Design Architecture Checker",
+    author="Your Name",
+    author_email="your.email@example.com",
+    packages=find_packages(),
+    entry_points={
+        'console_scripts': [
+            'fsd-checker=fsd_checker.__main__:main',
+        ],
+    },
+    python_requires='>=3.7',
+    classifiers=[
+        "Development Status :: 4 - Beta",
+        "Intended Audience :: Developers",
+        "Topic :: Software Development :: Quality Assurance",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "License :: OSI Approved :: MIT License",
+        "Operating System :: OS Independent",
+    ],
+)
@@ -0,0 +1,78 @@
+"""
+Work sharding for the FSD Architecture Checker.
+
+A check split into N shards reads and checks a disjoint part of the
+source files in each shard. Files are assigned by a stable hash of their
+path relative to base_dir, so every runner computes the same assignment
+without coordination. Size balancing instead deals the files out largest
+first to the least loaded shard, using the stat data of the tree scan;
+it evens out the bytes each shard reads as long as all shards see the
+same tree.
+
+Findings about a file belong to the shard that owns the file, so partial
+reports never overlap. `merge` (merge.py) combines them into the report
+of an unsharded run.
+"""
+
+import hashlib
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Ways of assigning files to shards
+SHARD_BALANCES = ("hash", "size")
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse an `i/N` shard specification.
+
+    Raises:
+        ValueError: If it is not of the form i/N with 1 <= i <= N
+    """
+    index, separator, count = value.partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"Invalid shard {value!r}, expected i/N (e.g. 1/4)") from None
+    if not separator or count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard {value!r}, expected i/N with 1 <= i <= N")
+    return index, count
+
+
+def _relative(file_path: str, base_dir: str) -> str:
+    return os.path.relpath(file_path, base_dir).replace(os.sep, "/")
+
+
+def hash_shard(file_path: str, base_dir: str, count: int) -> int:
+    """Shard (1 to count) of a file by the hash of its path relative to base_dir"""
+    digest = hashlib.sha1(_relative(file_path, base_dir).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def assign_shards(file_paths: List[str], base_dir: str, count: int, balance: str = "hash",
+                  size_of: Optional[Callable[[str], int]] = None) -> Dict[str, int]:
+    """
+    Assign files to shards.
+
+    Args:
+        file_paths: Files to assign
+        base_dir: Base directory the hashed paths are relative to
+        count: Number of shards
+        balance: "hash" for the path hash, "size" to balance the bytes per shard
+        size_of: Size of a file in bytes, required for size balancing
+
+    Returns:
+        Each file mapped to its shard, from 1 to count
+    """
+    if balance == "hash":
+        return {file_path: hash_shard(file_path, base_dir, count) for file_path in file_paths}
+
+    # Largest first onto the least loaded shard; ties go by path, then shard number
+    loads = [0] * count
+    assignment = {}
+    for size, _, file_path in sorted((-size_of(file_path), _relative(file_path, base_dir), file_path)
+                                     for file_path in file_paths):
+        shard = min(range(count), key=lambda i: loads[i])
+        loads[shard] -= size
+        assignment[file_path] = shard + 1
+    return assignment
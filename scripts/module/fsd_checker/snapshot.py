@@ -0,0 +1,159 @@
+"""
+Filesystem snapshot for the FSD Architecture Checker.
+
+The tree under base_dir is traversed once with os.scandir. The snapshot
+records the layers and their slices, the files at each layer root and the
+stat data of every source (script or stylesheet) and asset file, so
+structure checks, import analysis, asset sizes and boundary generation
+never list the same directory twice. Entries pruned by the ignore rules
+(ignore.py) are recorded but never listed or stat'ed.
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple, Union
+
+from .ignore import GitignoreFile, IgnoreRules
+
+SCRIPT_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+STYLESHEET_EXTENSIONS = ('.scss', '.sass', '.css')
+SOURCE_EXTENSIONS = SCRIPT_EXTENSIONS + STYLESHEET_EXTENSIONS
+
+# Files imported for their size only
+ASSET_EXTENSIONS = STYLESHEET_EXTENSIONS + (
+    '.less',
+    '.png', '.jpg', '.jpeg', '.jfif', '.gif', '.svg', '.webp', '.avif', '.ico', '.bmp',
+    '.woff', '.woff2', '.ttf', '.otf', '.eot',
+    '.mp4', '.webm', '.mp3', '.ogg', '.wav',
+)
+
+
+def _list_directory(directory: str) -> List[os.DirEntry]:
+    """List the entries of a directory in scandir order"""
+    with os.scandir(directory) as entries:
+        return list(entries)
+
+
+class TreeSnapshot:
+    """
+    Layers, slices and source files of a project at one point in time.
+
+    Source files are listed in the same order as an os.walk of each layer
+    directory, so reports do not depend on how the tree was scanned.
+    """
+
+    def __init__(self, base_dir: str, layers: List[str]):
+        """
+        Initialize an empty snapshot; use TreeSnapshot.scan to fill it.
+
+        Args:
+            base_dir: Directory containing the FSD layers
+            layers: Names of the FSD layers
+        """
+        self.base_dir = base_dir
+        self.layers = list(layers)
+        self.slices: Dict[str, List[str]] = {layer: [] for layer in self.layers}
+        self.root_files: Dict[str, List[str]] = {layer: [] for layer in self.layers}
+        self.missing_layers: List[str] = []
+        self.source_files: List[Tuple[str, str]] = []
+        self.stats: Dict[str, os.stat_result] = {}
+        # Directories listed, in walk order
+        self.directories: List[str] = []
+        # Directories cut from the walk, with the reason ("exclude" or the .gitignore file)
+        self.pruned: List[Tuple[str, str]] = []
+        self.files_ignored = 0
+
+    @classmethod
+    def scan(cls, base_dir: str, layers: List[str], source_files: bool = True,
+             ignore: Optional[IgnoreRules] = None) -> "TreeSnapshot":
+        """
+        Take a snapshot of base_dir.
+
+        Args:
+            base_dir: Directory containing the FSD layers
+            layers: Names of the FSD layers
+            source_files: Also walk the slices and stat every source and asset file
+                          (only the layer level is listed otherwise)
+            ignore: Rules of the entries to prune (nothing is pruned if None)
+        """
+        snapshot = cls(base_dir, layers)
+        root_gitignores = ignore.root_gitignores if ignore else ()
+        for layer in snapshot.layers:
+            layer_dir = os.path.join(base_dir, layer)
+            try:
+                entries = _list_directory(layer_dir)
+            except OSError:
+                snapshot.missing_layers.append(layer)
+                continue
+            snapshot.directories.append(layer_dir)
+
+            gitignores = root_gitignores
+            if ignore:
+                gitignores = ignore.nested(gitignores, layer_dir, (entry.name for entry in entries))
+                entries = snapshot._prune(entries, ignore, gitignores)
+
+            for entry in entries:
+                if entry.is_dir():
+                    snapshot.slices[layer].append(entry.name)
+                elif entry.is_file():
+                    snapshot.root_files[layer].append(entry.path)
+
+            if source_files:
+                snapshot._walk_layer(layer, entries, ignore, gitignores)
+
+        return snapshot
+
+    def _prune(self, entries: List[os.DirEntry], ignore: IgnoreRules,
+               gitignores: Tuple[GitignoreFile, ...]) -> List[os.DirEntry]:
+        """Drop the ignored entries of a directory listing, recording the pruned directories"""
+        kept = []
+        for entry in entries:
+            is_dir = entry.is_dir()
+            reason = ignore.reason(entry.path, entry.name, is_dir, gitignores)
+            if reason is None:
+                kept.append(entry)
+            elif is_dir:
+                self.pruned.append((entry.path, reason))
+            else:
+                self.files_ignored += 1
+        return kept
+
+    def _walk_layer(self, layer: str, layer_entries: List[os.DirEntry], ignore: Optional[IgnoreRules] = None,
+                    layer_gitignores: Tuple[GitignoreFile, ...] = ()) -> None:
+        """Collect the source files of a layer, top-down like os.walk"""
+        # Directories to list (or the layer's listing) with the .gitignore files of their parent
+        stack: List[Tuple[Union[str, List[os.DirEntry]], Tuple[GitignoreFile, ...]]] = [
+            (layer_entries, layer_gitignores)]
+        while stack:
+            entries, gitignores = stack.pop()
+            if isinstance(entries, str):
+                directory = entries
+                try:
+                    entries = _list_directory(directory)
+                except OSError:
+                    # os.walk skips unreadable directories as well
+                    continue
+                self.directories.append(directory)
+                if ignore:
+                    gitignores = ignore.nested(gitignores, directory, (entry.name for entry in entries))
+                    entries = self._prune(entries, ignore, gitignores)
+
+            subdirectories = []
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, symlinked directories are not followed
+                    if not entry.is_symlink():
+                        subdirectories.append((entry.path, gitignores))
+                elif entry.name.endswith(SOURCE_EXTENSIONS):
+                    self.source_files.append((entry.path, layer))
+                    try:
+                        self.stats[entry.path] = entry.stat()
+                    except OSError:
+                        pass
+                elif entry.name.endswith(ASSET_EXTENSIONS):
+                    try:
+                        self.stats[entry.path] = entry.stat()
+                    except OSError:
+                        pass
+
+            # Pushed in reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirectories))
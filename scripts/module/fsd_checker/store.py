@@ -0,0 +1,284 @@
+"""
+SQLite store of FSD reports.
+
+A report is saved as one row per import violation, with indexes on the
+source and target layer, the file and the slice, and the rest of the
+report (structure, skipped files, cycles, rules) as a JSON document.
+Queries filter and group the violations in SQL instead of loading the
+whole report, and return report-shaped results that the console and
+markdown reporters render as usual.
+"""
+
+import json
+import os
+import sqlite3
+import urllib.parse
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .violations import json_default, make_violation, violation_message
+
+STORE_FORMAT = "fsd-report-store"
+STORE_VERSION = 2
+
+# Columns violations can be grouped by
+GROUP_FIELDS = ("from_layer", "to_layer", "file", "slice")
+
+# Violations kept per layer pair in a query report (as many as the markdown report lists)
+SAMPLE_PER_GROUP = 20
+
+_INSERT_BATCH = 10000
+
+# Window functions (ROW_NUMBER) came with SQLite 3.25; older builds sample with a subquery per row
+_WINDOW_FUNCTIONS = sqlite3.sqlite_version_info >= (3, 25, 0)
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE violations (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    import_path TEXT NOT NULL,
+    from_layer TEXT NOT NULL,
+    to_layer TEXT NOT NULL,
+    slice TEXT,
+    message TEXT
+);
+"""
+
+# Created after the bulk insert, which is faster than maintaining them row by row
+_INDEXES = """
+CREATE INDEX violations_file ON violations (file);
+CREATE INDEX violations_from_layer ON violations (from_layer, to_layer);
+CREATE INDEX violations_to_layer ON violations (to_layer);
+CREATE INDEX violations_slice ON violations (slice);
+"""
+
+
+def slice_of(file_path: str, layer: str, slices: Iterable[str] = ()) -> Optional[str]:
+    """
+    The "layer/slice" a file belongs to, or None for files at a layer root.
+
+    The path is scanned from the end for the layer directory, preferring
+    one followed by a known slice name.
+    """
+    parts = file_path.replace("\\", "/").split("/")
+    known = set(slices)
+    candidates = [i for i in range(len(parts) - 2, -1, -1) if parts[i] == layer]
+    for i in candidates:
+        if parts[i + 1] in known:
+            return f"{layer}/{parts[i + 1]}"
+    if candidates and candidates[0] < len(parts) - 2:
+        return f"{layer}/{parts[candidates[0] + 1]}"
+    return None
+
+
+class ReportStoreWriter:
+    """Write a report into a new SQLite store, one violation at a time"""
+
+    def __init__(self, db_file: str):
+        """
+        Create the store; it replaces db_file only when finished.
+
+        Args:
+            db_file: SQLite output path
+        """
+        self.db_file = db_file
+        self.temp_file = f"{db_file}.tmp"
+        if os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
+        self.connection = sqlite3.connect(self.temp_file)
+        self.connection.execute("PRAGMA journal_mode = OFF")
+        self.connection.execute("PRAGMA synchronous = OFF")
+        self.connection.executescript(_SCHEMA)
+        self.pending: List[Tuple[str, str, str, str, Optional[str], Optional[str]]] = []
+        self.slices: Dict[Tuple[str, str], Optional[str]] = {}
+
+    def write_violation(self, violation: Mapping[str, Any]) -> None:
+        """Add one import violation"""
+        file_path, layer, to_layer = violation["file"], violation["from_layer"], violation["to_layer"]
+        key = (file_path, layer)
+        if key not in self.slices:
+            self.slices[key] = slice_of(file_path, layer)
+        # Only slice rule messages are stored; NULL stands for the layer rule message
+        message = violation.get("message")
+        if message == violation_message(layer, to_layer):
+            message = None
+        self.pending.append((file_path, violation["import"], layer, to_layer, self.slices[key], message))
+        if len(self.pending) >= _INSERT_BATCH:
+            self._flush()
+
+    def _flush(self) -> None:
+        self.connection.executemany(
+            "INSERT INTO violations (file, import_path, from_layer, to_layer, slice, message) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            self.pending)
+        self.pending = []
+
+    def finish(self, report: Dict[str, Any]) -> None:
+        """Store the rest of the report, build the indexes and move the store into place"""
+        self._flush()
+        connection = self.connection
+
+        # Correct the slices guessed from the path now that the layer map of the report is known
+        connection.executescript(_INDEXES)
+        layer_slices = report["structure"].get("layers", {})
+        corrections = []
+        for (file_path, layer), guessed in self.slices.items():
+            known = slice_of(file_path, layer, layer_slices.get(layer, ()))
+            if known != guessed:
+                corrections.append((known, file_path, layer))
+        connection.executemany("UPDATE violations SET slice = ? WHERE file = ? AND from_layer = ?", corrections)
+
+        imports = dict(report["imports"])
+        imports.pop("violations", None)
+        imports.pop("group_totals", None)
+        base_report = dict(report, imports=imports)
+        connection.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+            ("format", STORE_FORMAT),
+            ("version", str(STORE_VERSION)),
+            ("report", json.dumps(base_report, default=json_default)),
+        ])
+        connection.commit()
+        connection.close()
+        os.replace(self.temp_file, self.db_file)
+
+    def close(self) -> None:
+        """Abandon an unfinished store"""
+        try:
+            self.connection.close()
+        except sqlite3.ProgrammingError:
+            pass
+        if os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
+
+    def __enter__(self) -> "ReportStoreWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def save_report(report: Dict[str, Any], db_file: str) -> None:
+    """Save a report (or a filtered one) into a new SQLite store"""
+    with ReportStoreWriter(db_file) as writer:
+        for violation in report["imports"]["violations"]:
+            writer.write_violation(violation)
+        writer.finish(report)
+    print(f"\nReport store exported to {db_file}")
+
+
+class ReportStore:
+    """Read-only queries over a saved report"""
+
+    def __init__(self, db_file: str):
+        """
+        Open a store.
+
+        Raises:
+            ValueError: If the file is missing or is not a report store of a known version
+        """
+        if not os.path.isfile(db_file):
+            raise ValueError(f"{db_file} does not exist")
+        uri = f"file:{urllib.parse.quote(os.path.abspath(db_file))}?mode=ro"
+        self.connection = sqlite3.connect(uri, uri=True)
+        try:
+            meta = dict(self.connection.execute("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError:
+            meta = {}
+        if meta.get("format") != STORE_FORMAT or meta.get("version") != str(STORE_VERSION):
+            self.connection.close()
+            raise ValueError(f"{db_file} is not an FSD report store of version {STORE_VERSION}")
+        self._report = meta["report"]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ReportStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _where(from_layers: List[str] = None,
+               to_layers: List[str] = None,
+               file_globs: List[str] = None,
+               slices: List[str] = None) -> Tuple[str, List[str]]:
+        """WHERE clause and parameters of the filters; values within one filter are alternatives"""
+        clauses = []
+        params: List[str] = []
+        for column, values in (("from_layer", from_layers), ("to_layer", to_layers), ("slice", slices)):
+            if values:
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        if file_globs:
+            clauses.append("(" + " OR ".join("file GLOB ?" for _ in file_globs) + ")")
+            params.extend(file_globs)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, **filters) -> int:
+        """Number of violations matching the filters"""
+        where, params = self._where(**filters)
+        return self.connection.execute(f"SELECT COUNT(*) FROM violations{where}", params).fetchone()[0]
+
+    def violations(self, limit: Optional[int] = None, **filters) -> List[Dict[str, Any]]:
+        """Violations matching the filters, in report order"""
+        where, params = self._where(**filters)
+        sql = f"SELECT file, import_path, from_layer, to_layer, message FROM violations{where} ORDER BY id"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [self._violation(row) for row in self.connection.execute(sql, params)]
+
+    def group_counts(self, fields: List[str], limit: Optional[int] = None, **filters) -> List[Dict[str, Any]]:
+        """
+        Count matching violations per distinct value of the given fields.
+
+        Returns:
+            One dict per group with the field values and a count, largest first
+        """
+        unknown = [field for field in fields if field not in GROUP_FIELDS]
+        if unknown:
+            raise ValueError(f"Cannot group by {', '.join(unknown)}; use {', '.join(GROUP_FIELDS)}")
+        where, params = self._where(**filters)
+        columns = ", ".join(fields)
+        sql = (f"SELECT {columns}, COUNT(*) AS count FROM violations{where} "
+               f"GROUP BY {columns} ORDER BY count DESC, {columns}")
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(zip((*fields, "count"), row)) for row in self.connection.execute(sql, params)]
+
+    def query_report(self, **filters) -> Dict[str, Any]:
+        """
+        Build a report of the matching violations.
+
+        Returns:
+            The stored report with the first SAMPLE_PER_GROUP matching
+            violations of each layer pair; the full counts are in
+            imports.total and imports.group_totals
+        """
+        report = json.loads(self._report)
+        where, params = self._where(**filters)
+        if _WINDOW_FUNCTIONS:
+            sample = self.connection.execute(
+                "SELECT file, import_path, from_layer, to_layer, message FROM ("
+                "  SELECT *, ROW_NUMBER() OVER (PARTITION BY from_layer, to_layer ORDER BY id) AS position"
+                f"  FROM violations{where}"
+                ") WHERE position <= ? ORDER BY id", [*params, SAMPLE_PER_GROUP])
+        else:
+            # The first matching ids of each row's layer pair; the filters apply inside the subquery
+            group = f"{' AND' if where else ' WHERE'} from_layer = sampled.from_layer AND to_layer = sampled.to_layer"
+            sample = self.connection.execute(
+                "SELECT file, import_path, from_layer, to_layer, message FROM violations AS sampled"
+                f" WHERE id IN (SELECT id FROM violations{where}{group} ORDER BY id LIMIT ?) ORDER BY id",
+                [*params, SAMPLE_PER_GROUP])
+
+        report["imports"]["violations"] = [self._violation(row) for row in sample]
+        group_totals = {f"{group['from_layer']} → {group['to_layer']}": group["count"]
+                        for group in self.group_counts(["from_layer", "to_layer"], **filters)}
+        report["imports"]["total"] = sum(group_totals.values())
+        report["imports"]["group_totals"] = group_totals
+        return report
+
+    @staticmethod
+    def _violation(row: Tuple[str, str, str, str, Optional[str]]) -> Dict[str, Any]:
+        file_path, import_path, from_layer, to_layer, message = row
+        return make_violation(file_path, import_path, from_layer, to_layer, message)
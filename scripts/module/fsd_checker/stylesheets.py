@@ -0,0 +1,77 @@
+"""
+Stylesheet fan-in analysis for the FSD Architecture Checker.
+
+Stylesheets are checked files like scripts: their `@use`, `@forward` and
+`@import` rules are resolved into the import table and fall under the
+same layer rules. A partial pulled in by other stylesheets recompiles
+every stylesheet that loads it, directly or through a chain of `@use`
+and `@forward` rules, and with them every component importing one of
+those stylesheets. This module ranks the partials by that fan-in.
+"""
+
+from collections import deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .snapshot import STYLESHEET_EXTENSIONS
+
+# Partials listed in the fan-in ranking
+TOP_PARTIALS = 20
+
+# Components listed per partial
+SAMPLE_COMPONENTS = 5
+
+
+def stylesheet_fan_in(file_imports: List[Tuple[str, Optional[Tuple[List[List[Any]], Any]]]]) -> Dict[str, Any]:
+    """
+    Rank the stylesheets loaded by other stylesheets by their transitive fan-in.
+
+    Args:
+        file_imports: Resolved imports of every file, as kept by FSDChecker.analyze_imports
+
+    Returns:
+        {"stylesheets", "imports", "partials": [...]} with the number of
+        checked stylesheets, of imports between them, and for each ranked
+        partial the stylesheets loading it (directly or not) and the
+        components that recompile when it changes
+    """
+    # Stylesheets loading each stylesheet, and scripts importing it
+    loaders: Dict[str, Set[str]] = {}
+    components: Dict[str, Set[str]] = {}
+    stylesheets = 0
+    for file_path, loaded in file_imports:
+        is_stylesheet = file_path.endswith(STYLESHEET_EXTENSIONS)
+        stylesheets += is_stylesheet
+        if not loaded or loaded[1]:
+            continue
+        for entry in loaded[0]:
+            target = entry[2]
+            if target and target.endswith(STYLESHEET_EXTENSIONS) and target != file_path:
+                (loaders if is_stylesheet else components).setdefault(target, set()).add(file_path)
+
+    partials = []
+    for partial in loaders:
+        # Reverse walk: every stylesheet recompiled when the partial changes
+        dependents = {partial}
+        queue = deque([partial])
+        while queue:
+            for loader in loaders.get(queue.popleft(), ()):
+                if loader not in dependents:
+                    dependents.add(loader)
+                    queue.append(loader)
+
+        affected: Set[str] = set()
+        for stylesheet in dependents:
+            affected.update(components.get(stylesheet, ()))
+        partials.append({
+            "file": partial,
+            "stylesheets": len(dependents) - 1,
+            "components": len(affected),
+            "examples": sorted(affected)[:SAMPLE_COMPONENTS],
+        })
+
+    partials.sort(key=lambda partial: (-partial["components"], -partial["stylesheets"], partial["file"]))
+    return {
+        "stylesheets": stylesheets,
+        "imports": sum(len(files) for files in loaders.values()),
+        "partials": partials[:TOP_PARTIALS],
+    }
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the FSD Architecture Checker tests.
+
+Run from scripts/module with `python -m pytest fsd_checker/tests`.
+"""
+
+import os
+from typing import Callable, Dict
+
+import pytest
+
+
+def write_files(root: str, files: Dict[str, str]) -> None:
+    """Create files (paths relative to root, with `/`) holding the given content"""
+    for relative_path, content in files.items():
+        path = os.path.join(root, *relative_path.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+@pytest.fixture
+def make_tree(tmp_path) -> Callable[[Dict[str, str]], str]:
+    """Build a source tree under a temporary directory and return its src directory"""
+    def make(files: Dict[str, str]) -> str:
+        base_dir = os.path.join(str(tmp_path), "src")
+        os.makedirs(base_dir, exist_ok=True)
+        write_files(base_dir, files)
+        return base_dir
+    return make
@@ -0,0 +1,54 @@
+import os
+
+from fsd_checker.core import FSDChecker
+
+BG = "\x89PNG" + "b" * 96
+LOGO = "\x89PNG" + "l" * 46
+VARS = "$gap: 4px;\n"
+STYLES = "@use '../../../shared/styles/vars';\n.a { background: url('./bg.png?v=2'); }\n"
+
+
+def test_assets_are_attributed_to_the_importing_slices(make_tree):
+    base_dir = make_tree({
+        "features/a/ui/A.tsx": "import './a.scss';\nimport logo from '../../../shared/assets/logo.png';\n",
+        "features/a/ui/a.scss": STYLES,
+        "features/a/ui/bg.png": BG,
+        "features/b/B.tsx": "import logo from '../../shared/assets/logo.png';\nimport copy from './copy.png';\n",
+        "features/b/copy.png": BG,
+        "pages/index.ts": "import logo from '../shared/assets/logo.png';\n",
+        "shared/styles/_vars.scss": VARS,
+        "shared/assets/logo.png": LOGO,
+    })
+    assets = FSDChecker(base_dir, jobs=1).run_checks()["assets"]
+    size = {name: len(content.encode("utf-8")) for name, content in
+            {"bg": BG, "logo": LOGO, "vars": VARS, "styles": STYLES}.items()}
+
+    def path(relative_path):
+        return os.path.join(base_dir, *relative_path.split("/"))
+
+    assert assets["total"] == {"files": 5, "bytes": 2 * size["bg"] + size["logo"] + size["vars"] + size["styles"]}
+    # Stylesheets count with everything they load, through the script importing them
+    assert assets["slices"] == [
+        {"slice": "features/a", "files": 4, "bytes": size["bg"] + size["logo"] + size["vars"] + size["styles"]},
+        {"slice": "features/b", "files": 2, "bytes": size["bg"] + size["logo"]},
+        {"slice": "pages", "files": 1, "bytes": size["logo"]},
+    ]
+    assert assets["layers"] == {
+        "features": {"files": 5, "bytes": 2 * size["bg"] + size["logo"] + size["vars"] + size["styles"]},
+        "pages": {"files": 1, "bytes": size["logo"]},
+    }
+    assert assets["shared"] == [{"file": path("shared/assets/logo.png"), "size": size["logo"],
+                                 "slices": ["features/a", "features/b", "pages"]}]
+    assert assets["duplicates"] == [{"size": size["bg"],
+                                     "files": sorted([path("features/a/ui/bg.png"), path("features/b/copy.png")])}]
+    assert assets["largest"][0]["size"] == max(size.values())
+
+
+def test_unimported_assets_do_not_count(make_tree):
+    base_dir = make_tree({
+        "features/a/a.ts": "export {};\n",
+        "features/a/unused.png": BG,
+    })
+    assets = FSDChecker(base_dir, jobs=1).run_checks()["assets"]
+    assert assets["total"] == {"files": 0, "bytes": 0}
+    assert assets["slices"] == assets["largest"] == assets["duplicates"] == []
@@ -0,0 +1,52 @@
+import json
+
+from fsd_checker.barrels import ALL_NAMES, BarrelAnalyzer, imported_names
+from fsd_checker.core import FSDChecker
+from fsd_checker.scripts.barrels import main as barrels_main
+from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
+
+
+def test_imported_names():
+    names = imported_names(
+        "import React, { useState as state } from 'react';\n"
+        "import type { Props } from './types';\n"
+        "import * as api from './api';\n"
+        "// import { old } from './old';\n"
+        "export { a, b as c } from './ab';\n"
+    )
+    assert names == {
+        "react": {"default", "useState"},
+        "./types": set(),
+        "./api": {ALL_NAMES},
+        "./ab": {"a", "b"},
+    }
+
+
+def test_importer_only_pays_for_the_names_it_uses(make_tree):
+    base_dir = make_tree({
+        "shared/ui/index.ts": "export * from './Button';\nexport { Modal } from './Modal';\n",
+        "shared/ui/Button.ts": "export const Button = 1;\n",
+        "shared/ui/Modal.ts": "export const Modal = '" + "x" * 100 + "';\n",
+        "features/a/a.ts": "import { Button } from '../../shared/ui';\n",
+    })
+    checker = FSDChecker(base_dir, jobs=1)
+    checker.analyze_imports()
+    [result] = BarrelAnalyzer(base_dir, checker.file_imports, checker.build_graph(runtime_only=True)).rank()
+
+    assert result["modules"] == 3
+    assert result["exports"] == 2
+    [importer] = result["importers"]
+    assert importer["names"] == ["Button"]
+    assert importer["used_modules"] == 1
+    assert importer["unused_bytes"] == result["bytes"] - len("export const Button = 1;\n")
+
+
+def test_barrels_keeps_the_cache_of_check(make_tree, tmp_path):
+    base_dir = make_tree({"shared/ui/index.ts": "export {};\n"})
+    cache_dir = str(tmp_path / "cache")
+    check_main(["--base-dir", base_dir, "--quiet", "--cache-dir", cache_dir,
+                "--json-output", str(tmp_path / "report.json"), "--md-output", str(tmp_path / "report.md")])
+    stamp = json.loads((tmp_path / "cache" / "imports.json").read_text())["stamp"]
+
+    barrels_main(["--base-dir", base_dir, "--cache-dir", cache_dir, "--json"])
+    assert json.loads((tmp_path / "cache" / "imports.json").read_text())["stamp"] == stamp
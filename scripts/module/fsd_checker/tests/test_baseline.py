@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from fsd_checker.baseline import Baseline
+from fsd_checker.merge import merge_reports
+from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
+
+# A type-only import of a higher layer, and a runtime one that is fixed later
+TREE = {
+    "features/a/a.ts": "import type { P } from '../../pages/home/P';\n",
+    "features/a/a.test.ts": "import { Q } from '../../pages/home/Q';\n",
+    "pages/home/P.ts": "export type P = {};\n",
+    "pages/home/Q.ts": "export const Q = 1;\n",
+}
+
+
+def check(base_dir, tmp_path, *extra):
+    return check_main(["--base-dir", base_dir, "--quiet", "--no-cache", "--baseline", str(tmp_path / "baseline.json"),
+                       "--json-output", str(tmp_path / "report.json"), "--md-output", str(tmp_path / "report.md"),
+                       *extra])
+
+
+def accepted(tmp_path):
+    return json.loads((tmp_path / "baseline.json").read_text())["fingerprints"]
+
+
+@pytest.fixture
+def adopted(make_tree, tmp_path):
+    base_dir = make_tree(TREE)
+    assert check(base_dir, tmp_path, "--update-baseline") == 0
+    assert len(accepted(tmp_path)) == 2
+    assert check(base_dir, tmp_path) == 0
+    return base_dir
+
+
+def test_update_accepts_what_a_later_check_matches(tmp_path):
+    file_path = str(tmp_path / "features" / "a" / "a.ts")
+    update = Baseline(str(tmp_path), update=True)
+    assert update.accepts_import(file_path, "../../pages/home/P", "features", "pages")
+
+    baseline = Baseline(str(tmp_path), set(update.matched))
+    assert baseline.accepts_import(file_path, "../../pages/home/P", "features", "pages")
+    assert not baseline.accepts_import(file_path, "../../pages/home/Q", "features", "pages")
+    assert not baseline.accepts_directory({"type": "unknown_layer", "file": file_path})
+    assert baseline.suppressed == 1
+    assert baseline.resolved() == set()
+
+
+def test_full_check_prunes_resolved_entries(adopted, tmp_path):
+    (tmp_path / "src" / "features" / "a" / "a.test.ts").write_text("export {};\n")
+    check(adopted, tmp_path)
+    assert len(accepted(tmp_path)) == 1
+
+
+@pytest.mark.parametrize("options", [
+    ["--runtime-only"],
+    ["--test-files", "exclude"],
+    ["--test-files", "only"],
+    ["--exclude", "home"],
+    ["--max-file-size", "10"],
+])
+def test_narrowed_checks_keep_unmatched_entries(adopted, tmp_path, options):
+    check(adopted, tmp_path, *options)
+    assert len(accepted(tmp_path)) == 2
+    assert json.loads((tmp_path / "report.json").read_text())["baseline"]["resolved"] is None
+
+
+def test_merge_only_counts_resolved_entries_of_complete_shards(adopted, tmp_path):
+    def shard_reports(*extra):
+        reports = []
+        for index in (1, 2):
+            output = str(tmp_path / f"shard-{index}.json")
+            check_main(["--base-dir", adopted, "--quiet", "--no-cache", "--baseline", str(tmp_path / "baseline.json"),
+                        "--shard", f"{index}/2", "--json-output", output, "--md-output", str(tmp_path / "shard.md"),
+                        *extra])
+            with open(output) as f:
+                reports.append(json.load(f))
+        return reports
+
+    assert merge_reports(shard_reports())["baseline"]["resolved"] == 0
+    assert merge_reports(shard_reports("--runtime-only"))["baseline"]["resolved"] is None
+    assert len(accepted(tmp_path)) == 2
@@ -0,0 +1,54 @@
+import os
+import tracemalloc
+
+from fsd_checker.benchmarks.extractor import legacy_extract, load_sources
+from fsd_checker.benchmarks import suite
+from fsd_checker.benchmarks.suite import compare_results
+from fsd_checker.benchmarks.synthetic import generate_tree
+from fsd_checker.core import FSDChecker
+from fsd_checker.extractor import extract_specifiers
+
+
+def test_generated_tree_is_deterministic_and_counts_its_violations(tmp_path):
+    first = generate_tree(str(tmp_path / "first"), files=120, files_per_slice=5, violation_rate=0.3, seed=7)
+    second = generate_tree(str(tmp_path / "second"), files=120, files_per_slice=5, violation_rate=0.3, seed=7)
+    assert first == second
+    assert first["counts"]["violations"] > 0
+
+    report = FSDChecker(str(tmp_path / "first" / "src"), jobs=1).run_checks()
+    assert report["imports"]["total"] == first["counts"]["violations"]
+    assert report["structure"]["directory_violations"] == []
+
+
+def test_extractors_agree_on_generated_sources(tmp_path):
+    generate_tree(str(tmp_path), files=60, files_per_slice=5)
+    for content in load_sources(os.path.join(str(tmp_path), "src")):
+        assert extract_specifiers(content) == legacy_extract(content)
+
+
+def test_only_comparable_slowdowns_are_regressions():
+    def results(**seconds):
+        return {"sizes": {"1000": {"phases": {phase: {"seconds": value} for phase, value in seconds.items()}}}}
+
+    comparisons = compare_results(results(cold=1.5, warm=0.03, report=1.1),
+                                  results(cold=1.0, warm=0.01, report=1.0), threshold=0.2)
+    assert {comparison["phase"]: comparison["regression"] for comparison in comparisons} == {
+        "cold": True, "warm": False, "report": False,
+    }
+    assert compare_results(results(cold=1.0), {"sizes": {}}) == []
+
+
+def test_peak_memory_without_the_resource_module(monkeypatch):
+    monkeypatch.setattr(suite, "resource", None)
+    monkeypatch.setattr(suite, "psutil", None)
+    phases = {}
+    suite._measure(phases, "idle", 1, lambda: None)
+    assert phases["idle"]["peak_rss_mb"] is phases["idle"]["peak_worker_rss_mb"] is None
+
+    tracemalloc.start()
+    try:
+        suite._measure(phases, "allocate", 1, lambda: bytearray(4 * 1024 * 1024))
+    finally:
+        tracemalloc.stop()
+    assert phases["allocate"]["peak_rss_mb"] >= 4
+    assert phases["allocate"]["peak_worker_rss_mb"] is None
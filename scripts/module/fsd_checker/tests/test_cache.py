@@ -0,0 +1,110 @@
+import os
+
+from fsd_checker.cache import ImportCache
+from fsd_checker.core import FSDChecker
+from fsd_checker.profiling import Profiler
+
+
+def run_check(base_dir, cache_dir):
+    checker = FSDChecker(base_dir, jobs=1, cache_dir=cache_dir)
+    return checker.run_checks()
+
+
+def cycle_counts(report):
+    return {level: len(cycles) for level, cycles in report["cycles"].items()}
+
+
+def test_created_target_is_resolved_on_a_cached_run(make_tree, tmp_path):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { b } from '../b/b';\n",
+        "features/b/index.ts": "export {};\n",
+    })
+    cache_dir = str(tmp_path / "cache")
+    assert cycle_counts(run_check(base_dir, cache_dir))["file"] == 0
+
+    # The importer is untouched; only its target appears
+    with open(os.path.join(base_dir, "features", "b", "b.ts"), "w") as f:
+        f.write("import { a } from '../a/a';\n")
+
+    cached = run_check(base_dir, cache_dir)
+    assert cycle_counts(cached) == cycle_counts(run_check(base_dir, None))
+    assert cycle_counts(cached)["file"] == 1
+    assert cycle_counts(cached)["slice"] == 1
+
+
+def test_deleted_target_is_dropped_on_a_cached_run(make_tree, tmp_path):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { b } from '../b/b';\n",
+        "features/b/b.ts": "import { a } from '../a/a';\n",
+    })
+    cache_dir = str(tmp_path / "cache")
+    assert cycle_counts(run_check(base_dir, cache_dir))["file"] == 1
+
+    os.remove(os.path.join(base_dir, "features", "b", "b.ts"))
+    assert cycle_counts(run_check(base_dir, cache_dir))["file"] == 0
+
+
+def test_cache_holds_unresolved_specifiers(make_tree, tmp_path):
+    base_dir = make_tree({"features/a/a.ts": "import { b } from '../b/b';\nimport type { T } from 'pkg';\n"})
+    cache_dir = str(tmp_path / "cache")
+    checker = FSDChecker(base_dir, jobs=1, cache_dir=cache_dir)
+    checker.run_checks()
+
+    cache = ImportCache(cache_dir, checker._cache_stamp())
+    specifiers, skipped = cache.cached_result(os.path.join(base_dir, "features", "a", "a.ts"))
+    assert specifiers == [["../b/b", "runtime"], ["pkg", "type"]]
+    assert skipped is None
+
+
+def test_layer_changes_keep_the_cache(make_tree, tmp_path):
+    base_dir = make_tree({"features/a/a.ts": "export {};\n"})
+    stamp = FSDChecker(base_dir)._cache_stamp()
+    assert FSDChecker(base_dir, layers=["features"], allowed_access={"features": []})._cache_stamp() == stamp
+    assert FSDChecker(base_dir, read_mode="header")._cache_stamp() != stamp
+
+
+def extracted_files(base_dir, cache_dir):
+    """Files a check had to extract imports from, rather than taking them from the cache"""
+    profiler = Profiler()
+    FSDChecker(base_dir, jobs=1, cache_dir=cache_dir, profiler=profiler).run_checks()
+    # Resolution is timed for every file on every run
+    return sorted(os.path.relpath(file_path, base_dir) for file_path, times in profiler.file_times.items()
+                  if "extract" in times)
+
+
+def test_only_changed_content_is_extracted_again(make_tree, tmp_path):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { b } from '../b/b';\n",
+        "features/b/b.ts": "export const b = 1;\n",
+    })
+    cache_dir = str(tmp_path / "cache")
+    assert len(extracted_files(base_dir, cache_dir)) == 2
+    assert extracted_files(base_dir, cache_dir) == []
+
+    # New stat data, same content: read and hashed, but not extracted
+    a_path = os.path.join(base_dir, "features", "a", "a.ts")
+    stat = os.stat(a_path)
+    os.utime(a_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert extracted_files(base_dir, cache_dir) == []
+
+    with open(os.path.join(base_dir, "features", "b", "b.ts"), "w") as f:
+        f.write("export const b = 2;\n")
+    assert extracted_files(base_dir, cache_dir) == [os.path.join("features", "b", "b.ts")]
+
+
+def test_unusable_cache_files_are_replaced(make_tree, tmp_path):
+    base_dir = make_tree({"features/a/a.ts": "export {};\n", "features/b/b.ts": "export {};\n"})
+    cache_dir = str(tmp_path / "cache")
+    os.makedirs(cache_dir)
+    cache_file = os.path.join(cache_dir, "imports.json")
+    with open(cache_file, "w") as f:
+        f.write("{not json")
+    assert len(extracted_files(base_dir, cache_dir)) == 2
+    assert extracted_files(base_dir, cache_dir) == []
+
+    # Entries of deleted files are dropped, and a new stamp discards the rest
+    os.remove(os.path.join(base_dir, "features", "b", "b.ts"))
+    run_check(base_dir, cache_dir)
+    stamp = FSDChecker(base_dir)._cache_stamp()
+    assert list(ImportCache(cache_dir, stamp).entries) == [os.path.join(base_dir, "features", "a", "a.ts")]
+    assert ImportCache(cache_dir, stamp + "x").entries == {}
@@ -0,0 +1,43 @@
+from fsd_checker.cycles import find_cycles, strongly_connected_components
+from fsd_checker.graph import ModuleGraph
+
+
+def components(edges, node_count):
+    adjacency = [[] for _ in range(node_count)]
+    for source, target in edges:
+        adjacency[source].append(target)
+    return sorted(sorted(component) for component in strongly_connected_components(node_count, adjacency.__getitem__))
+
+
+def test_components_of_a_small_graph():
+    # 0 -> 1 -> 2 -> 0 and 3 <-> 4, with 2 -> 3 between them and 5 alone
+    edges = [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3)]
+    assert components(edges, 6) == [[0, 1, 2], [3, 4], [5]]
+
+
+def test_long_chains_do_not_recurse():
+    count = 50000
+    edges = [(node, node + 1) for node in range(count - 1)] + [(count - 1, 0)]
+    assert components(edges, count) == [list(range(count))]
+
+
+def test_file_cycles_come_with_the_shortest_path():
+    graph = ModuleGraph.build(["a", "b", "c", "d"], [("a", "b"), ("b", "c"), ("c", "a"), ("b", "a"), ("c", "d")])
+    [cycle] = find_cycles(graph)
+    assert cycle["members"] == ["a", "b", "c"]
+    assert cycle["size"] == 3
+    assert cycle["path"] == ["a", "b", "a"]
+
+
+def test_slice_cycles_collapse_files():
+    paths = ["features/a/x.ts", "features/a/y.ts", "features/b/z.ts", "shared/ui/u.ts"]
+    edges = [("features/a/x.ts", "features/b/z.ts"), ("features/b/z.ts", "features/a/y.ts"),
+             ("features/a/y.ts", "shared/ui/u.ts")]
+    graph = ModuleGraph.build(paths, edges)
+
+    assert find_cycles(graph) == []
+    [cycle] = find_cycles(graph, lambda path: "/".join(path.split("/")[:2]))
+    assert cycle["members"] == ["features/a", "features/b"]
+    assert cycle["path"] == ["features/a", "features/b", "features/a"]
+    # Files outside any group are left out, and a layer has no cycle with itself
+    assert find_cycles(graph, lambda path: path.split("/")[0] if path.startswith("features") else None) == []
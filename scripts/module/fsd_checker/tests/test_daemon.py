@@ -0,0 +1,147 @@
+import argparse
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+from fsd_checker import daemon
+from fsd_checker.core import FSDChecker, report_exit_code
+from fsd_checker.daemon import ImportIndex
+from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
+from fsd_checker.scripts.options import add_read_arguments, add_rule_arguments, load_baseline, read_options, rule_options
+from fsd_checker.tests.conftest import write_files
+from fsd_checker.scripts import client, serve
+from fsd_checker.violations import json_default
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="the daemon needs Unix domain sockets")
+
+
+def test_refresh_resolves_unchanged_importers_again(make_tree):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { b } from '../b/b';\n",
+        "features/b/index.ts": "export {};\n",
+    })
+    index = ImportIndex({"base_dir": base_dir, "jobs": 1})
+    assert index.report()["cycles"]["file"] == []
+
+    with open(os.path.join(base_dir, "features", "b", "b.ts"), "w") as f:
+        f.write("import { a } from '../a/a';\n")
+    assert index.refresh() == 1
+
+    report = index.report()
+    assert len(report["cycles"]["file"]) == 1
+    assert len(report["cycles"]["slice"]) == 1
+
+
+def test_refresh_resolves_only_files_whose_directories_changed(make_tree, monkeypatch):
+    monkeypatch.setattr(daemon, "RACY_WINDOW_NS", 0)
+    resolved = []
+    resolve_file = FSDChecker.resolve_file
+    monkeypatch.setattr(FSDChecker, "resolve_file",
+                        lambda self, file_path, loaded: resolved.append(file_path) or resolve_file(self, file_path, loaded))
+    base_dir = make_tree({
+        "features/a/a.ts": "import { b } from '../b/b';\n",
+        "features/b/index.ts": "export {};\n",
+        "pages/home/home.ts": "export const home = 1;\n",
+    })
+    index = ImportIndex({"base_dir": base_dir, "jobs": 1})
+    resolved.clear()
+
+    assert index.refresh() == 0
+    assert resolved == []
+
+    # A new file elsewhere is the only one resolved
+    write_files(base_dir, {"pages/home/other.ts": "export const other = 1;\n"})
+    assert index.refresh() == 1
+    assert resolved == [os.path.join(base_dir, "pages", "home", "other.ts")]
+
+    # A new target resolves its unchanged importer again
+    resolved.clear()
+    target_dir = os.path.join(base_dir, "features", "b")
+    write_files(base_dir, {"features/b/b.ts": "export const b = 1;\n"})
+    os.utime(target_dir, ns=(1, 1))
+    assert index.refresh() == 1
+    importer = os.path.join(base_dir, "features", "a", "a.ts")
+    assert sorted(resolved) == sorted([importer, os.path.join(target_dir, "b.ts")])
+    assert index.files[importer][3][0][0][2] == os.path.join(target_dir, "b.ts")
+
+
+def test_refresh_files_waits_for_a_running_refresh(make_tree):
+    base_dir = make_tree({"features/a/a.ts": "export const a = 1;\n"})
+    index = ImportIndex({"base_dir": base_dir, "jobs": 1})
+    finished = []
+    with index.refresh_lock:
+        worker = threading.Thread(target=lambda: finished.append(index.refresh_files([])))
+        worker.start()
+        worker.join(0.2)
+        assert finished == []
+    worker.join()
+    assert finished == [None]
+
+
+def test_refresh_files_sees_new_targets(make_tree):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { b } from '../b/b';\n",
+        "features/b/index.ts": "export {};\n",
+    })
+    importer = os.path.join(base_dir, "features", "a", "a.ts")
+    index = ImportIndex({"base_dir": base_dir, "jobs": 1})
+    assert index.files[importer][3][0][0][2] is None
+
+    target = os.path.join(base_dir, "features", "b", "b.ts")
+    with open(target, "w") as f:
+        f.write("export const b = 1;\n")
+    index.refresh_files([importer])
+    assert index.files[importer][3][0][0][2] == target
+
+
+def test_daemon_reports_like_check(make_tree, tmp_path):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { Q } from '../../pages/home/Q';\nimport type { P } from '../../pages/home/P';\n",
+        "pages/home/P.ts": "export type P = {};\n",
+        "pages/home/Q.ts": "export const Q = 1;\n",
+    })
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps([{"from": "shared/*", "disallow": ["shared/api"]}]))
+    options = ["--base-dir", base_dir, "--no-cache", "--baseline", str(tmp_path / "baseline.json"),
+               "--rules", str(rules_file), "--runtime-only"]
+    check = ["--quiet", "--json-output", str(tmp_path / "report.json"), "--md-output", str(tmp_path / "report.md")]
+    check_main([*options, *check, "--update-baseline"])
+    # Violations after the baseline was written: a slice rule and a runtime import
+    write_files(base_dir, {
+        "shared/ui/ui.ts": "import { api } from '../api/api';\n",
+        "shared/api/api.ts": "export const api = 1;\n",
+        "features/b/b.ts": "import { Q } from '../../pages/home/Q';\n",
+    })
+    exit_code = check_main([*options, *check])
+    expected = json.loads((tmp_path / "report.json").read_text())
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-dir")
+    add_read_arguments(parser)
+    add_rule_arguments(parser)
+    args = parser.parse_args(options)
+    index = ImportIndex({"base_dir": base_dir, **read_options(args)},
+                        lambda: {**rule_options(args), "baseline": load_baseline(args)})
+    report = json.loads(json.dumps(index.report(), default=json_default))
+
+    assert report_exit_code(report) == exit_code == 1
+    assert report["imports"] == expected["imports"]
+    assert report["baseline"] == expected["baseline"] == {"file": str(tmp_path / "baseline.json"), "suppressed": 1,
+                                                          "resolved": None}
+    assert report["rules"] == expected["rules"]
+
+    # A rewritten baseline applies on the next refresh
+    check_main([*options, *check, "--update-baseline"])
+    index.refresh()
+    assert report_exit_code(index.report()) == 0
+
+
+def test_scripts_report_missing_unix_sockets(monkeypatch, capsys):
+    monkeypatch.setattr(serve, "UNIX_SOCKETS", False)
+    monkeypatch.setattr(client, "UNIX_SOCKETS", False)
+    assert serve.main(["--base-dir", "missing"]) == 2
+    assert client.main([]) == 2
+    assert capsys.readouterr().out.count("needs Unix domain sockets") == 2
@@ -0,0 +1,81 @@
+import pytest
+
+from fsd_checker.extractor import extract_specifiers, extract_stylesheet_imports
+
+
+def test_every_import_form_is_found_in_source_order():
+    source = (
+        "import React from 'react';\n"
+        "import {\n"
+        "  a,\n"
+        "  b, // trailing comment\n"
+        "} from \"../lib/ab\";\n"
+        "import './styles.scss';\n"
+        "export * from './reexport';\n"
+        "export { c } from './c';\n"
+        "const lazy = import('./Lazy');\n"
+        "const legacy = require('legacy');\n"
+    )
+    assert extract_specifiers(source) == [
+        "react", "../lib/ab", "./styles.scss", "./reexport", "./c", "./Lazy", "legacy",
+    ]
+
+
+def test_comments_and_strings_are_skipped_whole():
+    source = (
+        "// import { gone } from './line-comment';\n"
+        "/* import { gone } from './block-comment'; */\n"
+        "const text = \"import x from './in-a-string'\";\n"
+        "const template = `import('./in-a-template')`;\n"
+        "const label = 'from';\n"
+        "const path = './not-a-specifier';\n"
+        "import { kept } from './kept';\n"
+    )
+    assert extract_specifiers(source) == ["./kept"]
+
+
+def test_keywords_must_stand_alone():
+    source = (
+        "const reimport = x('./not-import');\n"
+        "obj.require('./a-method');\n"
+        "import def, * as all from './both';\n"
+    )
+    assert extract_specifiers(source) == ["./both"]
+
+
+def test_stylesheet_rules_and_urls():
+    source = (
+        "@use 'sass:math';\n"
+        "@use '../../shared/styles/vars' as v;\n"
+        "@forward \"mixins\";\n"
+        "@import 'a', \"b\";\n"
+        "// @use './line-comment';\n"
+        "/* @import './block-comment'; */\n"
+        ".x { content: '@use \"./in-a-string\"'; background: url(./bg.png?v=1#top); }\n"
+        ".y { background: url('https://cdn.example.com/y.png'), url(\"data:image/png;base64,AA\"); }\n"
+        ".z { mask: url(//cdn.example.com/z.svg); font: url('./fonts/#{$name}.woff2'); }\n"
+    )
+    assert extract_stylesheet_imports(source) == [
+        ("../../shared/styles/vars", "runtime"), ("mixins", "runtime"),
+        ("a", "runtime"), ("b", "runtime"), ("./bg.png", "runtime"),
+    ]
+
+
+@pytest.mark.parametrize("literal", ["/`/", "/'/g", '/"/', "/[`'\"/]+/", "/\\/`/"])
+def test_regex_literals_are_not_strings(literal):
+    source = (
+        f"const re = {literal};\n"
+        "const Later = import('./Later');\n"
+        f"if (ok) return {literal}.test(x) && require('./Same');\n"
+        "const t = `ok`;\n"
+    )
+    assert extract_specifiers(source) == ["./Later", "./Same"]
+
+
+def test_divisions_do_not_start_regex_literals():
+    source = (
+        "const half = total / 2; const lazy = import('./Half');\n"
+        "const ratio = (a) / b + '/' + import('./Ratio');\n"
+        "const Page = () => <div>{a / b}</div>; require('./Jsx');\n"
+    )
+    assert extract_specifiers(source) == ["./Half", "./Ratio", "./Jsx"]
@@ -0,0 +1,75 @@
+import json
+import os
+
+from fsd_checker.graph import ModuleGraph
+from fsd_checker.scripts.graph import main as graph_main
+from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
+
+
+def test_queries_follow_both_directions():
+    graph = ModuleGraph.build(["a", "b", "c", "d"], [("a", "b"), ("b", "c"), ("a", "c"), ("a", "a")])
+    ids = graph.ids
+    assert graph.edge_count == 3
+    assert sorted(graph.paths[node] for node in graph.dependencies(ids["a"])) == ["b", "c"]
+    assert sorted(graph.paths[node] for node in graph.direct_dependents([ids["c"]])) == ["a", "b"]
+    assert sorted(graph.paths[node] for node in graph.impact([ids["c"]])) == ["a", "b"]
+    assert graph.fan_in(ids["d"]) == graph.fan_out(ids["d"]) == 0
+
+
+def test_save_and_load_keep_edges_and_metadata(tmp_path):
+    graph = ModuleGraph.build(["a", "b"], [("a", "b")])
+    graph.meta = {"stamp": "x"}
+    path = str(tmp_path / "graph.bin")
+    graph.save(path)
+
+    loaded = ModuleGraph.load(path)
+    assert loaded.paths == ["a", "b"]
+    assert list(loaded.dependencies(loaded.ids["a"])) == [loaded.ids["b"]]
+    assert loaded.meta == {"stamp": "x"}
+
+
+def graph_args(base_dir, tmp_path, *extra):
+    return ["stats", "--base-dir", base_dir, "--cache-dir", str(tmp_path / "cache"),
+            "--graph-file", str(tmp_path / "graph.bin"), "--json", *extra]
+
+
+def test_saved_graph_is_rebuilt_when_the_tree_changes(make_tree, tmp_path, capsys):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { b } from '../b/b';\n",
+        "features/b/index.ts": "export {};\n",
+    })
+    graph_main(graph_args(base_dir, tmp_path))
+    assert json.loads(capsys.readouterr().out)["edges"] == 0
+
+    graph_main(graph_args(base_dir, tmp_path))
+    assert "Rebuilding" not in capsys.readouterr().err
+
+    # Only the target appears; the importer is unchanged
+    with open(os.path.join(base_dir, "features", "b", "b.ts"), "w") as f:
+        f.write("export const b = 1;\n")
+    graph_main(graph_args(base_dir, tmp_path))
+    captured = capsys.readouterr()
+    assert "out of date" in captured.err
+    assert json.loads(captured.out)["edges"] == 1
+
+
+def test_saved_graph_is_rebuilt_for_other_settings(make_tree, tmp_path, capsys):
+    base_dir = make_tree({"features/a/a.ts": "import type { B } from '../b/b';\n", "features/b/b.ts": ""})
+    graph_main(graph_args(base_dir, tmp_path))
+    assert json.loads(capsys.readouterr().out)["edges"] == 1
+
+    graph_main(graph_args(base_dir, tmp_path, "--runtime-only"))
+    captured = capsys.readouterr()
+    assert "out of date" in captured.err
+    assert json.loads(captured.out)["edges"] == 0
+
+
+def test_check_and_graph_share_the_import_cache(make_tree, tmp_path):
+    base_dir = make_tree({"features/a/a.ts": "export {};\n"})
+    cache_file = tmp_path / "cache" / "imports.json"
+    check_main(["--base-dir", base_dir, "--quiet", "--cache-dir", str(tmp_path / "cache"),
+                "--json-output", str(tmp_path / "report.json"), "--md-output", str(tmp_path / "report.md")])
+    stamp = json.loads(cache_file.read_text())["stamp"]
+
+    graph_main(graph_args(base_dir, tmp_path, "--rebuild"))
+    assert json.loads(cache_file.read_text())["stamp"] == stamp
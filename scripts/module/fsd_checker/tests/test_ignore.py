@@ -0,0 +1,60 @@
+import os
+
+from fsd_checker.core import FSDChecker
+from fsd_checker.ignore import STORY_ROLE, TEST_ROLE, GitignoreFile, IgnoreRules, file_role
+
+
+def relative_files(checker):
+    return sorted(os.path.relpath(file_path, checker.base_dir).replace(os.sep, "/")
+                  for file_path, _ in checker.collect_source_files())
+
+
+def test_gitignore_patterns():
+    gitignore = GitignoreFile(".gitignore", ["# generated", "*.gen.ts", "!keep.gen.ts", "out/", "/features/x"])
+    assert gitignore.match("shared/a.gen.ts", "a.gen.ts", False) is True
+    assert gitignore.match("shared/keep.gen.ts", "keep.gen.ts", False) is False
+    assert gitignore.match("shared/out", "out", True) is True
+    assert gitignore.match("shared/out", "out", False) is None
+    assert gitignore.match("features/x", "x", True) is True
+    assert gitignore.match("pages/features/x", "x", True) is None
+
+
+def test_excludes_match_names_or_relative_paths(tmp_path):
+    rules = IgnoreRules(str(tmp_path), ["dist", "features/legacy"], gitignore=False)
+    base = str(tmp_path)
+    assert rules.reason(os.path.join(base, "shared", "dist"), "dist", True, ()) == "exclude"
+    assert rules.reason(os.path.join(base, "features", "legacy"), "legacy", True, ()) == "exclude"
+    assert rules.reason(os.path.join(base, "pages", "legacy"), "legacy", True, ()) is None
+    assert rules.excludes_path(os.path.join(base, "features", "legacy", "a.ts"))
+    assert not rules.excludes_path(os.path.join(base, "features", "auth", "a.ts"))
+
+
+def test_file_roles():
+    assert file_role("features/a/a.test.ts") == TEST_ROLE
+    assert file_role("features/a/__mocks__/api.ts") == TEST_ROLE
+    assert file_role("shared/ui/Button.stories.tsx") == STORY_ROLE
+    assert file_role("features/a/a.ts") is None
+
+
+def test_walk_prunes_excluded_and_gitignored_subtrees(make_tree):
+    base_dir = make_tree({
+        ".gitignore": "generated/\n",
+        "features/a/a.ts": "",
+        "features/a/node_modules/pkg/index.ts": "",
+        "features/a/generated/api.ts": "",
+        "shared/ui/.gitignore": "*.tmp.ts\n",
+        "shared/ui/Button.ts": "",
+        "shared/ui/Button.tmp.ts": "",
+        "shared/ui/Button.test.ts": "",
+    })
+    checker = FSDChecker(base_dir, jobs=1)
+    assert relative_files(checker) == ["features/a/a.ts", "shared/ui/Button.test.ts", "shared/ui/Button.ts"]
+    # Pruned directories are recorded, not listed
+    pruned = {os.path.relpath(path, base_dir).replace(os.sep, "/"): reason for path, reason in checker.snapshot.pruned}
+    assert pruned == {"features/a/node_modules": "exclude",
+                      "features/a/generated": os.path.join(base_dir, ".gitignore")}
+
+    assert relative_files(FSDChecker(base_dir, jobs=1, test_files="exclude")) == ["features/a/a.ts",
+                                                                                  "shared/ui/Button.ts"]
+    assert relative_files(FSDChecker(base_dir, jobs=1, test_files="only")) == ["shared/ui/Button.test.ts"]
+    assert "features/a/generated/api.ts" in relative_files(FSDChecker(base_dir, jobs=1, gitignore=False))
@@ -0,0 +1,48 @@
+from fsd_checker.core import FSDChecker
+from fsd_checker.extractor import extract_imports
+
+
+def test_kinds_of_import_statements():
+    source = (
+        "import type { A } from './a';\n"
+        "import { type B, type C } from './bc';\n"
+        "import { type D, e } from './de';\n"
+        "import type * as F from './f';\n"
+        "export type { G } from './g';\n"
+        "export { h } from './h';\n"
+        "import { type } from './named-type';\n"
+        "import './polyfill';\n"
+        "const lazy = import('./Lazy');\n"
+        "const legacy = require('./legacy');\n"
+    )
+    assert extract_imports(source) == [
+        ("./a", "type"),
+        ("./bc", "type"),
+        ("./de", "runtime"),
+        ("./f", "type"),
+        ("./g", "type"),
+        ("./h", "runtime"),
+        ("./named-type", "runtime"),
+        ("./polyfill", "side-effect"),
+        ("./Lazy", "dynamic"),
+        ("./legacy", "runtime"),
+    ]
+
+
+def test_runtime_only_leaves_type_imports_out_of_rules_and_cycles(make_tree):
+    base_dir = make_tree({
+        "features/a/a.ts": "import type { B } from '../b/b';\nimport type { P } from '../../pages/home/P';\n",
+        "features/b/b.ts": "import { a } from '../a/a';\nimport { Q } from '../../pages/home/Q';\n",
+        "pages/home/P.ts": "export type P = {};\n",
+        "pages/home/Q.ts": "export const Q = 1;\n",
+    })
+    full = FSDChecker(base_dir, jobs=1)
+    report = full.run_checks()
+    assert report["imports"]["total"] == 2
+    assert len(report["cycles"]["file"]) == 1
+    assert full.edge_counts() == {"runtime": 2, "type": 2, "side-effect": 0, "dynamic": 0}
+
+    report = FSDChecker(base_dir, jobs=1, runtime_only=True).run_checks()
+    assert [violation["import"] for violation in report["imports"]["violations"]] == ["../../pages/home/Q"]
+    assert report["cycles"]["file"] == []
+    assert report["rules"]["runtime_only"] is True
@@ -0,0 +1,46 @@
+import os
+
+from fsd_checker.core import FSDChecker
+
+TREE = {
+    "app/main.tsx": "import { Home } from '../pages/home/Home';\n"
+                    "import { Settings } from '../pages/settings/Settings.async';\n",
+    "pages/home/Home.tsx": "import { Header } from '../../widgets/header/Header';\n"
+                           "import type { ModalProps } from '../../features/modal/Modal';\n"
+                           "const Modal = import('../../features/modal/Modal');\n",
+    "pages/settings/Settings.async.tsx": "export const Settings = lazy(() => import('./Settings'));\n",
+    "pages/settings/Settings.tsx": "export const Settings = 1;\n",
+    "widgets/header/Header.tsx": "import { Modal } from '../../features/modal/Modal';\n",
+    "features/modal/Modal.tsx": "export const Modal = 1;\n",
+}
+
+
+def relative(base_dir, file_path):
+    return os.path.relpath(file_path, base_dir).replace(os.sep, "/")
+
+
+def test_static_import_of_a_lazy_module_is_reported_with_its_chain(make_tree):
+    base_dir = make_tree(TREE)
+    lazy = FSDChecker(base_dir, jobs=1).run_checks()["lazy"]
+
+    assert relative(base_dir, lazy["entry"]) == "app/main.tsx"
+    assert lazy["lazy_modules"] == 2
+    [defeated] = lazy["defeated"]
+    assert relative(base_dir, defeated["module"]) == "features/modal/Modal.tsx"
+    assert [relative(base_dir, path) for path in defeated["lazy_importers"]] == ["pages/home/Home.tsx"]
+    [importer] = defeated["static_importers"]
+    assert [relative(base_dir, path) for path in importer["chain"]] == [
+        "app/main.tsx", "pages/home/Home.tsx", "widgets/header/Header.tsx", "features/modal/Modal.tsx",
+    ]
+
+
+def test_type_only_imports_keep_the_split(make_tree):
+    base_dir = make_tree(dict(TREE, **{"widgets/header/Header.tsx": "export const Header = 1;\n"}))
+    lazy = FSDChecker(base_dir, jobs=1).run_checks()["lazy"]
+    assert lazy["defeated"] == []
+    assert lazy["eager_modules"] == 4
+
+
+def test_missing_entry_skips_the_check(make_tree):
+    base_dir = make_tree({"features/modal/Modal.tsx": ""})
+    assert FSDChecker(base_dir, jobs=1).run_checks()["lazy"] is None
@@ -0,0 +1,47 @@
+import json
+import os
+
+from fsd_checker.core import FSDChecker
+from fsd_checker.profiling import Profiler
+from fsd_checker.violations import json_default
+
+
+def layered_tree(count):
+    """Feature slices that import a page, the next slice and a shared module"""
+    files = {"pages/home/index.ts": "export {};\n", "shared/ui/index.ts": "export {};\n"}
+    for i in range(count):
+        files[f"features/f{i}/index.ts"] = (
+            "import { home } from '../../pages/home';\n"
+            f"import type {{ Next }} from '../f{(i + 1) % count}';\n"
+            "import { ui } from '../../shared/ui';\n"
+        )
+    return files
+
+
+def run(base_dir, jobs):
+    checker = FSDChecker(base_dir, jobs=jobs)
+    # Several batches even for a small tree
+    checker.PARALLEL_BATCH_SIZE = 4
+    return json.loads(json.dumps(checker.run_checks(), default=json_default))
+
+
+def test_parallel_run_reports_like_a_serial_one(make_tree):
+    base_dir = make_tree(layered_tree(30))
+    serial = run(base_dir, 1)
+    assert serial["imports"]["total"] == 30
+    assert serial["imports"]["edges"]["type"] == 30
+    assert run(base_dir, 2) == serial
+
+
+def test_workers_read_the_files_and_report_their_timings(make_tree):
+    base_dir = make_tree(layered_tree(30))
+    profiler = Profiler()
+    checker = FSDChecker(base_dir, jobs=2, profiler=profiler)
+    checker.PARALLEL_BATCH_SIZE = 4
+    checker.run_checks()
+
+    read_pids = {event["pid"] for event in profiler.events if event["name"] == "read"}
+    assert read_pids and os.getpid() not in read_pids
+    # Read and extract come from the workers, resolve from the parent
+    assert len(profiler.file_times) == 32
+    assert all({"read", "extract", "resolve"} <= set(times) for times in profiler.file_times.values())
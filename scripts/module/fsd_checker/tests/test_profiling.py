@@ -0,0 +1,38 @@
+import json
+import os
+
+from fsd_checker.profiling import FILE_PHASES, Profiler
+from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
+
+
+def test_worker_records_merge_into_the_totals():
+    profiler, worker = Profiler(), Profiler()
+    worker.record_file("a.ts", 0.0, (0.002, 0.001))
+    profiler.record_file_phase("a.ts", "resolve", 0.003, 0.004)
+    profiler.merge(worker.drain())
+
+    assert worker.drain()["events"] == []
+    assert profiler.file_times["a.ts"] == {"read": 0.002, "extract": 0.001, "resolve": 0.004}
+    assert profiler.phase_totals["read"] == [1, 0.002]
+    assert profiler.slowest_files(1) == [("a.ts", 0.007)]
+
+
+def test_check_profile_writes_a_chrome_trace(make_tree, tmp_path, capsys):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { b } from '../b/b';\n",
+        "features/b/b.ts": "export const b = 1;\n",
+        "features/b/node_modules/pkg/index.ts": "",
+    })
+    trace = tmp_path / "trace.json"
+    check_main(["--base-dir", base_dir, "--quiet", "--no-cache", "--jobs", "2", "--profile",
+                "--profile-trace", str(trace),
+                "--json-output", str(tmp_path / "report.json"), "--md-output", str(tmp_path / "report.md")])
+    output = capsys.readouterr().out
+
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert {"structure", "rules", "report_json"} <= {event["name"] for event in events if event["cat"] == "phase"}
+    file_events = {(event["name"], os.path.basename(event["args"]["file"]))
+                   for event in events if event["cat"] == "file"}
+    assert file_events == {(phase, name) for phase in FILE_PHASES for name in ("a.ts", "b.ts")}
+    assert "Slowest 2 files" in output
+    assert "Pruned 1 directories" in output
@@ -0,0 +1,67 @@
+import pytest
+
+from fsd_checker.extractor import extract_imports, find_header_end
+from fsd_checker.reader import CHUNK_SIZE, SkippedFile, read_source
+
+HEADER = (
+    "'use client';\n"
+    "// imports\n"
+    "import { a } from './a';\n"
+    "import type {\n"
+    "  B,\n"
+    "} from './b';\n"
+    "export { c } from './c';\n"
+)
+# A long body so header mode stops reading before the end of the file
+BODY = "export const x = 1;\n" + "const y = 2;\n" * (CHUNK_SIZE // 4) + "const lazy = import('./Lazy');\n"
+
+
+def write(tmp_path, content):
+    path = tmp_path / "module.ts"
+    path.write_text(content)
+    return str(path)
+
+
+def test_header_ends_after_the_last_import():
+    assert find_header_end(HEADER + BODY) == len(HEADER)
+
+
+def test_header_mode_finds_the_imports_of_a_full_read(tmp_path):
+    path = write(tmp_path, HEADER + BODY)
+    _, full_text, _ = read_source(path)
+    _, header_text, extra = read_source(path, header_only=True)
+
+    assert header_text.strip() == HEADER.strip()
+    assert extract_imports(header_text) + extra == extract_imports(full_text)
+    assert extra == [("./Lazy", "dynamic")]
+
+    _, _, extra = read_source(path, header_only=True, dynamic_imports=False)
+    assert extra == []
+
+
+def test_header_mode_skips_calls_in_comments_and_strings(tmp_path):
+    body = (BODY
+            + "// const old = import('./Removed');\n"
+            + "/* require('./InComment') */\n"
+            + "const text = \"require('./InString')\";\n"
+            + "const Real = require('./Real');\n")
+    path = write(tmp_path, HEADER + body)
+    _, full_text, _ = read_source(path)
+    _, header_text, extra = read_source(path, header_only=True)
+
+    assert extra == [("./Lazy", "dynamic"), ("./Real", "runtime")]
+    assert extract_imports(header_text) + extra == extract_imports(full_text)
+
+
+def test_oversized_and_minified_files_are_skipped(tmp_path):
+    path = write(tmp_path, HEADER + BODY)
+    with pytest.raises(SkippedFile) as skipped:
+        read_source(path, max_file_size=100)
+    assert skipped.value.kind == "oversized"
+
+    path = write(tmp_path, "var a=1;" * 1000)
+    for header_only in (False, True):
+        with pytest.raises(SkippedFile) as skipped:
+            read_source(path, header_only=header_only, minified_line_length=500)
+        assert skipped.value.kind == "minified"
+    assert read_source(path, minified_line_length=None)[1] == "var a=1;" * 1000
@@ -0,0 +1,80 @@
+import io
+import json
+
+import pytest
+
+from fsd_checker.core import FSDChecker
+from fsd_checker.reporters import JsonlReportWriter, export_report_to_json, is_report_stream, read_report_stream
+from fsd_checker.reporters.json_reporter import dump_report
+from fsd_checker.violations import ImportViolationTable
+
+
+def sample_report():
+    table = ImportViolationTable()
+    table.append("features/a/a.ts", "../../pages/p", "features", "pages")
+    table.append("features/b/b.ts", "../../pages/q", "features", "pages", "custom rule")
+    # Strings that look like placeholders or JSON must not disturb the table
+    return {"structure": {"directory_violations": [], "layers": {"__fsd_violations__": ["\"__fsd_violations__\""]}},
+            "imports": {"violations": table, "total": 2}, "cycles": {}}
+
+
+def plain(report):
+    return dict(report, imports=dict(report["imports"], violations=report["imports"]["violations"].to_dicts()))
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_streamed_table_matches_plain_json(compact):
+    report = sample_report()
+    out = io.StringIO()
+    dump_report(report, out, compact=compact)
+    if compact:
+        assert out.getvalue() == json.dumps(plain(report), separators=(',', ':'))
+    else:
+        assert out.getvalue() == json.dumps(plain(report), indent=2)
+
+
+@pytest.mark.parametrize("name", ["report.jsonl", "report.jsonl.gz"])
+def test_stream_round_trip(tmp_path, name):
+    report = sample_report()
+    path = str(tmp_path / name)
+    with JsonlReportWriter(path) as writer:
+        for violation in report["imports"]["violations"]:
+            writer.write_violation(dict(violation))
+        writer.finish(report)
+
+    assert is_report_stream(path)
+    records = list(read_report_stream(path))
+    assert [record["type"] for record in records] == ["violation", "violation", "report"]
+    assert [record["data"] for record in records[:2]] == plain(report)["imports"]["violations"]
+    assert records[2]["data"]["imports"] == {"total": 2}
+
+
+def test_json_report_is_not_a_stream(tmp_path):
+    path = str(tmp_path / "report.json.gz")
+    export_report_to_json(sample_report(), path, compact=True)
+    assert not is_report_stream(path)
+    with pytest.raises(ValueError):
+        list(read_report_stream(path))
+
+
+def test_sink_without_graph_checks_keeps_no_import_table(make_tree):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { Q } from '../../pages/home/Q';\nimport type { P } from '../../pages/home/P';\n",
+        "features/a/a.scss": "@use '../../styles/theme';\n",
+        "pages/home/P.ts": "export type P = {};\n",
+        "pages/home/Q.ts": "import './Q.css';\nexport const Q = 1;\n",
+        "pages/home/Q.css": "",
+        "styles/_theme.scss": "",
+    })
+    kept = FSDChecker(base_dir, jobs=1)
+    expected = json.loads(json.dumps(plain(kept.run_checks())))
+
+    streamed_violations = []
+    checker = FSDChecker(base_dir, jobs=1, violation_sink=streamed_violations.append, graph_checks=False)
+    report = checker.run_checks()
+
+    assert checker.file_imports == []
+    assert streamed_violations == expected["imports"]["violations"]
+    assert report["imports"]["total"] == expected["imports"]["total"] == 2
+    assert report["imports"]["edges"] == expected["imports"]["edges"]
+    assert report["lazy"] is None
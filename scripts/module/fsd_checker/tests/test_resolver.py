@@ -0,0 +1,94 @@
+import os
+
+from fsd_checker.resolver import ModuleResolver
+from fsd_checker.tests.conftest import write_files
+
+TSCONFIG = """{
+  // comments and trailing commas, as tsc allows
+  "compilerOptions": {
+    "baseUrl": ".",
+    "paths": {
+      "@/*": ["src/*"],
+      "@ui/*": ["src/shared/ui/*"],
+      "@api": ["src/shared/api/index.ts"],
+    },
+  },
+}
+"""
+
+
+def make_project(tmp_path, files):
+    write_files(str(tmp_path), {"tsconfig.json": TSCONFIG, **files})
+    return str(tmp_path / "src")
+
+
+def test_tsconfig_paths_and_relative_specifiers(tmp_path):
+    base_dir = make_project(tmp_path, {
+        "src/shared/ui/Button.tsx": "",
+        "src/shared/ui/index.ts": "",
+        "src/shared/api/index.ts": "",
+        "src/features/a/a.ts": "",
+    })
+    resolver = ModuleResolver(base_dir)
+    importer_dir = os.path.join(base_dir, "features", "a")
+
+    assert resolver.resolve("@ui/Button", importer_dir) == os.path.join(base_dir, "shared", "ui", "Button.tsx")
+    assert resolver.resolve("@/shared/ui", importer_dir) == os.path.join(base_dir, "shared", "ui", "index.ts")
+    assert resolver.resolve("@api", importer_dir) == os.path.join(base_dir, "shared", "api", "index.ts")
+    assert resolver.resolve("./a", importer_dir) == os.path.join(importer_dir, "a.ts")
+    assert resolver.resolve("../../shared/ui/Button", importer_dir) == os.path.join(base_dir, "shared", "ui",
+                                                                                   "Button.tsx")
+    assert resolver.resolve("react", importer_dir) is None
+    assert resolver.resolve("./missing", importer_dir) is None
+
+
+def test_vite_extensions_set_the_probe_order(tmp_path):
+    base_dir = make_project(tmp_path, {
+        "config/resolveConfig.ts": "export default { extensions: ['.tsx', '.ts'] };\n",
+        "src/shared/ui/Button.ts": "",
+        "src/shared/ui/Button.tsx": "",
+    })
+    resolver = ModuleResolver(base_dir)
+    assert resolver.extensions == [".tsx", ".ts"]
+    assert resolver.resolve("@ui/Button", base_dir) == os.path.join(base_dir, "shared", "ui", "Button.tsx")
+
+
+def test_paths_keep_the_form_of_base_dir(tmp_path, monkeypatch):
+    make_project(tmp_path, {"src/shared/ui/Button.tsx": ""})
+    monkeypatch.chdir(tmp_path)
+    resolver = ModuleResolver("src")
+    assert resolver.resolve("@ui/Button", "src") == os.path.join("src", "shared", "ui", "Button.tsx")
+
+
+def test_fresh_resolver_sees_new_files(tmp_path):
+    base_dir = make_project(tmp_path, {"src/shared/ui/index.ts": ""})
+    resolver = ModuleResolver(base_dir)
+    assert resolver.resolve("@ui/Modal", base_dir) is None
+
+    write_files(base_dir, {"shared/ui/Modal.tsx": ""})
+    # The memoized result stays until the resolver is refreshed
+    assert resolver.resolve("@ui/Modal", base_dir) is None
+    assert resolver.fresh().resolve("@ui/Modal", base_dir) == os.path.join(base_dir, "shared", "ui", "Modal.tsx")
+    assert resolver.fresh().fingerprint() == resolver.fingerprint()
+
+
+def test_stylesheet_partials_and_index_files(tmp_path):
+    base_dir = make_project(tmp_path, {
+        "src/shared/styles/_vars.scss": "",
+        "src/shared/styles/mixins/_index.scss": "",
+        "src/shared/styles/theme.css": "",
+        "src/features/a/a.scss": "",
+    })
+    resolver = ModuleResolver(base_dir)
+    importer_dir = os.path.join(base_dir, "features", "a")
+    styles = os.path.join(base_dir, "shared", "styles")
+
+    assert resolver.resolve_stylesheet("../../shared/styles/vars", importer_dir) == os.path.join(styles, "_vars.scss")
+    assert resolver.resolve_stylesheet("../../shared/styles/mixins", importer_dir) == os.path.join(styles, "mixins",
+                                                                                                 "_index.scss")
+    assert resolver.resolve_stylesheet("../../shared/styles/theme.css", importer_dir) == os.path.join(styles,
+                                                                                                    "theme.css")
+    # Bare targets are relative to the stylesheet first, then go through tsconfig paths
+    assert resolver.resolve_stylesheet("a", importer_dir) == os.path.join(importer_dir, "a.scss")
+    assert resolver.resolve_stylesheet("~@/shared/styles/vars", importer_dir) == os.path.join(styles, "_vars.scss")
+    assert resolver.resolve_stylesheet("./missing", importer_dir) is None
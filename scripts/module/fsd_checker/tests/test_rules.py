@@ -0,0 +1,79 @@
+import json
+import os
+
+import pytest
+
+from fsd_checker.rules import RuleEngine, load_boundaries, load_slice_rules
+
+BASE = os.path.join(os.sep, "project", "src")
+LAYERS = ["app", "pages", "features", "shared"]
+ALLOWED = {"app": ["pages", "features", "shared"], "pages": ["features", "shared"], "features": ["shared"],
+           "shared": ["shared"]}
+
+
+def path(relative):
+    return os.path.join(BASE, *relative.split("/"))
+
+
+def imports(*targets):
+    """Resolved imports of one file, given relative target paths"""
+    return [[f"@/{target}", target.split("/")[0], path(target), "runtime"] for target in targets]
+
+
+def test_layer_rules():
+    engine = RuleEngine(BASE, LAYERS, ALLOWED)
+    found = engine.evaluate(path("features/a/a.ts"), "features",
+                            imports("shared/ui/Button.tsx", "pages/home/Page.tsx", "features/b/index.ts"))
+    assert found == [("@/pages/home/Page.tsx", "pages", None), ("@/features/b/index.ts", "features", None)]
+
+
+def test_slice_rules():
+    slice_rules = [
+        {"from": "features/*", "disallow": ["shared/legacy"], "message": "No legacy code in features"},
+        {"from": "features/*", "allow": ["features/common"]},
+        {"from": "pages/*", "public_api": ["features/*"]},
+    ]
+    engine = RuleEngine(BASE, LAYERS, dict(ALLOWED, features=["features", "shared"]), slice_rules)
+
+    found = engine.evaluate(path("features/a/a.ts"), "features",
+                            imports("shared/legacy/old.ts", "shared/ui/Button.tsx", "features/a/model.ts",
+                                    "features/common/index.ts"))
+    assert found == [("@/shared/legacy/old.ts", "shared", "No legacy code in features")]
+
+    found = engine.evaluate(path("pages/home/Page.tsx"), "pages",
+                            imports("features/auth/index.ts", "features/auth/model/store.ts"))
+    assert found == [("@/features/auth/model/store.ts", "features",
+                      "'pages/home' must use the public API of 'features/auth'")]
+
+    # Files no rule applies to only get the layer rules
+    assert engine.evaluate(path("shared/ui/Button.tsx"), "shared", imports("shared/legacy/old.ts")) == []
+
+
+def test_many_rules_compile_into_one_trie():
+    slice_rules = [{"from": f"features/f{i}", "disallow": [f"shared/s{i}"]} for i in range(500)]
+    engine = RuleEngine(BASE, LAYERS, ALLOWED, slice_rules)
+    assert engine.evaluate(path("features/f499/x.ts"), "features", imports("shared/s499/y.ts", "shared/s1/y.ts")) \
+        == [("@/shared/s499/y.ts", "shared", "'features/f499' cannot import from 'shared/s499'")]
+
+
+def test_boundaries_file(tmp_path):
+    boundaries = tmp_path / "fsd_boundaries.json"
+    boundaries.write_text(json.dumps({
+        "allowed_access": {"app": ["features", "shared"], "features": ["shared"]},
+        "rules": [{"from": "features", "allow": "features"}, {"from": "app", "disallow": ["features"]}],
+        "slice_rules": [{"from": "features/*", "disallow": ["features/*"]}],
+    }))
+    loaded = load_boundaries(str(boundaries))
+    assert loaded["layers"] == ["app", "features", "shared"]
+    assert loaded["allowed_access"] == {"app": ["shared"], "features": ["shared", "features"]}
+    assert loaded["slice_rules"] == [{"from": "features/*", "disallow": ["features/*"]}]
+
+
+def test_invalid_rule_files_are_refused(tmp_path):
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps([{"from": "features/*"}]))
+    with pytest.raises(ValueError):
+        load_slice_rules(str(rules))
+    rules.write_text(json.dumps({"rules": []}))
+    with pytest.raises(ValueError):
+        load_boundaries(str(rules))
@@ -0,0 +1,93 @@
+import json
+import random
+
+import pytest
+
+from fsd_checker.core import FSDChecker
+from fsd_checker.merge import merge_reports
+from fsd_checker.scripts.merge import main as merge_main
+from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
+from fsd_checker.shard import assign_shards, hash_shard, parse_shard
+from fsd_checker.violations import json_default
+
+TREE = {
+    "app/main.tsx": "import { Home } from '../pages/home';\nconst B = import('../features/b/b');\n",
+    "pages/home/index.ts": "import { a } from '../../features/a/a';\n",
+    "features/stray.ts": "export {};\n",
+    "features/a/a.ts": "import { b } from '../b/b';\nimport { Home } from '../../pages/home';\nimport './a.scss';\n",
+    "features/a/a.scss": "@use '../../shared/styles/vars';\n.a { background: url(./bg.png); }\n",
+    "features/a/bg.png": "png",
+    "features/b/b.ts": "import { a } from '../a/a';\n",
+    "shared/styles/_vars.scss": "$gap: 4px;\n",
+    "shared/ui/x.ts": "import { y } from './y';\n",
+    "shared/ui/y.ts": "export const y = 1;\n",
+    # Enough slices for every shard to own some violations
+    **{f"entities/e{i}/index.ts": "import { a } from '../../features/a/a';\n" + "// padding\n" * i
+       for i in range(12)},
+}
+
+
+def as_json(report):
+    return json.loads(json.dumps(report, default=json_default))
+
+
+@pytest.mark.parametrize("balance", ["hash", "size"])
+def test_merged_shards_equal_an_unsharded_check(make_tree, balance):
+    base_dir = make_tree(TREE)
+    expected = as_json(FSDChecker(base_dir, jobs=1).run_checks())
+    assert expected["imports"]["total"] > 12 and expected["cycles"]["file"] and expected["lazy"]["defeated"]
+
+    shards = [as_json(FSDChecker(base_dir, jobs=1, shard=(index, 3), shard_balance=balance).run_checks())
+              for index in (1, 2, 3)]
+    assert sum(shard["imports"]["total"] for shard in shards) == expected["imports"]["total"]
+    assert all(shard["imports"]["total"] for shard in shards)
+    # In any order, with a shard listed twice
+    shards.append(shards[0])
+    random.Random(1).shuffle(shards)
+    assert merge_reports(shards) == expected
+
+
+def test_merge_rejects_incomplete_or_mixed_shards(make_tree):
+    base_dir = make_tree(TREE)
+    first, second = (as_json(FSDChecker(base_dir, jobs=1, shard=(index, 2)).run_checks()) for index in (1, 2))
+    with pytest.raises(ValueError, match="Missing shard"):
+        merge_reports([first])
+    with pytest.raises(ValueError, match="disagree on balance"):
+        merge_reports([first, as_json(FSDChecker(base_dir, jobs=1, shard=(2, 2), shard_balance="size").run_checks())])
+    with pytest.raises(ValueError, match="Only reports of check --shard"):
+        merge_reports([first, as_json(FSDChecker(base_dir, jobs=1).run_checks())])
+    assert merge_reports([second, first])["imports"]["total"] == first["imports"]["total"] + second["imports"]["total"]
+
+
+def test_sharded_cli_run_merges_to_the_same_exit_code_and_report(make_tree, tmp_path):
+    base_dir = make_tree(TREE)
+    options = ["--base-dir", base_dir, "--no-cache", "--quiet", "--md-output", str(tmp_path / "report.md")]
+    exit_code = check_main([*options, "--json-output", str(tmp_path / "full.json")])
+
+    outputs = [str(tmp_path / f"shard-{index}.json") for index in (1, 2)]
+    for index, output in enumerate(outputs, 1):
+        assert check_main([*options, "--shard", f"{index}/2", "--json-output", output]) == exit_code
+    merged = str(tmp_path / "merged.json")
+    assert merge_main([*outputs, "--quiet", "--json-output", merged, "--md-output", str(tmp_path / "merged.md")]) == 1
+    with open(merged) as f, open(str(tmp_path / "full.json")) as g:
+        assert json.load(f) == json.load(g)
+
+    assert check_main([*options, "--shard", "3/2"]) == 2
+    assert check_main([*options, "--shard", "1/2", "--staged"]) == 2
+
+
+def test_shard_assignment():
+    assert parse_shard("2/4") == (2, 4)
+    for value in ("0/3", "4/3", "1", "a/b"):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+    files = [f"/src/f{i}.ts" for i in range(50)]
+    assignment = assign_shards(files, "/src", 4)
+    assert set(assignment.values()) == {1, 2, 3, 4}
+    # The hash depends on the path relative to base_dir only
+    assert hash_shard("/src/f1.ts", "/src", 4) == hash_shard("/other/f1.ts", "/other", 4) == assignment["/src/f1.ts"]
+
+    sizes = {"/src/a": 100, "/src/b": 60, "/src/c": 50, "/src/d": 10}
+    assert assign_shards(list(sizes), "/src", 2, "size", sizes.get) == {"/src/a": 1, "/src/b": 2, "/src/c": 2,
+                                                                         "/src/d": 1}
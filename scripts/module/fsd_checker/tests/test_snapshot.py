@@ -0,0 +1,57 @@
+import os
+
+from fsd_checker import snapshot as snapshot_module
+from fsd_checker.snapshot import SOURCE_EXTENSIONS, TreeSnapshot
+
+LAYERS = ["pages", "features", "shared"]
+TREE = {
+    "features/a/a.ts": "",
+    "features/a/model/store.ts": "",
+    "features/a/ui/A.tsx": "",
+    "features/a/ui/a.module.scss": "",
+    "features/a/ui/icon.svg": "<svg/>",
+    "features/b/b.ts": "",
+    "features/index.ts": "",
+    "shared/ui/Button.tsx": "",
+}
+
+
+def test_layers_slices_and_stats(make_tree):
+    base_dir = make_tree(TREE)
+    snapshot = TreeSnapshot.scan(base_dir, LAYERS)
+
+    assert snapshot.missing_layers == ["pages"]
+    assert sorted(snapshot.slices["features"]) == ["a", "b"]
+    assert snapshot.root_files["features"] == [os.path.join(base_dir, "features", "index.ts")]
+    icon = os.path.join(base_dir, "features", "a", "ui", "icon.svg")
+    assert snapshot.stats[icon].st_size == len("<svg/>")
+    assert icon not in dict(snapshot.source_files)
+
+
+def test_source_files_follow_os_walk_order(make_tree):
+    base_dir = make_tree(TREE)
+    snapshot = TreeSnapshot.scan(base_dir, LAYERS)
+
+    walked = []
+    for layer in LAYERS:
+        for root, _, files in os.walk(os.path.join(base_dir, layer)):
+            walked += [(os.path.join(root, name), layer) for name in files if name.endswith(SOURCE_EXTENSIONS)]
+    assert snapshot.source_files == walked
+
+
+def test_every_directory_is_listed_once(make_tree, monkeypatch):
+    base_dir = make_tree(TREE)
+    listed = []
+    list_directory = snapshot_module._list_directory
+
+    def counting(directory):
+        listed.append(directory)
+        return list_directory(directory)
+
+    monkeypatch.setattr(snapshot_module, "_list_directory", counting)
+    snapshot = TreeSnapshot.scan(base_dir, LAYERS)
+
+    assert sorted(listed) == sorted(set(listed))
+    # The missing layer is tried once too
+    assert sorted(snapshot.directories + [os.path.join(base_dir, "pages")]) == sorted(listed)
+    assert len(snapshot.directories) == 7
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from fsd_checker import store as store_module
+from fsd_checker.store import ReportStore, save_report, slice_of
+from fsd_checker.scripts.query import main as query_main
+from fsd_checker.violations import ImportViolationTable
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    table = ImportViolationTable()
+    for i in range(25):
+        table.append(f"src/features/auth/f{i}.ts", "../../pages/p", "features", "pages")
+    table.append("src/features/cart/c.ts", "../../widgets/w", "features", "widgets")
+    table.append("src/entities/user/u.ts", "../../features/f", "entities", "features", "custom rule")
+    report = {"structure": {"layers": {"features": ["auth", "cart"]}, "directory_violations": []},
+              "imports": {"violations": table, "total": len(table)}}
+    path = str(tmp_path / "report.db")
+    save_report(report, path)
+    return path
+
+
+def test_slice_of():
+    assert slice_of("src/features/auth/ui/Form.tsx", "features") == "features/auth"
+    assert slice_of("src/features/index.ts", "features") is None
+    # A known slice wins over a directory that only shares the layer's name
+    assert slice_of("src/features/auth/features/x.ts", "features", ["auth"]) == "features/auth"
+
+
+def test_filters_and_groups(db_file):
+    with ReportStore(db_file) as store:
+        assert store.count() == 27
+        assert store.count(from_layers=["features"], to_layers=["pages"]) == 25
+        assert store.count(slices=["features/cart"]) == 1
+        assert store.count(file_globs=["*/entities/*", "*/f1.ts"]) == 2
+        assert store.group_counts(["slice"], limit=2) == [{"slice": "features/auth", "count": 25},
+                                                          {"slice": "entities/user", "count": 1}]
+        [violation] = store.violations(from_layers=["entities"])
+        assert violation["message"] == "custom rule"
+        with pytest.raises(ValueError):
+            store.group_counts(["message"])
+
+
+def test_query_report_samples_each_layer_pair(db_file):
+    with ReportStore(db_file) as store:
+        report = store.query_report(from_layers=["features"])
+    assert report["imports"]["total"] == 26
+    assert report["imports"]["group_totals"] == {"features → pages": 25, "features → widgets": 1}
+    assert len(report["imports"]["violations"]) == 21
+
+
+def test_query_prints_json(db_file, capsys):
+    assert query_main([db_file, "--group-by", "to_layer", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["groups"][0] == {"to_layer": "pages", "count": 25}
+
+
+def test_other_files_are_refused(tmp_path):
+    path = tmp_path / "not-a-store.db"
+    path.write_text("plain text")
+    with pytest.raises(ValueError):
+        ReportStore(str(path))
+
+
+def test_query_report_without_window_functions(db_file, monkeypatch):
+    filters = [{}, {"from_layers": ["features"], "file_globs": ["*/f1*", "*/c.ts"]}]
+    with ReportStore(db_file) as store:
+        expected = [store.query_report(**options) for options in filters]
+        monkeypatch.setattr(store_module, "_WINDOW_FUNCTIONS", False)
+        assert [store.query_report(**options) for options in filters] == expected
+    assert len(expected[0]["imports"]["violations"]) == 22
@@ -0,0 +1,53 @@
+import os
+
+from fsd_checker.core import FSDChecker
+
+
+def test_stylesheets_follow_layer_rules_and_rank_partials(make_tree):
+    base_dir = make_tree({
+        "shared/styles/_vars.scss": "$gap: 4px;\n",
+        "shared/styles/_mixins.scss": "@use 'vars';\n",
+        "shared/ui/bad.scss": "@use '../../features/a/ui/a';\n",
+        "features/a/ui/a.scss": "@use '../../../shared/styles/mixins';\n",
+        "features/a/ui/A.tsx": "import './a.scss';\n",
+        "features/b/b.scss": "@use '../../shared/styles/vars';\n",
+        "features/b/B.tsx": "import './b.scss';\n",
+    })
+    report = FSDChecker(base_dir, jobs=1).run_checks()
+
+    def path(relative_path):
+        return os.path.join(base_dir, *relative_path.split("/"))
+
+    # The built-in rules apply as to scripts: shared imports nothing, not even from shared
+    violations = report["imports"]["violations"]
+    assert sorted((violation["file"], violation["import"]) for violation in violations) == [
+        (path("shared/styles/_mixins.scss"), "vars"),
+        (path("shared/ui/bad.scss"), "../../features/a/ui/a"),
+    ]
+
+    stylesheets = report["stylesheets"]
+    assert stylesheets["stylesheets"] == 5
+    assert stylesheets["imports"] == 4
+    assert [(partial["file"], partial["stylesheets"], partial["components"]) for partial in stylesheets["partials"]] == [
+        (path("shared/styles/_vars.scss"), 4, 2),
+        (path("shared/styles/_mixins.scss"), 2, 1),
+        (path("features/a/ui/a.scss"), 1, 1),
+    ]
+    assert stylesheets["partials"][0]["examples"] == [path("features/a/ui/A.tsx"), path("features/b/B.tsx")]
+
+
+def test_stylesheets_outside_the_layers_are_followed(make_tree, tmp_path):
+    base_dir = make_tree({
+        "features/a/a.scss": "@use '../../../styles/theme';\n",
+        "features/a/A.tsx": "import './a.scss';\n",
+    })
+    theme = os.path.join(str(tmp_path), "styles", "_theme.scss")
+    os.makedirs(os.path.dirname(theme))
+    with open(theme, "w") as f:
+        f.write("@use 'colors';\n")
+    with open(os.path.join(os.path.dirname(theme), "_colors.scss"), "w") as f:
+        f.write("$red: red;\n")
+
+    partials = FSDChecker(base_dir, jobs=1).run_checks()["stylesheets"]["partials"]
+    assert [(os.path.basename(partial["file"]), partial["components"]) for partial in partials] == [
+        ("_colors.scss", 1), ("_theme.scss", 1)]
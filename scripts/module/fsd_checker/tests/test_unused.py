@@ -0,0 +1,41 @@
+import json
+import os
+
+from fsd_checker.scripts.moderators.moderate_fsd import main as check_main
+from fsd_checker.scripts.unused import main as unused_main
+
+
+def test_unreached_files_are_listed(make_tree, capsys):
+    base_dir = make_tree({
+        "app/main.tsx": "import { Page } from '../pages/home/Page';\n",
+        "pages/home/Page.tsx": "import type { User } from '../../entities/user/model';\n"
+                               "const Modal = import('../../features/modal/Modal');\n",
+        "entities/user/model.ts": "export type User = {};\n",
+        "features/modal/Modal.tsx": "export const Modal = 1;\n",
+        "features/old/Old.tsx": "import { Modal } from '../modal/Modal';\n",
+        "features/old/Old.test.tsx": "import '../../shared/lib/testing';\n",
+        "shared/lib/testing.ts": "export {};\n",
+        "shared/lib/dead.ts": "export {};\n",
+    })
+    unused_main(["--base-dir", base_dir, "--no-cache", "--json"])
+    result = json.loads(capsys.readouterr().out)
+
+    assert [os.path.relpath(entry["file"], base_dir).replace(os.sep, "/") for entry in result["unused"]] == [
+        "features/old/Old.tsx",
+        "shared/lib/dead.ts",
+    ]
+    assert result["layers"] == {
+        "features": {"files": 1, "bytes": len("import { Modal } from '../modal/Modal';\n")},
+        "shared": {"files": 1, "bytes": len("export {};\n")},
+    }
+
+
+def test_unused_keeps_the_cache_of_check(make_tree, tmp_path):
+    base_dir = make_tree({"app/main.tsx": "export {};\n"})
+    cache_dir = str(tmp_path / "cache")
+    check_main(["--base-dir", base_dir, "--quiet", "--cache-dir", cache_dir,
+                "--json-output", str(tmp_path / "report.json"), "--md-output", str(tmp_path / "report.md")])
+    stamp = json.loads((tmp_path / "cache" / "imports.json").read_text())["stamp"]
+
+    unused_main(["--base-dir", base_dir, "--cache-dir", cache_dir, "--json"])
+    assert json.loads((tmp_path / "cache" / "imports.json").read_text())["stamp"] == stamp
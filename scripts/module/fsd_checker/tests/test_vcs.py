@@ -0,0 +1,65 @@
+import os
+import subprocess
+
+import pytest
+
+from fsd_checker.core import FSDChecker
+
+
+def git(base_dir, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=base_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+@pytest.fixture
+def repo(make_tree):
+    base_dir = make_tree({
+        "features/a/a.ts": "import { P } from '../../pages/home/P';\n",
+        "features/b/b.ts": "import { c } from '../c/c';\n",
+        "features/c/c.ts": "export const c = 1;\n",
+        "pages/home/P.ts": "export const P = 1;\n",
+    })
+    git(base_dir, "init", "-q")
+    git(base_dir, "add", ".")
+    git(base_dir, "commit", "-q", "-m", "initial")
+    return base_dir
+
+
+def violating_files(report, base_dir):
+    return sorted(os.path.relpath(violation["file"], base_dir).replace(os.sep, "/")
+                  for violation in report["imports"]["violations"])
+
+
+def test_git_listing_matches_the_walk(repo):
+    with open(os.path.join(repo, "features", "c", "new.ts"), "w") as f:
+        f.write("export {};\n")
+    walked = FSDChecker(repo, jobs=1).collect_source_files()
+    listed = FSDChecker(repo, jobs=1, files_from_git=True).collect_source_files()
+    assert sorted(listed) == sorted(walked)
+
+
+def test_changed_since_reports_changed_files_and_their_importers(repo):
+    with open(os.path.join(repo, "features", "c", "c.ts"), "w") as f:
+        f.write("import { P } from '../../pages/home/P';\nexport const c = 1;\n")
+    with open(os.path.join(repo, "features", "b", "b.ts"), "a") as f:
+        f.write("import { P } from '../../pages/home/P';\n")
+
+    report = FSDChecker(repo, jobs=1, changed_since="HEAD").run_checks()
+    # features/a is unchanged and does not import a changed file
+    assert violating_files(report, repo) == ["features/b/b.ts", "features/c/c.ts"]
+    assert violating_files(FSDChecker(repo, jobs=1).run_checks(), repo) == [
+        "features/a/a.ts", "features/b/b.ts", "features/c/c.ts",
+    ]
+
+
+def test_staged_checks_the_index_content(repo):
+    path = os.path.join(repo, "features", "c", "c.ts")
+    with open(path, "w") as f:
+        f.write("import { P } from '../../pages/home/P';\n")
+    git(repo, "add", path)
+    # The unstaged fix is not what would be committed
+    with open(path, "w") as f:
+        f.write("export const c = 1;\n")
+
+    report = FSDChecker(repo, jobs=1, staged=True).run_checks()
+    assert violating_files(report, repo) == ["features/c/c.ts"]
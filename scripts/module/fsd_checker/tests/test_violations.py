@@ -0,0 +1,29 @@
+import json
+
+from fsd_checker.violations import ImportViolationTable, json_default, make_violation
+
+
+def test_rows_read_back_like_dicts():
+    table = ImportViolationTable()
+    table.append("a.ts", "../pages/p", "features", "pages")
+    table.append("b.ts", "../api", "shared", "shared", "shared/ui may not import shared/api")
+
+    assert len(table) == 2
+    assert dict(table[0]) == make_violation("a.ts", "../pages/p", "features", "pages")
+    assert table[-1]["message"] == "shared/ui may not import shared/api"
+    assert [violation["file"] for violation in table[:1]] == ["a.ts"]
+    assert json.loads(json.dumps(table, default=json_default)) == table.to_dicts()
+
+
+def test_ids_past_the_short_limits():
+    # More distinct messages than an unsigned short holds, more layers than a byte
+    count = 70000
+    table = ImportViolationTable()
+    for i in range(count):
+        table.append(f"{i}.ts", "x", f"layer{i % 300}", "shared", f"rule {i}")
+
+    assert len(table) == count
+    last = table[count - 1]
+    assert last["message"] == f"rule {count - 1}"
+    assert last["from_layer"] == f"layer{(count - 1) % 300}"
+    assert table[299]["from_layer"] == "layer299"
@@ -0,0 +1,60 @@
+"""
+Dead-module analysis for the FSD Architecture Checker.
+
+A module is used when it can be reached from an entry point by following
+imports of any kind: static, dynamic and type-only imports all keep a
+module in the typecheck, lint and test runs. Entry points are the
+application entry, lazy modules (`.async` wrappers and dynamic import
+targets) and the files matching the entry globs, such as stories and
+tests. Every other checked file is reported as unused.
+
+The traversal is a worklist walk over the module graph built from the
+resolved import table, so on a warm import cache it costs one pass over
+the edges.
+"""
+
+import os
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+from .graph import ModuleGraph
+from .ignore import STORY_GLOBS, TEST_GLOBS, compile_globs
+from .lazy import lazy_modules
+
+# Files that are entry points of their own: lazy wrappers, stories, tests and their setup
+DEFAULT_ENTRY_GLOBS = ("*.async.*",) + STORY_GLOBS + TEST_GLOBS
+
+
+def find_unused(base_dir: str,
+                file_imports: List[Tuple[str, Optional[Tuple[List[List[Any]], Any]]]],
+                graph: ModuleGraph,
+                entries: Iterable[str],
+                entry_globs: Iterable[str] = DEFAULT_ENTRY_GLOBS) -> Tuple[List[str], List[str]]:
+    """
+    Find the checked files no entry point reaches.
+
+    Args:
+        base_dir: Base directory the entry globs are matched against
+        file_imports: Resolved imports of every file, as kept by FSDChecker.analyze_imports
+        graph: Module graph of the same imports, with every kind of edge
+        entries: Entry point files
+        entry_globs: Globs of files that are entry points too, relative to base_dir
+
+    Returns:
+        (entry_points, unused_files), both sorted
+    """
+    globs = compile_globs(entry_globs)
+    base = os.path.join(os.path.normpath(base_dir), '')
+
+    roots: Set[str] = {os.path.normpath(entry) for entry in entries}
+    roots.update(lazy_modules(file_imports))
+    if globs:
+        for file_path, _ in file_imports:
+            relative = file_path[len(base):] if file_path.startswith(base) else file_path
+            if globs.match(relative.replace(os.sep, "/")):
+                roots.add(file_path)
+
+    root_nodes = [node for node in (graph.id_of(root) for root in roots) if node is not None]
+    reachable = graph.closure(root_nodes)
+    # Checked files are graph nodes under their own path, no normalization needed
+    unused = sorted(file_path for file_path, _ in file_imports if graph.ids.get(file_path) not in reachable)
+    return sorted(graph.paths[node] for node in root_nodes), unused
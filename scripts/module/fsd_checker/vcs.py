@@ -0,0 +1,92 @@
+"""
+Git integration for the FSD Architecture Checker.
+
+Lists tracked, changed and staged files with the git CLI and reads blob
+contents from the index. All returned paths are joined onto the directory
+the command ran in, so they match the paths of a directory scan.
+"""
+
+import os
+import subprocess
+from typing import Dict, Iterable, List, Set
+
+
+class GitError(RuntimeError):
+    """Raised when a git command fails"""
+
+
+def run_git(args: List[str], directory: str, stdin: bytes = None) -> bytes:
+    """Run a git command in directory and return its stdout"""
+    try:
+        result = subprocess.run(["git", "-C", directory, *args], input=stdin,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+    except OSError as e:
+        raise GitError(f"Cannot run git: {e}") from e
+
+    if result.returncode != 0:
+        raise GitError(f"git {' '.join(args)} failed: {result.stderr.decode('utf-8', errors='replace').strip()}")
+    return result.stdout
+
+
+def _split_paths(output: bytes, directory: str) -> List[str]:
+    """Split NUL-separated git path output and join the paths onto directory"""
+    return [os.path.join(directory, path.decode('utf-8')) for path in output.split(b'\0') if path]
+
+
+def list_index_files(directory: str) -> Dict[str, str]:
+    """Map tracked files under directory to the blob SHAs recorded in the index"""
+    files = {}
+    for record in run_git(["ls-files", "-s", "-z"], directory).split(b'\0'):
+        if not record:
+            continue
+        # "<mode> <sha> <stage>\t<path>"
+        info, _, path = record.partition(b'\t')
+        files[os.path.join(directory, path.decode('utf-8'))] = info.split(b' ')[1].decode('ascii')
+    return files
+
+
+def list_untracked_files(directory: str) -> List[str]:
+    """List untracked, non-ignored files under directory"""
+    return _split_paths(run_git(["ls-files", "--others", "--exclude-standard", "-z"], directory), directory)
+
+
+def list_modified_files(directory: str) -> Set[str]:
+    """List tracked files whose working tree content differs from the index"""
+    return set(_split_paths(run_git(["diff", "--name-only", "--relative", "-z"], directory), directory))
+
+
+def list_changed_files(directory: str, ref: str) -> Set[str]:
+    """List files changed in the working tree since ref, including untracked files"""
+    changed = set(_split_paths(run_git(["diff", "--name-only", "--relative", "-z", ref, "--"], directory), directory))
+    changed.update(list_untracked_files(directory))
+    return changed
+
+
+def list_staged_files(directory: str) -> Set[str]:
+    """List files added, copied, modified or renamed in the index"""
+    return set(_split_paths(
+        run_git(["diff", "--cached", "--name-only", "--relative", "-z", "--diff-filter=ACMR"], directory),
+        directory,
+    ))
+
+
+def read_blobs(directory: str, shas: Iterable[str]) -> Dict[str, bytes]:
+    """Read blob contents for the given SHAs with a single `git cat-file --batch`"""
+    shas = list(dict.fromkeys(shas))
+    if not shas:
+        return {}
+
+    output = run_git(["cat-file", "--batch"], directory, ("\n".join(shas) + "\n").encode('ascii'))
+    blobs = {}
+    position = 0
+    for sha in shas:
+        # "<sha> <type> <size>\n<content>\n", or "<sha> missing\n"
+        header_end = output.index(b'\n', position)
+        header = output[position:header_end].split(b' ')
+        position = header_end + 1
+        if len(header) < 3:
+            continue
+        size = int(header[2])
+        blobs[sha] = output[position:position + size]
+        position += size + 1
+    return blobs
@@ -0,0 +1,140 @@
+"""
+Compact storage of import violations.
+
+Violations are stored column by column: file paths, import specifiers and
+layer names are interned once, and each violation is a row of small
+integers in typed arrays. Rows are read through ImportViolation, a
+read-only mapping with the same keys as the report dicts; the layer rule
+message is rendered only when it is read, slice rule messages are
+interned like the other strings.
+"""
+
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Optional
+
+VIOLATION_FIELDS = ("file", "import", "from_layer", "to_layer", "message")
+
+
+def violation_message(from_layer: str, to_layer: str) -> str:
+    """Message of a violation of the layer rules"""
+    return f"Layer '{from_layer}' cannot import from '{to_layer}'"
+
+
+def make_violation(file_path: str, import_path: str, from_layer: str, to_layer: str,
+                   message: Optional[str] = None) -> Dict[str, Any]:
+    """Build a violation as a plain dict (with the layer rule message unless one is given)"""
+    return {
+        "file": file_path,
+        "import": import_path,
+        "from_layer": from_layer,
+        "to_layer": to_layer,
+        "message": message or violation_message(from_layer, to_layer),
+    }
+
+
+class _StringTable:
+    """Interns strings to consecutive integer IDs"""
+
+    __slots__ = ("values", "ids")
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def id_of(self, value: str) -> int:
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+
+class ImportViolation(Mapping):
+    """Read-only dict-compatible view of one row of an ImportViolationTable"""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "ImportViolationTable", row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key: str) -> str:
+        table, row = self._table, self._row
+        if key == "file":
+            return table._files.values[table._file_ids[row]]
+        if key == "import":
+            return table._imports.values[table._import_ids[row]]
+        if key == "from_layer":
+            return table._layers.values[table._from_ids[row]]
+        if key == "to_layer":
+            return table._layers.values[table._to_ids[row]]
+        if key == "message":
+            return table._messages.values[table._message_ids[row]] or \
+                violation_message(self["from_layer"], self["to_layer"])
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(VIOLATION_FIELDS)
+
+    def __len__(self) -> int:
+        return len(VIOLATION_FIELDS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ImportViolationTable(Sequence):
+    """Columnar list of import violations"""
+
+    __slots__ = ("_files", "_imports", "_layers", "_messages",
+                 "_file_ids", "_import_ids", "_from_ids", "_to_ids", "_message_ids")
+
+    def __init__(self):
+        self._files = _StringTable()
+        self._imports = _StringTable()
+        self._layers = _StringTable()
+        # ID 0 stands for the layer rule message
+        self._messages = _StringTable()
+        self._messages.id_of("")
+        self._file_ids = array('I')
+        self._import_ids = array('I')
+        # 'I' like the other columns: boundaries files can define any number of
+        # layers, and every slice rule message is interned
+        self._from_ids = array('I')
+        self._to_ids = array('I')
+        self._message_ids = array('I')
+
+    def append(self, file_path: str, import_path: str, from_layer: str, to_layer: str,
+               message: Optional[str] = None) -> None:
+        """Add a violation (of the layer rules unless a message is given)"""
+        self._file_ids.append(self._files.id_of(file_path))
+        self._import_ids.append(self._imports.id_of(import_path))
+        self._from_ids.append(self._layers.id_of(from_layer))
+        self._to_ids.append(self._layers.id_of(to_layer))
+        self._message_ids.append(self._messages.id_of(message) if message else 0)
+
+    def __len__(self) -> int:
+        return len(self._file_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ImportViolation(self, row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("violation index out of range")
+        return ImportViolation(self, index)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize all violations as plain dicts"""
+        return [dict(violation) for violation in self]
+
+
+def json_default(value: Any) -> Any:
+    """`default` hook for json.dump that encodes violation tables and rows"""
+    if isinstance(value, ImportViolationTable):
+        return value.to_dicts()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")